@@ -1,11 +1,30 @@
-from fastapi import APIRouter, HTTPException
 from datetime import datetime
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Optional
 from models.stock import (
     BriefingRequest,
     BriefingResponse,
+    BriefingBatchRequest,
+    BriefingBatchResponse,
+    BriefingReportRequest,
+    BriefingJob,
     ErrorResponse
 )
 from services.briefing_service import BriefingService
+from services.briefing_card import render_card
+from services.word_report import WordReportService
+from services.stock_service import StockService
+from services.briefing_archive import briefing_archive
+from services.briefing_jobs import briefing_jobs, QueueFullError, COMPLETED
+from services.executor import (
+    run_blocking,
+    UpstreamTimeoutError,
+    ClientDisconnectedError
+)
+from services.upstream import UpstreamUnavailableError
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
 router = APIRouter(
     prefix="/api/briefing",
@@ -13,22 +32,41 @@ router = APIRouter(
 )
 
 
+def _etag(content_hash: str) -> str:
+    return f'"{content_hash}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 ETag가 포함되어 있는지 확인 (약한 비교, * 포함)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
 @router.post(
     "/generate",
     response_model=BriefingResponse,
     responses={
+        304: {"description": "If-None-Match의 ETag와 입력 데이터가 같음 (본문 없음)"},
         404: {"model": ErrorResponse, "description": "종목을 찾을 수 없음"},
         500: {"model": ErrorResponse, "description": "서버 에러"}
     },
     summary="브리핑 생성",
     description="주식 종목에 대한 브리핑 마크다운 콘텐츠를 생성합니다."
 )
-async def generate_briefing(request: BriefingRequest):
+async def generate_briefing(
+    request: BriefingRequest,
+    http_request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     브리핑 생성
 
     - **ticker**: 주식 티커 심볼 (예: TSLA, AAPL, NVDA)
     - **type**: 브리핑 타입 (most_actives, day_gainers, day_losers)
+    - **format**: 출력 형식 (markdown, html, text, 기본값: markdown)
 
     템플릿 기반으로 다음 정보를 포함한 브리핑을 생성합니다:
     - 기업 개요 (회사명, 섹터, 산업 등)
@@ -36,32 +74,326 @@ async def generate_briefing(request: BriefingRequest):
     - 주요 포인트 분석
     - 최근 5일 추세
     - 투자 유의사항
+
+    시세와 5일 종가가 이전 요청과 같으면 저장된 브리핑(최초 생성 시각 포함)을 그대로 반환합니다.
+    응답의 ETag(content_hash)를 If-None-Match로 보내면 변경이 없을 때 304를 반환합니다.
     """
     try:
-        # 브리핑 생성
-        content = BriefingService.generate_briefing(
+        # 브리핑 생성 (입력 데이터가 같으면 저장된 브리핑 재사용)
+        briefing = await run_blocking(
+            BriefingService.generate_briefing,
             ticker=request.ticker.upper(),
-            briefing_type=request.type
+            briefing_type=request.type,
+            output_format=request.format,
+            request=http_request
         )
 
-        if not content:
+        if not briefing:
             raise HTTPException(
                 status_code=404,
                 detail=f"종목 '{request.ticker}'의 브리핑을 생성할 수 없습니다. 종목 정보를 확인해주세요."
             )
 
-        # 응답 생성
-        return BriefingResponse(
-            ticker=request.ticker.upper(),
-            type=request.type,
-            generated_at=datetime.now().isoformat(),
-            content=content
-        )
+        etag = _etag(briefing.content_hash)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+        return briefing
 
-    except HTTPException:
+    except (HTTPException, UpstreamTimeoutError, UpstreamUnavailableError, ClientDisconnectedError):
         raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"브리핑 생성 중 에러가 발생했습니다: {str(e)}"
         )
+
+
+@router.get(
+    "/archive/{content_hash}",
+    response_model=BriefingResponse,
+    responses={
+        304: {"description": "If-None-Match의 ETag와 같음 (본문 없음)"},
+        404: {"model": ErrorResponse, "description": "저장된 브리핑이 없음"}
+    },
+    summary="저장된 브리핑 조회",
+    description="브리핑 생성 시 반환된 content_hash로 저장된 브리핑을 조회합니다."
+)
+async def get_archived_briefing(
+    response: Response,
+    content_hash: str = Path(..., pattern="^[0-9a-f]{32}$", description="입력 데이터 해시"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    저장된 브리핑 조회
+
+    - **content_hash**: 브리핑 생성 응답의 content_hash (ETag)
+
+    보관 기간이 지났거나 보관 개수를 넘어 삭제된 브리핑은 404를 반환합니다.
+    """
+    briefing = await run_blocking(briefing_archive.get, content_hash)
+    if briefing is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"저장된 브리핑 '{content_hash}'를 찾을 수 없습니다."
+        )
+
+    etag = _etag(content_hash)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return briefing
+
+
+@router.post(
+    "/batch",
+    response_model=BriefingBatchResponse,
+    responses={
+        503: {"model": ErrorResponse, "description": "종목 자동 선정 실패"},
+        500: {"model": ErrorResponse, "description": "서버 에러"}
+    },
+    summary="브리핑 일괄 생성",
+    description="여러 종목의 브리핑을 한 번에 생성합니다. (아침 발송용)"
+)
+async def generate_briefings(request: BriefingBatchRequest, http_request: Request):
+    """
+    브리핑 일괄 생성
+
+    - **tickers**: 브리핑할 종목 목록 (최대 20개, 생략 시 화제 종목 자동 선정)
+    - **type**: 브리핑 타입 (tickers 지정 시 사용)
+    - **top_n**: 자동 선정 종목 수 (기본값: 5)
+    - **format**: 출력 형식 (markdown, html, text)
+
+    모든 종목의 시세와 5일 과거 데이터를 한 번에 조회한 뒤 브리핑을 동시에 작성합니다.
+    종목별 성공 여부와 작성 시간, 전체 소요 시간이 함께 반환됩니다.
+    """
+    try:
+        if request.tickers:
+            items = [(ticker, request.type) for ticker in request.tickers]
+        else:
+            items = await run_blocking(
+                BriefingService.select_daily_tickers,
+                request.top_n,
+                request=http_request
+            )
+            if not items:
+                raise HTTPException(
+                    status_code=503,
+                    detail="브리핑 종목을 자동 선정할 수 없습니다. tickers를 지정해주세요."
+                )
+
+        # 일괄 생성은 종목 수만큼 오래 걸릴 수 있으므로 제한 시간을 늘림
+        return await run_blocking(
+            BriefingService.generate_briefings,
+            items,
+            output_format=request.format,
+            request=http_request,
+            timeout=60
+        )
+
+    except (HTTPException, UpstreamTimeoutError, UpstreamUnavailableError, ClientDisconnectedError):
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"브리핑 일괄 생성 중 에러가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post(
+    "/report",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {DOCX_MEDIA_TYPE: {}}, "description": "브리핑 보고서 Word 파일"},
+        404: {"model": ErrorResponse, "description": "보고서에 포함할 종목 정보가 없음"},
+        503: {"model": ErrorResponse, "description": "종목 자동 선정 실패"}
+    },
+    summary="Word 브리핑 보고서 생성",
+    description="여러 종목의 브리핑을 하나의 Word(docx) 보고서로 내려받습니다."
+)
+async def generate_briefing_report(request: BriefingReportRequest, http_request: Request):
+    """
+    Word 브리핑 보고서 생성
+
+    - **tickers**: 보고서에 포함할 종목 목록 (최대 20개, 생략 시 화제 종목 자동 선정)
+    - **type**: 브리핑 타입 (tickers 지정 시 사용)
+    - **top_n**: 자동 선정 종목 수 (기본값: 5)
+    - **subscriber**: 구독자 이름 (지정 시 인사말 추가)
+
+    모든 종목의 시세와 5일 과거 데이터를 한 번에 조회한 뒤 미리 만들어 둔 보고서 템플릿에 채웁니다.
+    정보를 찾을 수 없는 종목은 보고서에서 제외하고 X-Report-Skipped 헤더로 알려줍니다.
+    """
+    if request.tickers:
+        items = [(ticker, request.type) for ticker in request.tickers]
+    else:
+        items = await run_blocking(
+            BriefingService.select_daily_tickers,
+            request.top_n,
+            request=http_request
+        )
+        if not items:
+            raise HTTPException(
+                status_code=503,
+                detail="브리핑 종목을 자동 선정할 수 없습니다. tickers를 지정해주세요."
+            )
+
+    now = datetime.now()
+    sections, errors = await run_blocking(
+        WordReportService.collect_sections,
+        items,
+        now,
+        request=http_request,
+        timeout=60
+    )
+    if not sections:
+        raise HTTPException(
+            status_code=404,
+            detail=f"보고서에 포함할 종목 정보를 찾을 수 없습니다: {', '.join(errors)}"
+        )
+
+    document = await run_blocking(
+        WordReportService.build_report,
+        sections,
+        request.subscriber,
+        now,
+        request=http_request
+    )
+    headers = {"Content-Disposition": f'attachment; filename="briefing_{now.strftime("%Y-%m-%d")}.docx"'}
+    if errors:
+        headers["X-Report-Skipped"] = ",".join(errors)
+    return StreamingResponse(
+        WordReportService.iter_report(document),
+        media_type=DOCX_MEDIA_TYPE,
+        headers=headers
+    )
+
+
+@router.post(
+    "/jobs",
+    response_model=BriefingJob,
+    status_code=201,
+    responses={
+        200: {"model": BriefingJob, "description": "같은 요청의 작업이 이미 진행 중 (기존 작업 반환)"},
+        429: {"model": ErrorResponse, "description": "대기 중인 작업이 너무 많음"}
+    },
+    summary="브리핑 생성 작업 접수",
+    description="브리핑 일괄 생성을 백그라운드 작업으로 접수하고 바로 작업 상태를 반환합니다."
+)
+async def create_briefing_job(request: BriefingBatchRequest, response: Response):
+    """
+    브리핑 생성 작업 접수
+
+    요청 본문은 /api/briefing/batch와 같습니다.
+    생성은 전용 작업 풀에서 실행되며, status_url로 진행 상태를, result_url로 결과를 조회합니다.
+    같은 요청의 작업이 대기 중이거나 실행 중이면 새로 만들지 않고 기존 작업을 200으로 반환합니다.
+    """
+    try:
+        job, created = await run_blocking(briefing_jobs.submit, request)
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=f"브리핑 작업을 접수할 수 없습니다. 잠시 후 다시 시도해주세요. ({str(e)})"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"브리핑 작업 접수 중 에러가 발생했습니다: {str(e)}"
+        )
+
+    if not created:
+        response.status_code = 200
+    response.headers["Location"] = job.status_url
+    return job
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=BriefingJob,
+    responses={
+        404: {"model": ErrorResponse, "description": "작업을 찾을 수 없음"}
+    },
+    summary="브리핑 생성 작업 상태 조회",
+    description="브리핑 생성 작업의 상태와 단계별 진행률을 조회합니다."
+)
+async def get_briefing_job(job_id: str):
+    """
+    브리핑 생성 작업 상태 조회
+
+    - **status**: queued, running, completed, failed
+    - **steps**: stock_selection, data_collection, content_generation 단계별 상태
+    """
+    job = await run_blocking(briefing_jobs.get, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"브리핑 작업 '{job_id}'를 찾을 수 없습니다."
+        )
+    return job
+
+
+@router.get(
+    "/jobs/{job_id}/result",
+    response_model=BriefingBatchResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "작업을 찾을 수 없음"},
+        409: {"model": ErrorResponse, "description": "작업이 완료되지 않음"}
+    },
+    summary="브리핑 생성 작업 결과 조회",
+    description="완료된 브리핑 생성 작업의 결과를 조회합니다."
+)
+async def get_briefing_job_result(job_id: str):
+    """
+    브리핑 생성 작업 결과 조회
+
+    결과 형식은 /api/briefing/batch 응답과 같습니다.
+    """
+    job = await run_blocking(briefing_jobs.get, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"브리핑 작업 '{job_id}'를 찾을 수 없습니다."
+        )
+
+    result = await run_blocking(briefing_jobs.result, job_id) if job.status == COMPLETED else None
+    if result is None:
+        detail = f"브리핑 작업 '{job_id}'가 완료되지 않았습니다. (상태: {job.status})"
+        if job.error:
+            detail += f" {job.error}"
+        raise HTTPException(status_code=409, detail=detail)
+    return result
+
+
+@router.get(
+    "/card/{ticker}",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/png": {}}, "description": "브리핑 카드 PNG (1200×630, 2배율)"},
+        404: {"model": ErrorResponse, "description": "종목을 찾을 수 없음"}
+    },
+    summary="브리핑 카드 이미지 생성",
+    description="종목의 브리핑 카드 PNG 이미지를 생성합니다."
+)
+async def get_briefing_card(
+    request: Request,
+    ticker: str,
+    type: str = Query("most_actives", description="브리핑 타입 (선정 기준 문구에 사용)")
+):
+    """
+    브리핑 카드 이미지 생성
+
+    - **ticker**: 주식 티커 심볼
+    - **type**: 브리핑 타입 (most_actives, day_gainers, day_losers)
+
+    output/images/briefing-card-template.html 레이아웃을 브라우저 없이 직접 그립니다.
+    """
+    quote = await run_blocking(StockService.get_stock_quote, ticker.upper(), request=request)
+    if not quote:
+        raise HTTPException(
+            status_code=404,
+            detail=f"종목 '{ticker}'의 정보를 찾을 수 없습니다."
+        )
+
+    png = await run_blocking(render_card, quote, type, request=request)
+    return Response(content=png, media_type="image/png")
@@ -1,20 +1,41 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List
+import asyncio
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import List, Optional
 from models.stock import (
     StockInfo,
     StockPrice,
     StockQuote,
+    StockQuoteBatch,
+    BatchQuoteRequest,
     HistoricalData,
     RankedStockQuote,
+    TrendingStocksResult,
+    TopTrendingStockResult,
     ErrorResponse
 )
 from services.stock_service import StockService
+from services.trending_service import TrendingStocksFetcher
+from services.trending_snapshot import read_through, snapshot_headers
+from services.excel_export import ExcelExportService
+from services.executor import (
+    run_blocking,
+    UpstreamTimeoutError,
+    ClientDisconnectedError
+)
+from services.upstream import UpstreamUnavailableError
 
 router = APIRouter(
     prefix="/stocks",
     tags=["stocks"]
 )
 
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 과거 데이터 엑셀 내보내기 최대 종목 수
+HISTORY_EXPORT_MAX_SYMBOLS = 20
+
 # 추가 라우터 (API 경로용)
 api_router = APIRouter(
     prefix="/api/stocks",
@@ -32,13 +53,13 @@ api_router = APIRouter(
     summary="주식 기본 정보 조회",
     description="주식 심볼을 사용하여 회사명, 섹터, 산업 등의 기본 정보를 조회합니다."
 )
-async def get_stock_info(symbol: str):
+async def get_stock_info(symbol: str, request: Request):
     """
     주식 기본 정보 조회
 
     - **symbol**: 주식 심볼 (예: AAPL, TSLA, MSFT)
     """
-    info = StockService.get_stock_info(symbol)
+    info = await run_blocking(StockService.get_stock_info, symbol, request=request)
     if not info:
         raise HTTPException(
             status_code=404,
@@ -57,13 +78,13 @@ async def get_stock_info(symbol: str):
     summary="주식 가격 정보 조회",
     description="주식 심볼을 사용하여 현재가, 전일 종가, 변동률 등의 가격 정보를 조회합니다."
 )
-async def get_stock_price(symbol: str):
+async def get_stock_price(symbol: str, request: Request):
     """
     주식 가격 정보 조회
 
     - **symbol**: 주식 심볼 (예: AAPL, TSLA, MSFT)
     """
-    price = StockService.get_stock_price(symbol)
+    price = await run_blocking(StockService.get_stock_price, symbol, request=request)
     if not price:
         raise HTTPException(
             status_code=404,
@@ -82,13 +103,13 @@ async def get_stock_price(symbol: str):
     summary="주식 종합 정보 조회",
     description="주식 심볼을 사용하여 기본 정보와 가격 정보를 한 번에 조회합니다."
 )
-async def get_stock_quote(symbol: str):
+async def get_stock_quote(symbol: str, request: Request):
     """
     주식 종합 정보 조회 (기본 정보 + 가격 정보)
 
     - **symbol**: 주식 심볼 (예: AAPL, TSLA, MSFT)
     """
-    quote = StockService.get_stock_quote(symbol)
+    quote = await run_blocking(StockService.get_stock_quote, symbol, request=request)
     if not quote:
         raise HTTPException(
             status_code=404,
@@ -106,14 +127,24 @@ async def get_stock_quote(symbol: str):
         500: {"model": ErrorResponse, "description": "서버 에러"}
     },
     summary="주식 과거 데이터 조회",
-    description="주식 심볼과 기간을 사용하여 과거 가격 데이터를 조회합니다."
+    description=(
+        "주식 심볼과 기간을 사용하여 과거 가격 데이터를 조회합니다. "
+        "format=columnar 이면 필드별 병렬 배열(HistoricalColumns), "
+        "format=binary 이면 패킹된 열 배열(application/octet-stream)을 반환합니다."
+    )
 )
 async def get_historical_data(
     symbol: str,
+    request: Request,
     period: str = Query(
         default="1mo",
         description="조회 기간",
         regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$"
+    ),
+    format: str = Query(
+        default="json",
+        description="응답 형식 (json, columnar, binary)",
+        regex="^(json|columnar|binary)$"
     )
 ):
     """
@@ -132,16 +163,276 @@ async def get_historical_data(
         - 10y: 10년
         - ytd: 올해 초부터
         - max: 전체 기간
+    - **format**: 응답 형식
+        - json: 날짜별 객체 목록 (기본값)
+        - columnar: 필드별 병렬 배열 (date, open, high, low, close, volume)
+        - binary: 열 배열을 이어 붙인 바이너리 (X-Columns 헤더의 순서와 타입, 리틀 엔디언)
     """
-    data = StockService.get_historical_data(symbol, period)
+    if format == "json":
+        data = await run_blocking(StockService.get_historical_data, symbol, period, request=request)
+    else:
+        data = await run_blocking(StockService.get_historical_columns, symbol, period, request=request)
+
     if not data:
         raise HTTPException(
             status_code=404,
             detail=f"주식 '{symbol}'의 과거 데이터를 찾을 수 없습니다."
         )
+
+    if format == "columnar":
+        # 행별 모델 검증 없이 바로 직렬화
+        return JSONResponse(content=data.model_dump())
+
+    if format == "binary":
+        return Response(
+            content=StockService.pack_historical_columns(data),
+            media_type="application/octet-stream",
+            headers={
+                "X-Symbol": data.symbol,
+                "X-Period": data.period,
+                "X-Row-Count": str(len(data.date)),
+                "X-Columns": ",".join(
+                    f"{name}:{dtype}" for name, dtype in StockService.HISTORY_BINARY_COLUMNS
+                )
+            }
+        )
+
     return data
 
 
+async def _trending_result(
+    request: Request,
+    screener_type: str,
+    limit: int,
+    min_market_cap: float,
+    exclude_etf: bool,
+    sort_by: str
+):
+    """화제 종목 목록 조회 (기본 조건이면 스냅샷에서 읽고 limit만큼 잘라서 반환)"""
+    def compute():
+        return TrendingStocksFetcher.get_trending_stocks(
+            screener_type, limit, min_market_cap, exclude_etf, sort_by
+        )
+
+    if (screener_type, min_market_cap, exclude_etf, sort_by) == ("all", 1e9, True, "composite_score"):
+        result, snapshot = await read_through(lambda snap: snap.trending, compute, request=request)
+        if snapshot is not None:
+            result = result.model_copy(update={"trending_stocks": result.trending_stocks[:limit]})
+        return result, snapshot
+    return await run_blocking(compute, request=request), None
+
+
+@router.get(
+    "/trending",
+    response_model=TrendingStocksResult,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        503: {"model": ErrorResponse, "description": "데이터 수집 실패"}
+    },
+    summary="화제 종목 목록 조회",
+    description="당일 화제 종목 목록을 복합 점수(거래량 + 상승률 + 출현 빈도) 기준으로 조회합니다."
+)
+async def get_trending_stocks_scored(
+    request: Request,
+    response: Response,
+    screener_type: str = Query(
+        default="all",
+        description="스크리너 타입 (most_actives, day_gainers, day_losers, all)",
+        regex="^(most_actives|day_gainers|day_losers|all)$"
+    ),
+    limit: int = Query(default=10, ge=1, le=50, description="반환할 종목 수 (최대 50)"),
+    min_market_cap: float = Query(default=1e9, ge=0, description="최소 시가총액 (USD)"),
+    exclude_etf: bool = Query(default=True, description="ETF/레버리지 종목 제외"),
+    sort_by: str = Query(
+        default="composite_score",
+        description="정렬 기준 (composite_score, volume, change_percent)",
+        regex="^(composite_score|volume|change_percent)$"
+    )
+):
+    """
+    화제 종목 목록 조회
+
+    - **screener_type**: 수집할 스크리너 (기본값: all, 세 스크리너를 동시에 조회)
+    - **limit**: 반환할 종목 수 (1-50, 기본값: 10)
+    - **min_market_cap**: 최소 시가총액 (기본값: 10억 달러, 만족하는 종목이 없으면 조건 완화)
+    - **exclude_etf**: ETF/레버리지 종목 제외 여부 (기본값: true)
+    - **sort_by**: 정렬 기준 (기본값: composite_score)
+
+    동일 섹터 종목은 최대 2개까지 포함됩니다.
+    기본 조건(limit 제외) 요청은 미리 계산된 스냅샷에서 응답하며, 경과 시간은 X-Snapshot-Age 헤더로 제공합니다.
+    """
+    result, snapshot = await _trending_result(
+        request, screener_type, limit, min_market_cap, exclude_etf, sort_by
+    )
+    response.headers.update(snapshot_headers(snapshot))
+    if result is None:
+        raise HTTPException(
+            status_code=503,
+            detail="화제 종목 데이터를 가져올 수 없습니다."
+        )
+    return result
+
+
+@router.get(
+    "/trending/top",
+    response_model=TopTrendingStockResult,
+    responses={
+        503: {"model": ErrorResponse, "description": "데이터 수집 실패"}
+    },
+    summary="TOP 1 화제 종목 조회",
+    description="복합 점수 기준 최상위 1개 종목을 조회합니다. (브리핑 메인 종목용)"
+)
+async def get_top_trending_stock(
+    request: Request,
+    response: Response,
+    min_market_cap: float = Query(default=1e9, ge=0, description="최소 시가총액 (USD)"),
+    exclude_symbols: Optional[str] = Query(
+        default=None,
+        description="제외할 종목 (콤마 구분, 기본값: 주요 ETF/레버리지)"
+    )
+):
+    """
+    TOP 1 화제 종목 조회
+
+    - **min_market_cap**: 최소 시가총액 (기본값: 10억 달러)
+    - **exclude_symbols**: 제외할 종목 (예: SPY,QQQ,TQQQ)
+
+    차순위 후보 2개가 alternatives에 함께 반환됩니다.
+    기본 조건 요청은 미리 계산된 스냅샷에서 응답합니다.
+    """
+    excluded = None
+    if exclude_symbols:
+        excluded = [symbol.strip() for symbol in exclude_symbols.split(",") if symbol.strip()]
+
+    def compute():
+        return TrendingStocksFetcher.get_top_stock(min_market_cap, excluded)
+
+    if excluded is None and min_market_cap == 1e9:
+        result, snapshot = await read_through(lambda snap: snap.top_trending, compute, request=request)
+    else:
+        result, snapshot = await run_blocking(compute, request=request), None
+
+    response.headers.update(snapshot_headers(snapshot))
+    if result is None:
+        raise HTTPException(
+            status_code=503,
+            detail="화제 종목 데이터를 가져올 수 없습니다."
+        )
+    return result
+
+
+@api_router.get(
+    "/export/trending",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {XLSX_MEDIA_TYPE: {}}, "description": "화제 종목 엑셀 파일"},
+        503: {"model": ErrorResponse, "description": "데이터 수집 실패"}
+    },
+    summary="화제 종목 엑셀 내보내기",
+    description="화제 종목 목록을 엑셀(xlsx) 파일로 내려받습니다. 조회 조건은 /stocks/trending과 같습니다."
+)
+async def export_trending_stocks(
+    request: Request,
+    screener_type: str = Query(
+        default="all",
+        description="스크리너 타입 (most_actives, day_gainers, day_losers, all)",
+        regex="^(most_actives|day_gainers|day_losers|all)$"
+    ),
+    limit: int = Query(default=50, ge=1, le=50, description="내보낼 종목 수 (최대 50)"),
+    min_market_cap: float = Query(default=1e9, ge=0, description="최소 시가총액 (USD)"),
+    exclude_etf: bool = Query(default=True, description="ETF/레버리지 종목 제외"),
+    sort_by: str = Query(
+        default="composite_score",
+        description="정렬 기준 (composite_score, volume, change_percent)",
+        regex="^(composite_score|volume|change_percent)$"
+    )
+):
+    """
+    화제 종목 엑셀 내보내기
+
+    순위, 티커, 종목명, 주가, 등락률, 거래량, 시가총액, 복합 점수, 섹터, 출현 스크리너를 기록합니다.
+    """
+    result, snapshot = await _trending_result(
+        request, screener_type, limit, min_market_cap, exclude_etf, sort_by
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=503,
+            detail="화제 종목 데이터를 가져올 수 없습니다."
+        )
+
+    filename = f"trending_{result.market_summary.collection_time[:10]}.xlsx"
+    return StreamingResponse(
+        ExcelExportService.iter_workbook([
+            lambda workbook: ExcelExportService.write_trending_sheet(workbook, result)
+        ]),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            **snapshot_headers(snapshot)
+        }
+    )
+
+
+@api_router.get(
+    "/export/history",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {XLSX_MEDIA_TYPE: {}}, "description": "종목별 일봉 엑셀 파일 (종목당 시트 1개)"},
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        404: {"model": ErrorResponse, "description": "과거 데이터를 찾을 수 없음"}
+    },
+    summary="과거 데이터 엑셀 내보내기",
+    description="여러 종목의 과거 일봉 데이터를 종목별 시트로 나눈 엑셀(xlsx) 파일로 내려받습니다."
+)
+async def export_historical_data(
+    request: Request,
+    symbols: str = Query(..., description="종목 심볼 (콤마 구분, 최대 20개)"),
+    period: str = Query(
+        default="1y",
+        description="조회 기간",
+        regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$"
+    )
+):
+    """
+    과거 데이터 엑셀 내보내기
+
+    - **symbols**: 종목 심볼 (예: AAPL,MSFT,NVDA)
+    - **period**: 조회 기간 (기본값: 1y)
+
+    데이터가 없는 종목은 시트에서 제외됩니다.
+    """
+    symbol_list = list(dict.fromkeys(
+        symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()
+    ))
+    if not symbol_list or len(symbol_list) > HISTORY_EXPORT_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"종목은 1개 이상 {HISTORY_EXPORT_MAX_SYMBOLS}개 이하로 지정해주세요."
+        )
+
+    results = await asyncio.gather(*[
+        run_blocking(StockService.get_historical_columns, symbol, period, request=request)
+        for symbol in symbol_list
+    ])
+    histories = [data for data in results if data and data.date]
+    if not histories:
+        raise HTTPException(
+            status_code=404,
+            detail=f"'{symbols}'의 과거 데이터를 찾을 수 없습니다."
+        )
+
+    filename = f"history_{period}_{datetime.now().strftime('%Y-%m-%d')}.xlsx"
+    return StreamingResponse(
+        ExcelExportService.iter_workbook([
+            lambda workbook, data=data: ExcelExportService.write_history_sheet(workbook, data)
+            for data in histories
+        ]),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 # ============================================
 # API 엔드포인트 (프론트엔드 연동용)
 # ============================================
@@ -157,15 +448,22 @@ async def get_historical_data(
     description="스크리너를 사용하여 상위 N개 종목을 순위와 함께 조회합니다."
 )
 async def get_top_stocks(
+    request: Request,
+    response: Response,
     type: str = Query(
         default="most_actives",
-        description="스크리너 타입 (most_actives, day_gainers, day_losers 등)"
+        description="스크리너 타입 (most_actives, day_gainers, day_losers)",
+        regex="^(most_actives|day_gainers|day_losers)$"
     ),
     count: int = Query(
         default=5,
         ge=1,
         le=10,
         description="조회할 종목 개수 (1-10)"
+    ),
+    fast: bool = Query(
+        default=True,
+        description="스크리너 결과를 그대로 사용하여 빠르게 조회 (섹터/산업만 보충 조회)"
     )
 ):
     """
@@ -176,27 +474,40 @@ async def get_top_stocks(
         - day_gainers: 상승률 상위
         - day_losers: 하락률 상위
     - **count**: 조회할 종목 개수 (1-10, 기본값: 5)
+    - **fast**: 스크리너 결과 재사용 여부 (기본값: true)
 
     각 종목에는 순위(rank)와 종합 정보(quote)가 포함됩니다.
+    fast 모드의 기본 스크리너 결과는 미리 계산된 스냅샷에서 응답합니다.
     """
+    def compute():
+        results = StockService.get_top_stocks(type, count, fast)
+
+        # Dict를 RankedStockQuote 모델로 변환
+        return [
+            RankedStockQuote(rank=item['rank'], quote=item['quote'])
+            for item in results
+        ]
+
     try:
-        results = StockService.get_top_stocks(type, count)
+        if fast:
+            ranked_quotes, snapshot = await read_through(
+                lambda snap: list(snap.top_stocks.get((type, count), ())),
+                compute,
+                request=request
+            )
+        else:
+            ranked_quotes, snapshot = await run_blocking(compute, request=request), None
 
-        if not results:
+        if not ranked_quotes:
             raise HTTPException(
                 status_code=500,
                 detail=f"TOP {count} 종목 데이터를 불러올 수 없습니다."
             )
 
-        # Dict를 RankedStockQuote 모델로 변환
-        ranked_quotes = [
-            RankedStockQuote(rank=item['rank'], quote=item['quote'])
-            for item in results
-        ]
-
+        response.headers.update(snapshot_headers(snapshot))
         return ranked_quotes
 
-    except HTTPException:
+    except (HTTPException, UpstreamTimeoutError, UpstreamUnavailableError, ClientDisconnectedError):
         raise
     except Exception as e:
         raise HTTPException(
@@ -209,23 +520,30 @@ async def get_top_stocks(
     "/trending",
     response_model=List[StockQuote],
     summary="화제 종목 목록 조회",
-    description="인기 있는 주식 종목들의 실시간 정보를 조회합니다."
+    description="복합 점수 기준 화제 종목들의 실시간 정보를 조회합니다."
 )
-async def get_trending_stocks():
+async def get_trending_stocks(request: Request, response: Response):
     """
     화제 종목 목록 조회
 
-    기본적으로 주요 미국 기술주 6개를 반환합니다.
-    실제 서비스에서는 거래량, 변동률 등을 기준으로 동적으로 선정할 수 있습니다.
+    복합 점수(거래량 + 상승률 + 출현 빈도) 상위 6개 종목의 종합 정보를 반환합니다.
+    스크리너 조회에 실패하면 주요 미국 기술주 6개를 대신 반환합니다.
+    미리 계산된 스냅샷에서 응답하며, 경과 시간은 X-Snapshot-Age 헤더로 제공합니다.
     """
-    # 주요 종목 심볼 (실제로는 알고리즘으로 선정)
-    trending_symbols = ['AAPL', 'TSLA', 'NVDA', 'MSFT', 'GOOGL', 'AMZN']
+    results, snapshot = await read_through(
+        lambda snap: list(snap.trending_quotes),
+        lambda: TrendingStocksFetcher.get_trending_quotes(6),
+        request=request
+    )
+    response.headers.update(snapshot_headers(snapshot))
+
+    if not results:
+        # 폴백 종목 (스크리너 조회 실패 시)
+        fallback_symbols = ['AAPL', 'TSLA', 'NVDA', 'MSFT', 'GOOGL', 'AMZN']
 
-    results = []
-    for symbol in trending_symbols:
-        quote = StockService.get_stock_quote(symbol)
-        if quote:
-            results.append(quote)
+        # 한 번의 다중 심볼 요청으로 일괄 조회
+        batch = await run_blocking(StockService.get_stock_quotes, fallback_symbols, request=request)
+        results = list(batch.quotes.values())
 
     if not results:
         raise HTTPException(
@@ -236,6 +554,28 @@ async def get_trending_stocks():
     return results
 
 
+@api_router.post(
+    "/batch",
+    response_model=StockQuoteBatch,
+    responses={
+        422: {"model": ErrorResponse, "description": "잘못된 요청 (종목 수 초과 등)"},
+        500: {"model": ErrorResponse, "description": "서버 에러"}
+    },
+    summary="복수 종목 정보 일괄 조회",
+    description="여러 종목의 종합 정보를 한 번의 요청으로 조회합니다. (최대 50개)"
+)
+async def get_stock_quotes_batch(body: BatchQuoteRequest, request: Request):
+    """
+    복수 종목 정보 일괄 조회
+
+    - **symbols**: 조회할 종목 심볼 목록 (예: ["NVDA", "TSLA", "AAPL"], 최대 50개)
+
+    캐시되지 않은 종목만 한 번의 다중 심볼 요청으로 조회합니다.
+    조회에 실패한 종목은 `errors`에 심볼별 사유가 담기며, 나머지 종목은 정상 반환됩니다.
+    """
+    return await run_blocking(StockService.get_stock_quotes, body.symbols, request=request)
+
+
 @api_router.get(
     "/{ticker}",
     response_model=StockQuote,
@@ -246,13 +586,13 @@ async def get_trending_stocks():
     summary="종목 상세 정보 조회",
     description="티커 심볼로 주식의 상세 정보를 조회합니다."
 )
-async def get_stock_by_ticker(ticker: str):
+async def get_stock_by_ticker(ticker: str, request: Request):
     """
     종목 상세 정보 조회
 
     - **ticker**: 주식 티커 심볼 (예: AAPL, TSLA, MSFT)
     """
-    quote = StockService.get_stock_quote(ticker.upper())
+    quote = await run_blocking(StockService.get_stock_quote, ticker.upper(), request=request)
     if not quote:
         raise HTTPException(
             status_code=404,
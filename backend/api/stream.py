@@ -0,0 +1,82 @@
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from services.quote_stream import quote_hub
+
+router = APIRouter(
+    prefix="/stream",
+    tags=["stream"]
+)
+
+# 구독 가능한 최대 종목 수
+MAX_STREAM_SYMBOLS = 50
+
+# 이벤트가 없을 때 연결 유지를 위한 주석 전송 간격 (초)
+KEEPALIVE_INTERVAL = 15
+
+
+@router.get(
+    "/quotes",
+    summary="실시간 시세 스트림 (SSE)",
+    description="구독한 종목의 가격 정보를 Server-Sent Events로 전달합니다. 처음에는 전체 값(snapshot), 이후에는 변경된 필드만(update) 전송합니다.",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "SSE 스트림"},
+        400: {"description": "잘못된 요청"}
+    }
+)
+async def stream_quotes(
+    request: Request,
+    symbols: str = Query(
+        ...,
+        description="구독할 종목 심볼 (콤마 구분, 예: AAPL,TSLA,NVDA)"
+    )
+):
+    """
+    실시간 시세 스트림
+
+    - **symbols**: 구독할 종목 심볼 (콤마 구분, 최대 50개)
+
+    이벤트 형식:
+    - `snapshot`: {"AAPL": {가격 정보 전체}, ...}
+    - `update`: {"AAPL": {변경된 필드만}, ...}
+
+    같은 종목을 구독하는 모든 클라이언트는 하나의 백그라운드 폴러를 공유합니다.
+    """
+    symbol_list = list(dict.fromkeys(
+        symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()
+    ))
+    if not symbol_list or len(symbol_list) > MAX_STREAM_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"구독할 종목은 1개 이상 {MAX_STREAM_SYMBOLS}개 이하로 지정해주세요."
+        )
+
+    subscription = quote_hub.subscribe(symbol_list)
+
+    async def event_stream():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=KEEPALIVE_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                data = json.dumps(event["data"], ensure_ascii=False, separators=(",", ":"))
+                yield f"event: {event['event']}\ndata: {data}\n\n"
+        finally:
+            quote_hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
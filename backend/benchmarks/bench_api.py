@@ -0,0 +1,350 @@
+"""
+API 부하 벤치마크 (업스트림 재생 대역, 프로세스 내부 ASGI 호출, 오프라인)
+
+FastAPI 앱을 서버 없이 ASGI 호출로 직접 구동하고, yahooquery 대신 upstream_replay의 재생 대역을 사용합니다.
+라우트별·동시 실행 수별로 p50/p95/p99 응답 시간, 처리량, 상태 코드, 업스트림 호출 수를 측정하고
+결과를 JSON으로 저장하여 버전 간 성능 회귀를 비교할 수 있습니다.
+각 실행 전에 캐시, 일봉 저장소, 업스트림 관문 상태를 초기화하므로 실행마다 같은 조건에서 시작합니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_api --concurrency 1 8 32 --requests 200 --out /tmp/bench_api.json
+    python -m benchmarks.bench_api --routes stock_quote trending --latency-ms 80 --error-rate 0.05
+    python -m benchmarks.bench_api --fixtures fixtures.json --compare /tmp/bench_api_prev.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+
+# 앱을 불러오기 전에 저장 경로와 백그라운드 작업 설정 (명시한 환경 변수가 우선)
+_WORK_DIR = tempfile.mkdtemp(prefix="bench_api_")
+os.environ.setdefault("STOCK_HISTORY_DIR", os.path.join(_WORK_DIR, "history"))
+os.environ.setdefault("BRIEFING_ARCHIVE_DIR", os.path.join(_WORK_DIR, "briefings"))
+os.environ.setdefault("STOCK_CACHE_BACKEND", "memory")
+os.environ.setdefault("BRIEFING_JOB_STORE", "memory")
+# 스냅샷 갱신기가 측정 중에 업스트림을 호출하지 않도록 비활성화 (요청마다 직접 계산)
+os.environ.setdefault("TRENDING_SNAPSHOT_INTERVAL", "0")
+# 호출 한도는 실제 업스트림 보호용이므로 측정에서는 넉넉하게 설정
+os.environ.setdefault("UPSTREAM_RATE", "1000")
+os.environ.setdefault("UPSTREAM_BURST", "1000")
+
+from benchmarks.upstream_replay import UpstreamReplay, load_fixtures  # noqa: E402
+from main import app  # noqa: E402
+from services.stock_service import StockService  # noqa: E402
+from services.upstream import upstream  # noqa: E402
+from services.yahoo_client import yahoo_client  # noqa: E402
+
+
+# 측정 라우트: (이름, 메서드, 경로 템플릿, 본문 템플릿)
+# {symbol}은 요청마다 fixture 종목을 순서대로 바꿔 가며 채움 (SSE 스트림, 작업 큐 라우트는 제외)
+ROUTES: List[Tuple[str, str, str, Optional[Dict[str, Any]]]] = [
+    ("stock_info", "GET", "/stocks/info/{symbol}", None),
+    ("stock_price", "GET", "/stocks/price/{symbol}", None),
+    ("stock_quote", "GET", "/stocks/quote/{symbol}", None),
+    ("stock_history", "GET", "/stocks/history/{symbol}?period=1mo", None),
+    ("stock_history_columnar", "GET", "/stocks/history/{symbol}?period=1y&format=columnar", None),
+    ("trending", "GET", "/stocks/trending?limit=10", None),
+    ("trending_top", "GET", "/stocks/trending/top", None),
+    ("export_trending", "GET", "/api/stocks/export/trending", None),
+    ("export_history", "GET", "/api/stocks/export/history?symbols={symbol}&period=1mo", None),
+    ("api_trending", "GET", "/api/stocks/trending", None),
+    ("api_trending_top", "GET", "/api/stocks/trending/top", None),
+    ("api_batch", "POST", "/api/stocks/batch", {"symbols": ["{symbol}", "AAPL", "MSFT"]}),
+    ("api_ticker", "GET", "/api/stocks/{symbol}", None),
+    ("briefing_generate", "POST", "/api/briefing/generate", {"ticker": "{symbol}", "type": "most_actives"}),
+    ("briefing_batch", "POST", "/api/briefing/batch", {"tickers": ["{symbol}"], "type": "day_gainers"}),
+    ("briefing_report", "POST", "/api/briefing/report", {"tickers": ["{symbol}", "AAPL"]}),
+    ("briefing_card", "GET", "/api/briefing/card/{symbol}", None),
+]
+
+
+class ASGIClient:
+    """
+    최소 ASGI 클라이언트 (HTTP 요청/응답, lifespan 시작/종료)
+
+    응답이 끝날 때까지 연결 종료를 보내지 않으므로 요청 처리 중 연결 종료 감지(is_disconnected)도 실제 서버처럼 동작합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan_task: Optional[asyncio.Task] = None
+        self._lifespan_queue: Optional[asyncio.Queue] = None
+        self._lifespan_events: Optional[asyncio.Queue] = None
+
+    async def startup(self) -> None:
+        self._lifespan_queue = asyncio.Queue()
+        self._lifespan_events = asyncio.Queue()
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._lifespan_task = asyncio.create_task(
+            self.app(scope, self._lifespan_queue.get, self._lifespan_events.put)
+        )
+        await self._lifespan_queue.put({"type": "lifespan.startup"})
+        message = await self._lifespan_events.get()
+        if message["type"] != "lifespan.startup.complete":
+            raise RuntimeError(f"앱 시작 실패: {message}")
+
+    async def shutdown(self) -> None:
+        await self._lifespan_queue.put({"type": "lifespan.shutdown"})
+        await self._lifespan_events.get()
+        await self._lifespan_task
+
+    async def request(self, method: str, url: str, body: Optional[bytes] = None) -> Tuple[int, int]:
+        """
+        요청 한 개 처리
+
+        Returns:
+            Tuple[int, int]: (상태 코드, 응답 본문 크기)
+        """
+        parts = urlsplit(url)
+        headers = [(b"host", b"bench")]
+        if body is not None:
+            headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": parts.path,
+            "raw_path": parts.path.encode(),
+            "query_string": parts.query.encode(),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+        }
+
+        done = asyncio.Event()
+        request_sent = False
+        status = 0
+        size = 0
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body or b"", "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    done.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            done.set()
+        return status, size
+
+
+def percentile(values: np.ndarray, q: float) -> float:
+    return round(float(np.percentile(values, q)) * 1000, 2) if len(values) else 0.0
+
+
+def reset_state(replay: UpstreamReplay) -> None:
+    """캐시, 일봉 저장소, 업스트림 관문, 재생 대역 집계 초기화"""
+    StockService.cache.clear()
+    directory = StockService.history_store.directory
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+    upstream.reset()
+    replay.reset_counts()
+
+
+def _request_for(route: Tuple[str, str, str, Optional[Dict[str, Any]]], symbol: str) -> Tuple[str, str, Optional[bytes]]:
+    _, method, path, body = route
+    url = path.replace("{symbol}", symbol)
+    if body is None:
+        return method, url, None
+    return method, url, json.dumps(body).replace("{symbol}", symbol).encode()
+
+
+async def run_route(
+    client: ASGIClient,
+    replay: UpstreamReplay,
+    route: Tuple[str, str, str, Optional[Dict[str, Any]]],
+    concurrency: int,
+    requests: int,
+    symbols: List[str]
+) -> Dict[str, Any]:
+    """
+    라우트 하나를 고정된 동시 실행 수로 측정
+
+    Returns:
+        Dict: 응답 시간 백분위수, 처리량, 상태 코드 분포, 업스트림 호출 수
+    """
+    reset_state(replay)
+    latencies = np.zeros(requests)
+    statuses: Dict[str, int] = {}
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            method, url, body = _request_for(route, symbols[index % len(symbols)])
+            started = time.perf_counter()
+            status, _ = await client.request(method, url, body)
+            latencies[index] = time.perf_counter() - started
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    upstream_counts = replay.counts()
+    gateway = upstream.stats()["operations"]
+    return {
+        "route": route[0],
+        "method": route[1],
+        "path": route[2],
+        "concurrency": concurrency,
+        "requests": requests,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": round(float(latencies.max()) * 1000, 2),
+            "mean": round(float(latencies.mean()) * 1000, 2),
+        },
+        "status": statuses,
+        "upstream": {
+            "calls": sum(counts["calls"] for counts in upstream_counts.values()),
+            "injected_errors": sum(counts["errors"] for counts in upstream_counts.values()),
+            "by_operation": upstream_counts,
+            "retries": sum(stats["retries"] for stats in gateway.values()),
+            "stale_served": sum(stats["stale_served"] for stats in gateway.values()),
+        },
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str) -> None:
+    """이전 결과와 p95/처리량 비교 출력"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["route"], r["concurrency"]): r for r in json.load(f)["results"]}
+
+    print(f"\n비교 기준: {baseline_path}")
+    matched = [(result, baseline[(result["route"], result["concurrency"])])
+               for result in results if (result["route"], result["concurrency"]) in baseline]
+    if not matched:
+        print("같은 라우트/동시 실행 수의 이전 결과가 없습니다.")
+        return
+
+    print(f"{'route':<24}{'conc':>5}{'p95 ms (prev → now)':>28}{'rps (prev → now)':>26}")
+    for result, previous in matched:
+        p95_prev, p95_now = previous["latency_ms"]["p95"], result["latency_ms"]["p95"]
+        rps_prev, rps_now = previous["throughput_rps"], result["throughput_rps"]
+        change = (p95_now - p95_prev) / p95_prev * 100 if p95_prev else 0.0
+        print(
+            f"{result['route']:<24}{result['concurrency']:>5}"
+            f"{p95_prev:>12.1f} → {p95_now:>8.1f} ({change:+5.1f}%)"
+            f"{rps_prev:>12.1f} → {rps_now:>8.1f}"
+        )
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    replay = UpstreamReplay(
+        load_fixtures(args.fixtures),
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    routes = [route for route in ROUTES if not args.routes or route[0] in args.routes]
+    symbols = replay.symbols[:args.symbols]
+
+    client = ASGIClient(app)
+    results = []
+    with replay.install(yahoo_client):
+        await client.startup()
+        try:
+            for route in routes:
+                for concurrency in args.concurrency:
+                    result = await run_route(client, replay, route, concurrency, args.requests, symbols)
+                    results.append(result)
+                    latency = result["latency_ms"]
+                    print(
+                        f"{route[0]:<24} c={concurrency:<4} "
+                        f"p50 {latency['p50']:8.1f}  p95 {latency['p95']:8.1f}  p99 {latency['p99']:8.1f} ms  "
+                        f"{result['throughput_rps']:8.1f} req/s  upstream {result['upstream']['calls']:5d}  "
+                        f"status {result['status']}"
+                    )
+        finally:
+            await client.shutdown()
+
+    return {
+        "generated_at": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {
+            "fixtures": args.fixtures or "synthetic",
+            "symbols": len(symbols),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "seed": args.seed,
+            "upstream_rate": upstream.bucket.rate,
+            "max_workers": int(os.getenv("STOCK_SERVICE_MAX_WORKERS", "16")),
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 부하 벤치마크 (오프라인)")
+    parser.add_argument("--routes", nargs="*", default=None, help=f"측정할 라우트 (기본값: 전체, {', '.join(r[0] for r in ROUTES)})")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="동시 실행 수 목록")
+    parser.add_argument("--requests", type=int, default=200, help="라우트/동시 실행 수별 요청 수")
+    parser.add_argument("--symbols", type=int, default=20, help="요청에 순환 사용할 종목 수")
+    parser.add_argument("--fixtures", default=None, help="fixture 경로 (생략 시 합성 fixture)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="업스트림 호출당 기본 지연 시간")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="업스트림 추가 지연 시간 최댓값")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="업스트림 호출 실패 확률 (0-1)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    unknown = set(args.routes or []) - {route[0] for route in ROUTES}
+    if unknown:
+        parser.error(f"알 수 없는 라우트: {', '.join(sorted(unknown))}")
+
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        shutil.rmtree(_WORK_DIR, ignore_errors=True)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.out}")
+    if args.compare:
+        compare(report["results"], args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+브리핑 카드 렌더링 벤치마크 (Pillow, 배경/폰트/팔레트 캐시)
+
+기존 output/images/generate-briefing-card.js는 카드마다 Chromium을 띄우고
+networkidle0 대기 후 1초를 더 기다리므로 카드당 수 초가 걸립니다.
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_briefing_card --cards 50 --out /tmp/cards
+"""
+import argparse
+import os
+import time
+
+from benchmarks.bench_briefing_render import make_variants
+from services import briefing_card
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브리핑 카드 렌더링 벤치마크")
+    parser.add_argument("--cards", type=int, default=50, help="렌더링할 카드 수")
+    parser.add_argument("--workers", type=int, default=4, help="일괄 렌더링 동시 작성 수")
+    parser.add_argument("--out", default=None, help="카드 저장 디렉토리 (생략 시 저장하지 않음)")
+    args = parser.parse_args()
+
+    items = [(quote, briefing_type) for _, briefing_type, quote, _ in make_variants(args.cards)]
+
+    # 최초 1회: 배경 레이어, 팔레트, 폰트 준비
+    started = time.perf_counter()
+    briefing_card.render_card(*items[0])
+    warmup = time.perf_counter() - started
+
+    timings = []
+    for quote, briefing_type in items:
+        started = time.perf_counter()
+        briefing_card.render_card(quote, briefing_type)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+
+    started = time.perf_counter()
+    images = briefing_card.render_cards(items, max_workers=args.workers)
+    batch = time.perf_counter() - started
+
+    print(f"cards: {args.cards}  size: {briefing_card.WIDTH}x{briefing_card.HEIGHT} @{briefing_card.SCALE}x")
+    print(f"first card (cache warm-up): {warmup * 1000:8.1f} ms")
+    print(f"per card p50 / max        : {timings[len(timings) // 2] * 1000:8.1f} / {timings[-1] * 1000:.1f} ms")
+    print(f"batch ({args.workers} workers)         : {batch * 1000:8.1f} ms ({batch / args.cards * 1000:.1f} ms/card)")
+    print(f"avg PNG size              : {sum(map(len, images)) / len(images) / 1024:8.1f} KiB")
+
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        for index, image in enumerate(images):
+            with open(os.path.join(args.out, f"card_{index:03d}.png"), "wb") as f:
+                f.write(image)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+과거 데이터 변환 벤치마크 (iterrows 기반 기존 방식 vs 열 단위 변환)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_history --rows 10000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from models.stock import HistoricalColumns, HistoricalDataPoint
+from services.history_store import history_to_bars
+from services.stock_service import StockService
+
+
+def make_history_frame(rows: int, symbol: str = "AAPL") -> pd.DataFrame:
+    """yahooquery history()와 같은 형태의 (symbol, date) 인덱스 DataFrame 생성"""
+    rng = np.random.default_rng(42)
+    dates = pd.bdate_range(end="2026-10-16", periods=rows).date
+    close = 100 + rng.standard_normal(rows).cumsum()
+    frame = pd.DataFrame(
+        {
+            "open": close + rng.standard_normal(rows),
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.integers(0, 50_000_000, rows).astype(np.float64),
+            "adjclose": close,
+        },
+        index=pd.MultiIndex.from_arrays([[symbol] * rows, dates], names=["symbol", "date"]),
+    )
+    # 결측치 일부 포함 (기존 방식은 거래량 NaN에서 예외가 발생하므로 가격 열에만)
+    frame.iloc[::97, 0] = np.nan
+    return frame
+
+
+def legacy_convert(hist: pd.DataFrame) -> list:
+    """기존 get_historical_data의 iterrows 변환 (비교용)"""
+    data_points = []
+    for index, row in hist.iterrows():
+        if isinstance(index, tuple):
+            date = index[1].strftime('%Y-%m-%d')
+        else:
+            date = index.strftime('%Y-%m-%d')
+
+        data_points.append(
+            HistoricalDataPoint(
+                date=date,
+                open=float(row.get('open', 0)) if row.get('open') else None,
+                high=float(row.get('high', 0)) if row.get('high') else None,
+                low=float(row.get('low', 0)) if row.get('low') else None,
+                close=float(row.get('close', 0)) if row.get('close') else None,
+                volume=int(row.get('volume', 0)) if row.get('volume') else None
+            )
+        )
+    return data_points
+
+
+def vectorized_convert(hist: pd.DataFrame) -> list:
+    """현재 get_historical_data의 열 단위 변환"""
+    columns = HistoricalColumns.model_construct(
+        symbol="AAPL",
+        period="max",
+        **StockService._bars_to_columns(history_to_bars(hist))
+    )
+    return StockService._columns_to_points(columns)
+
+
+def best_of(func, arg, repeat: int) -> float:
+    """repeat회 실행 중 최소 소요 시간 (초)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과거 데이터 변환 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000, help="합성 데이터 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    hist = make_history_frame(args.rows)
+
+    legacy = best_of(legacy_convert, hist, args.repeat)
+    vectorized = best_of(vectorized_convert, hist, args.repeat)
+
+    print(f"rows: {args.rows:,}")
+    print(f"iterrows   : {legacy * 1000:9.2f} ms")
+    print(f"vectorized : {vectorized * 1000:9.2f} ms")
+    print(f"speedup    : {legacy / vectorized:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+화제 종목 복합 점수 벤치마크 (설계서의 행 단위 파싱 + .apply 방식 vs 열 단위 계산)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.bench_trending --rows 5000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from services.trending_service import TrendingStocksFetcher
+
+
+def make_screener_rows(rows: int, symbols: int) -> dict:
+    """스크리너 세 개에 나눠 담긴 합성 결과 행 생성 (일부 종목은 여러 스크리너에 중복 출현)"""
+    rng = np.random.default_rng(42)
+    per_screener = rows // len(TrendingStocksFetcher.SCREENER_TYPES)
+    rows_by_source = {}
+    for screener_type in TrendingStocksFetcher.SCREENER_TYPES:
+        picks = rng.choice(symbols, per_screener, replace=False)
+        change = rng.normal(0, 6, per_screener)
+        volume = rng.integers(100_000, 500_000_000, per_screener)
+        market_cap = rng.lognormal(22, 2, per_screener)
+        rows_by_source[screener_type] = [
+            {
+                'symbol': f"SYM{pick}",
+                'shortName': f"Company {pick}",
+                'regularMarketPrice': 100.0,
+                'regularMarketChangePercent': float(change[i]),
+                'regularMarketChange': float(change[i]),
+                'regularMarketVolume': int(volume[i]),
+                'averageDailyVolume3Month': int(volume[i] // 2),
+                'marketCap': float(market_cap[i]),
+                'quoteType': 'EQUITY',
+            }
+            for i, pick in enumerate(picks)
+        ]
+    return rows_by_source
+
+
+def legacy_frame(rows_by_source: dict) -> pd.DataFrame:
+    """화제종목_수집_설계서.md의 parse_screener_result (비교용)"""
+    all_stocks = []
+    for screener_type, quotes in rows_by_source.items():
+        for quote in quotes:
+            all_stocks.append({
+                'symbol': quote.get('symbol'),
+                'name': quote.get('shortName') or quote.get('longName'),
+                'price': quote.get('regularMarketPrice'),
+                'change_percent': quote.get('regularMarketChangePercent'),
+                'volume': quote.get('regularMarketVolume'),
+                'market_cap': quote.get('marketCap'),
+                'source': screener_type
+            })
+    return pd.DataFrame(all_stocks)
+
+
+def legacy_score_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """화제종목_수집_설계서.md의 calculate_composite_score (비교용)"""
+    agg_df = df.groupby('symbol').agg({
+        'name': 'first',
+        'price': 'first',
+        'change_percent': 'max',
+        'volume': 'max',
+        'market_cap': 'first',
+        'source': 'count'
+    }).reset_index()
+    agg_df.rename(columns={'source': 'appearance_count'}, inplace=True)
+
+    agg_df['volume_score'] = agg_df['volume'].rank(pct=True) * 100
+    agg_df['change_score'] = agg_df['change_percent'].apply(
+        lambda x: min(max(x if pd.notna(x) else 0, 0) * 5, 100)
+    )
+    agg_df['appearance_bonus'] = (agg_df['appearance_count'] - 1) * 15
+    agg_df['composite_score'] = (
+        agg_df['volume_score'] * 0.4 +
+        agg_df['change_score'] * 0.4 +
+        agg_df['appearance_bonus'] * 0.2
+    )
+    return agg_df.sort_values('composite_score', ascending=False)
+
+
+def legacy_score(rows_by_source: dict) -> pd.DataFrame:
+    """설계서 방식 전체 (파싱 + 점수 계산)"""
+    return legacy_score_frame(legacy_frame(rows_by_source))
+
+
+def vectorized_score(rows_by_source: dict) -> pd.DataFrame:
+    """현재 TrendingStocksFetcher의 열 단위 계산"""
+    return TrendingStocksFetcher.score(TrendingStocksFetcher.screener_frame(rows_by_source))
+
+
+def best_of(func, arg, repeat: int) -> float:
+    """repeat회 실행 중 최소 소요 시간 (초)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화제 종목 복합 점수 벤치마크")
+    parser.add_argument("--rows", type=int, default=5_000, help="합성 스크리너 행 수 (세 스크리너 합계)")
+    parser.add_argument("--symbols", type=int, default=2_000, help="종목 수 (중복 출현 비율 조절)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    rows_by_source = make_screener_rows(args.rows, args.symbols)
+
+    # 두 방식의 점수가 같은지 확인
+    legacy = legacy_score(rows_by_source).set_index('symbol')['composite_score']
+    current = vectorized_score(rows_by_source).set_index('symbol')['composite_score']
+    max_diff = float((legacy - current.reindex(legacy.index)).abs().max())
+
+    timings = {
+        "end-to-end": (
+            best_of(legacy_score, rows_by_source, args.repeat),
+            best_of(vectorized_score, rows_by_source, args.repeat),
+        ),
+        "scoring": (
+            best_of(legacy_score_frame, legacy_frame(rows_by_source), args.repeat),
+            best_of(TrendingStocksFetcher.score, TrendingStocksFetcher.screener_frame(rows_by_source), args.repeat),
+        ),
+    }
+
+    print(f"rows: {args.rows:,}  symbols: {len(legacy):,}  max score diff: {max_diff:.2e}")
+    print(f"{'':12}{'apply':>12}{'vectorized':>12}{'speedup':>10}")
+    for name, (legacy_time, vectorized_time) in timings.items():
+        print(
+            f"{name:12}{legacy_time * 1000:10.2f}ms{vectorized_time * 1000:10.2f}ms"
+            f"{legacy_time / vectorized_time:9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""
+업스트림(yahooquery) 재생 대역
+
+yahoo_client.ticker()/screener()가 반환하는 객체와 같은 인터페이스(get_modules, history, get_screeners)로
+기록된 응답(fixture)을 돌려줍니다. 호출마다 지연 시간과 에러를 주입할 수 있고, 작업별 호출 수를 집계하므로
+네트워크 없이 API 전체 경로(관문, 묶음 처리, 캐시, 일봉 저장소)를 반복 측정할 수 있습니다.
+
+fixture 형식 (JSON):
+    {
+        "recorded_at": "2026-10-16",
+        "modules": {"AAPL": {"price": {...}, "summaryDetail": {...}, "assetProfile": {...}}},
+        "history": {"AAPL": {"date": ["2025-10-16", ...], "open": [...], ..., "volume": [...]}},
+        "screeners": {"most_actives": {"quotes": [...]}}
+    }
+
+실행 (backend 디렉토리에서):
+    # 실제 업스트림 응답 기록 (네트워크 필요)
+    python -m benchmarks.upstream_replay record AAPL MSFT NVDA --out fixtures.json
+    # 합성 fixture 생성 (오프라인)
+    python -m benchmarks.upstream_replay synthetic --symbols 40 --out fixtures.json
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import requests
+
+from services.history_store import BAR_COLUMNS, PERIOD_BARS, HistoryStore, history_to_bars
+from services.stock_service import StockService
+from services.trending_service import TrendingStocksFetcher
+
+
+# 합성 fixture 기본 종목 (스크리너 결과와 단건 조회 대상)
+DEFAULT_SYMBOLS = [
+    "AAPL", "MSFT", "NVDA", "AMZN", "GOOGL", "META", "TSLA", "AVGO", "AMD", "INTC",
+    "NFLX", "ORCL", "CRM", "ADBE", "QCOM", "MU", "PLTR", "UBER", "SHOP", "COIN",
+    "JPM", "BAC", "WFC", "XOM", "CVX", "PFE", "MRK", "KO", "PEP", "WMT",
+    "DIS", "NKE", "BA", "F", "GM", "T", "VZ", "SOFI", "RIVN", "SNAP",
+]
+SECTORS = [
+    ("Technology", "Semiconductors"),
+    ("Technology", "Software—Infrastructure"),
+    ("Communication Services", "Internet Content & Information"),
+    ("Consumer Cyclical", "Auto Manufacturers"),
+    ("Financial Services", "Banks—Diversified"),
+    ("Energy", "Oil & Gas Integrated"),
+    ("Healthcare", "Drug Manufacturers—General"),
+    ("Consumer Defensive", "Beverages—Non-Alcoholic"),
+]
+HISTORY_BARS = 600
+
+
+class InjectedUpstreamError(requests.ConnectionError):
+    """주입된 업스트림 실패 (관문이 일시적 실패로 보고 재시도)"""
+
+
+def synthetic_fixtures(symbols: Optional[List[str]] = None, seed: int = 42) -> Dict[str, Any]:
+    """
+    기록된 응답과 같은 형태의 합성 fixture 생성
+
+    Args:
+        symbols: 종목 목록 (기본값: DEFAULT_SYMBOLS)
+        seed: 난수 시드
+
+    Returns:
+        Dict: fixture (modules, history, screeners)
+    """
+    symbols = symbols or DEFAULT_SYMBOLS
+    rng = np.random.default_rng(seed)
+    today = np.datetime64('today', 'D')
+    dates = pd.bdate_range(end=pd.Timestamp(today), periods=HISTORY_BARS).strftime('%Y-%m-%d').tolist()
+
+    modules: Dict[str, Any] = {}
+    history: Dict[str, Any] = {}
+    rows = []
+    for index, symbol in enumerate(symbols):
+        close = float(rng.uniform(5, 600)) * (1 + rng.normal(0, 0.02, HISTORY_BARS)).cumprod()
+        previous_close = float(close[-2])
+        price = float(close[-1])
+        volume = rng.integers(1_000_000, 200_000_000, HISTORY_BARS).astype(float)
+        market_cap = float(rng.uniform(5e8, 3e12))
+        sector, industry = SECTORS[index % len(SECTORS)]
+
+        price_module = {
+            'symbol': symbol,
+            'shortName': f"{symbol} Inc.",
+            'longName': f"{symbol} Incorporated",
+            'exchangeName': "NasdaqGS" if index % 2 else "NYSE",
+            'currency': "USD",
+            'quoteType': "EQUITY",
+            'marketState': "REGULAR",
+            'marketCap': market_cap,
+            'regularMarketPrice': price,
+            'regularMarketPreviousClose': previous_close,
+            'regularMarketOpen': previous_close,
+            'regularMarketDayHigh': max(price, previous_close) * 1.01,
+            'regularMarketDayLow': min(price, previous_close) * 0.99,
+            'regularMarketVolume': int(volume[-1]),
+            'regularMarketChange': price - previous_close,
+            'regularMarketChangePercent': (price - previous_close) / previous_close * 100,
+            'regularMarketTime': int(time.time()),
+        }
+        modules[symbol] = {
+            'price': price_module,
+            'summaryDetail': {'currency': "USD", 'previousClose': previous_close, 'volume': int(volume[-1])},
+            'assetProfile': {'sector': sector, 'industry': industry},
+        }
+        history[symbol] = {
+            'date': dates,
+            'open': (close * (1 + rng.normal(0, 0.005, HISTORY_BARS))).round(4).tolist(),
+            'high': (close * 1.01).round(4).tolist(),
+            'low': (close * 0.99).round(4).tolist(),
+            'close': close.round(4).tolist(),
+            'volume': volume.tolist(),
+        }
+        rows.append({
+            **price_module,
+            'fullExchangeName': price_module['exchangeName'],
+            'averageDailyVolume3Month': float(volume[-63:].mean()),
+        })
+
+    count = TrendingStocksFetcher.SCREENER_COUNT
+    screeners = {
+        'most_actives': sorted(rows, key=lambda row: -row['regularMarketVolume'])[:count],
+        'day_gainers': sorted(rows, key=lambda row: -row['regularMarketChangePercent'])[:count],
+        'day_losers': sorted(rows, key=lambda row: row['regularMarketChangePercent'])[:count],
+    }
+    return {
+        'recorded_at': str(today),
+        'modules': modules,
+        'history': history,
+        'screeners': {name: {'quotes': quotes} for name, quotes in screeners.items()},
+    }
+
+
+def load_fixtures(path: Optional[str]) -> Dict[str, Any]:
+    """fixture 파일 읽기 (경로가 없으면 합성 fixture)"""
+    if not path:
+        return synthetic_fixtures()
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class UpstreamReplay:
+    """
+    기록된 응답을 재생하는 업스트림 대역
+
+    - latency: 호출당 기본 지연 시간 (초), jitter: 추가 지연의 최댓값 (균등 분포)
+    - error_rate: 호출이 InjectedUpstreamError로 실패할 확률
+    - 과거 데이터는 마지막 기록일이 최근 1주 안에 오도록 주 단위로 날짜를 옮겨서 반환 (요일 유지)
+    """
+
+    def __init__(
+        self,
+        fixtures: Dict[str, Any],
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        error_rate: float = 0.0,
+        seed: int = 42
+    ):
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.modules = {symbol.upper(): data for symbol, data in fixtures.get('modules', {}).items()}
+        self.screeners = fixtures.get('screeners', {})
+        self.history = {
+            symbol.upper(): self._history_frame(symbol.upper(), columns)
+            for symbol, columns in fixtures.get('history', {}).items()
+        }
+        self._random = random.Random(seed)
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _history_frame(symbol: str, columns: Dict[str, List[Any]]) -> pd.DataFrame:
+        dates = pd.to_datetime(columns['date'])
+        if len(dates):
+            weeks = (pd.Timestamp('today').normalize() - dates.max()).days // 7
+            dates = dates + pd.Timedelta(weeks=weeks)
+        index = pd.MultiIndex.from_arrays(
+            [[symbol] * len(dates), dates.date],
+            names=['symbol', 'date']
+        )
+        return pd.DataFrame({name: columns.get(name) for name in BAR_COLUMNS}, index=index)
+
+    @property
+    def symbols(self) -> List[str]:
+        """모듈 데이터가 기록된 종목 목록"""
+        return list(self.modules)
+
+    def _call(self, operation: str, symbols: int = 0) -> None:
+        """호출 집계, 지연 시간 대기, 에러 주입"""
+        with self._lock:
+            counts = self._counts.setdefault(operation, {'calls': 0, 'symbols': 0, 'errors': 0})
+            counts['calls'] += 1
+            counts['symbols'] += symbols
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+            if failed:
+                counts['errors'] += 1
+
+        time.sleep(delay)
+        if failed:
+            raise InjectedUpstreamError(f"주입된 업스트림 실패 ({operation})")
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """작업별 호출 수, 요청한 종목 수, 주입된 실패 수"""
+        with self._lock:
+            return {operation: dict(counts) for operation, counts in self._counts.items()}
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def ticker(self, symbols: Union[str, List[str]]) -> "ReplayTicker":
+        return ReplayTicker(self, symbols)
+
+    def screener(self) -> "ReplayScreener":
+        return ReplayScreener(self)
+
+    @contextmanager
+    def install(self, client: Any) -> Iterator["UpstreamReplay"]:
+        """
+        업스트림 클라이언트(yahoo_client)의 ticker/screener를 재생 대역으로 교체
+
+        Args:
+            client: services.yahoo_client.yahoo_client
+        """
+        client.ticker, client.screener = self.ticker, self.screener
+        try:
+            yield self
+        finally:
+            del client.ticker, client.screener
+
+
+class ReplayTicker:
+    """yahooquery Ticker 대역 (get_modules, history)"""
+
+    def __init__(self, replay: UpstreamReplay, symbols: Union[str, List[str]]):
+        self.replay = replay
+        self.symbols = symbols.replace(',', ' ').split() if isinstance(symbols, str) else list(symbols)
+
+    def get_modules(self, modules: List[str]) -> Dict[str, Any]:
+        self.replay._call('get_modules', len(self.symbols))
+        data: Dict[str, Any] = {}
+        for symbol in self.symbols:
+            recorded = self.replay.modules.get(symbol.upper())
+            if recorded is None:
+                data[symbol] = f"Quote not found for ticker symbol: {symbol}"
+            else:
+                data[symbol] = {module: recorded[module] for module in modules if module in recorded}
+        return data
+
+    def history(self, period: str = 'ytd', start: Optional[str] = None, **kwargs) -> Union[pd.DataFrame, Dict[str, Any]]:
+        self.replay._call('history', len(self.symbols))
+        frames = {}
+        missing = {}
+        for symbol in self.symbols:
+            frame = self.replay.history.get(symbol.upper())
+            if frame is None:
+                missing[symbol] = f"No data found, symbol may be delisted: {symbol}"
+                continue
+
+            dates = frame.index.get_level_values(-1)
+            if start is not None:
+                frame = frame[dates >= pd.Timestamp(start).date()]
+            elif period in PERIOD_BARS:
+                frame = frame.iloc[-PERIOD_BARS[period]:]
+            elif period != 'max':
+                first = np.datetime64(HistoryStore.period_start(period), 'D')
+                frame = frame[dates >= pd.Timestamp(first).date()]
+            frames[symbol] = frame
+
+        # 일부 종목이 실패하면 yahooquery처럼 종목별 DataFrame/에러 메시지 Dict로 반환
+        if missing:
+            return {**{symbol: frame.droplevel(0) for symbol, frame in frames.items()}, **missing}
+        return pd.concat(frames.values()) if frames else pd.DataFrame()
+
+
+class ReplayScreener:
+    """yahooquery Screener 대역 (get_screeners)"""
+
+    def __init__(self, replay: UpstreamReplay):
+        self.replay = replay
+
+    def get_screeners(self, screen_ids: Union[str, List[str]], count: int = 25) -> Dict[str, Any]:
+        screen_ids = screen_ids.split() if isinstance(screen_ids, str) else list(screen_ids)
+        self.replay._call('get_screeners')
+        data = {}
+        for screen_id in screen_ids:
+            recorded = self.replay.screeners.get(screen_id)
+            if recorded is None:
+                data[screen_id] = "Invalid screener"
+            else:
+                data[screen_id] = {**recorded, 'quotes': recorded.get('quotes', [])[:count]}
+        return data
+
+
+def record_fixtures(symbols: List[str], period: str = '2y') -> Dict[str, Any]:
+    """
+    실제 업스트림 응답 기록 (네트워크 필요)
+
+    Args:
+        symbols: 모듈 데이터와 과거 데이터를 기록할 종목 (스크리너 결과 종목도 함께 기록)
+        period: 과거 데이터 기록 기간
+
+    Returns:
+        Dict: fixture
+    """
+    from services.yahoo_client import yahoo_client
+
+    screeners = yahoo_client.screener().get_screeners(
+        TrendingStocksFetcher.SCREENER_TYPES, count=TrendingStocksFetcher.SCREENER_COUNT
+    )
+    screeners = {name: data for name, data in screeners.items() if isinstance(data, dict)}
+    screened = [quote['symbol'] for data in screeners.values() for quote in data.get('quotes', []) if quote.get('symbol')]
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols + screened))
+
+    modules = yahoo_client.ticker(symbols).get_modules(StockService.QUOTE_MODULES)
+    frames = StockService._split_history(yahoo_client.ticker(symbols).history(period=period))
+    history = {}
+    for symbol, frame in frames.items():
+        bars = StockService._bars_to_columns(history_to_bars(frame))
+        history[symbol] = {'date': bars['date'], **{name: bars[name] for name in BAR_COLUMNS}}
+
+    return {
+        'recorded_at': str(np.datetime64('today', 'D')),
+        'modules': {symbol: data for symbol, data in modules.items() if isinstance(data, dict)},
+        'history': history,
+        'screeners': screeners,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업스트림 재생 fixture 생성")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="실제 업스트림 응답 기록 (네트워크 필요)")
+    record.add_argument("symbols", nargs="*", default=[], help="추가로 기록할 종목")
+    record.add_argument("--period", default="2y", help="과거 데이터 기록 기간")
+    record.add_argument("--out", required=True, help="fixture 저장 경로")
+
+    synthetic = commands.add_parser("synthetic", help="합성 fixture 생성")
+    synthetic.add_argument("--symbols", type=int, default=len(DEFAULT_SYMBOLS), help="종목 수")
+    synthetic.add_argument("--seed", type=int, default=42, help="난수 시드")
+    synthetic.add_argument("--out", required=True, help="fixture 저장 경로")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        fixtures = record_fixtures(args.symbols, args.period)
+    else:
+        symbols = (DEFAULT_SYMBOLS + [f"SYM{i}" for i in range(args.symbols)])[:args.symbols]
+        fixtures = synthetic_fixtures(symbols, args.seed)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(fixtures, f, ensure_ascii=False, default=str)
+    print(
+        f"{args.out}: {len(fixtures['modules'])} symbols, "
+        f"{len(fixtures['history'])} histories, {len(fixtures['screeners'])} screeners"
+    )
+
+
+if __name__ == "__main__":
+    main()
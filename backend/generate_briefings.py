@@ -0,0 +1,95 @@
+"""
+브리핑 일괄 생성 CLI (아침 발송용)
+
+실행 (backend 디렉토리에서):
+    python generate_briefings.py                      # 화제 종목 상위 5개 자동 선정
+    python generate_briefings.py --top-n 10
+    python generate_briefings.py NVDA TSLA AAPL --type day_gainers --out briefings
+
+출력 디렉토리에 종목별 briefing_<ticker>.md(--format html/text 이면 .html/.txt)와
+manifest.json(종목별 소요 시간 포함)을 저장합니다.
+--cards 옵션을 주면 종목별 브리핑 카드 이미지(card_<ticker>.png)도 함께 저장합니다.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from services.briefing_card import render_cards
+from services.briefing_service import BriefingService
+from services.stock_service import StockService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브리핑 일괄 생성")
+    parser.add_argument("tickers", nargs="*", help="브리핑할 종목 (생략 시 화제 종목 자동 선정)")
+    parser.add_argument("--type", default="most_actives", help="브리핑 타입 (종목 지정 시 사용)")
+    parser.add_argument("--top-n", type=int, default=5, help="자동 선정 종목 수")
+    parser.add_argument("--format", default="markdown", choices=["markdown", "html", "text"], help="출력 형식")
+    parser.add_argument("--cards", action="store_true", help="브리핑 카드 이미지도 생성")
+    parser.add_argument("--workers", type=int, default=BriefingService.BATCH_MAX_WORKERS, help="동시 작성 수")
+    parser.add_argument(
+        "--out",
+        default=os.path.join("briefings", datetime.now().strftime("%Y%m%d")),
+        help="출력 디렉토리"
+    )
+    args = parser.parse_args()
+
+    if args.tickers:
+        items = [(ticker, args.type) for ticker in args.tickers]
+    else:
+        items = BriefingService.select_daily_tickers(args.top_n)
+        if not items:
+            print("❌ 화제 종목을 선정할 수 없습니다. 종목을 직접 지정해주세요.")
+            sys.exit(1)
+
+    print(f"📝 브리핑 {len(items)}건 생성: {', '.join(ticker for ticker, _ in items)}")
+    result = BriefingService.generate_briefings(items, max_workers=args.workers, output_format=args.format)
+    extension = {"markdown": "md", "html": "html", "text": "txt"}[args.format]
+
+    os.makedirs(args.out, exist_ok=True)
+    manifest = result.model_dump(exclude={"briefings"})
+    manifest["briefings"] = []
+    for briefing in result.briefings:
+        entry = briefing.model_dump(exclude={"content"})
+        if briefing.content is not None:
+            path = os.path.join(args.out, f"briefing_{briefing.ticker.lower()}.{extension}")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(briefing.content)
+            entry["file"] = path
+            print(f"  ✅ {briefing.ticker:<6} {briefing.type:<13} {briefing.elapsed_ms:8.1f} ms  → {path}")
+        else:
+            print(f"  ❌ {briefing.ticker:<6} {briefing.type:<13} {briefing.error}")
+        manifest["briefings"].append(entry)
+
+    if args.cards:
+        # 일괄 생성 시 조회한 종합 정보는 캐시에 있으므로 다시 조회하지 않음
+        succeeded = [briefing for briefing in result.briefings if briefing.content is not None]
+        quotes = StockService.get_stock_quotes([briefing.ticker for briefing in succeeded]).quotes
+        cards = [briefing for briefing in succeeded if briefing.ticker in quotes]
+        started = time.perf_counter()
+        images = render_cards(
+            [(quotes[briefing.ticker], briefing.type) for briefing in cards],
+            max_workers=args.workers
+        )
+        entries = {entry["ticker"]: entry for entry in manifest["briefings"]}
+        for briefing, image in zip(cards, images):
+            path = os.path.join(args.out, f"card_{briefing.ticker.lower()}.png")
+            with open(path, "wb") as f:
+                f.write(image)
+            entries[briefing.ticker]["card"] = path
+        print(f"\n🖼️  카드 {len(images)}장 생성 ({(time.perf_counter() - started) * 1000:.1f} ms)")
+
+    manifest_path = os.path.join(args.out, "manifest.json")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"\n일괄 조회 {result.prefetch_ms:.1f} ms / 전체 {result.total_ms:.1f} ms")
+    print(f"성공 {result.succeeded}건, 실패 {result.failed}건 → {manifest_path}")
+    sys.exit(0 if result.failed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
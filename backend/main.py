@@ -1,12 +1,50 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from api.stocks import router as stocks_router, api_router as stocks_api_router
 from api.briefing import router as briefing_router
+from api.stream import router as stream_router
+from services.executor import executor, UpstreamTimeoutError, ClientDisconnectedError
+from services.metrics import metrics, MetricsMiddleware
+from services.quote_stream import quote_hub
+from services.trending_snapshot import trending_refresher
+from services.trending_service import TrendingStocksFetcher
+from services import briefing_card
+from services.briefing_jobs import briefing_jobs
+from services.briefing_service import BriefingService
+from services.stock_service import StockService
+from services.upstream import upstream, UpstreamUnavailableError
+from services.yahoo_client import yahoo_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 리소스 관리"""
+    # 화제 종목 스냅샷 백그라운드 갱신 시작 (첫 스냅샷은 시작을 막지 않고 생성)
+    trending_refresher.start()
+    # 브리핑 생성 작업 풀 시작 (요청 처리 실행기와 분리)
+    briefing_jobs.start()
+    # 브리핑 카드 배경/팔레트를 미리 생성 (첫 카드 요청이 생성을 기다리지 않도록, 시작은 막지 않음)
+    asyncio.get_running_loop().run_in_executor(None, briefing_card.warm)
+    yield
+    # 백그라운드 작업 및 업스트림 호출용 스레드 풀 종료
+    await trending_refresher.stop()
+    await quote_hub.stop()
+    briefing_jobs.shutdown()
+    BriefingService.shutdown()
+    TrendingStocksFetcher.shutdown()
+    executor.shutdown()
+    # 업스트림 연결 풀 종료
+    yahoo_client.close()
+
 
 app = FastAPI(
     title="Stock Analysis API",
     description="FastAPI backend for stock analysis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -23,10 +61,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 응답 시간, 처리 중인 요청 수 측정 (/metrics 제외)
+app.add_middleware(MetricsMiddleware, registry=metrics)
+
+# 업스트림 호출 에러 처리
+@app.exception_handler(UpstreamTimeoutError)
+async def upstream_timeout_handler(request: Request, exc: UpstreamTimeoutError):
+    """업스트림 응답 지연 시 504 반환"""
+    return JSONResponse(
+        status_code=504,
+        content={"detail": f"외부 데이터 조회 시간이 초과되었습니다. {exc}"}
+    )
+
+
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable_handler(request: Request, exc: UpstreamUnavailableError):
+    """업스트림 차단 중이거나 재시도를 모두 실패했을 때 503 반환"""
+    headers = {"Retry-After": str(max(1, int(exc.retry_after)))} if exc.retry_after else None
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"외부 데이터를 일시적으로 조회할 수 없습니다. {exc}"},
+        headers=headers
+    )
+
+
+@app.exception_handler(ClientDisconnectedError)
+async def client_disconnected_handler(request: Request, exc: ClientDisconnectedError):
+    """클라이언트 연결 종료 시 응답 없이 종료 (499: Client Closed Request)"""
+    return Response(status_code=499)
+
+
 # 라우터 등록
 app.include_router(stocks_router)
 app.include_router(stocks_api_router)
 app.include_router(briefing_router)
+app.include_router(stream_router)
 
 
 @app.get("/")
@@ -44,6 +113,53 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/upstream")
+async def upstream_health():
+    """업스트림 호출 상태 (차단기 상태, 호출 한도, 작업별 호출/재시도/차단 통계, 묶음 처리 통계, 연결 풀 상태)"""
+    return {
+        **upstream.stats(),
+        "batching": StockService.dispatcher_stats(),
+        "client": yahoo_client.stats()
+    }
+
+
+def _metric_gauges():
+    """조회 시점에 계산하는 지표 (처리 중 요청, 업스트림 관문/캐시/묶음 처리 통계)"""
+    yield "http_requests_in_flight", "gauge", (), metrics.in_flight
+
+    stats = upstream.stats()
+    for state in ("closed", "open", "half_open"):
+        yield "upstream_circuit_state", "gauge", (("state", state),), int(stats["circuit"]["state"] == state)
+    yield "upstream_circuit_opened_total", "counter", (), stats["circuit"]["opened"]
+    for operation, counts in stats["operations"].items():
+        labels = (("operation", operation),)
+        for name in ("calls", "successes", "failures", "retries", "rejected", "rate_limited", "stale_served"):
+            yield f"upstream_{name}_total", "counter", labels, counts[name]
+        yield "upstream_throttle_wait_seconds_total", "counter", labels, counts["throttle_wait"]
+
+    cache = StockService.cache.stats()
+    yield "stock_cache_hits_total", "counter", (), cache["hits"]
+    yield "stock_cache_misses_total", "counter", (), cache["misses"]
+    yield "stock_cache_hit_ratio", "gauge", (), cache["hit_ratio"]
+    yield "stock_cache_entries", "gauge", (), cache["size"]
+    yield "stock_cache_evictions_total", "counter", (), cache["evictions"]
+
+    for modules, batching in StockService.dispatcher_stats().items():
+        labels = (("modules", modules),)
+        yield "upstream_batch_requests_total", "counter", labels, batching["requests"]
+        yield "upstream_batches_total", "counter", labels, batching["batches"]
+        yield "upstream_batch_deduplicated_total", "counter", labels, batching["deduplicated"]
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus 텍스트 형식 지표 (라우트별/업스트림 모듈별 응답 시간 히스토그램, 처리 중 요청, 캐시 적중률 등)"""
+    return Response(
+        content=metrics.render(_metric_gauges()),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
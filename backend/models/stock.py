@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -33,6 +33,22 @@ class StockQuote(BaseModel):
     price: StockPrice
 
 
+class StockQuoteBatch(BaseModel):
+    """복수 종목 종합 정보 조회 결과"""
+    quotes: Dict[str, StockQuote] = Field(default_factory=dict, description="심볼별 종합 정보 (요청 순서 유지)")
+    errors: Dict[str, str] = Field(default_factory=dict, description="심볼별 조회 실패 사유")
+
+
+class BatchQuoteRequest(BaseModel):
+    """복수 종목 일괄 조회 요청 모델"""
+    symbols: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="조회할 종목 심볼 목록 (최대 50개)"
+    )
+
+
 class HistoricalDataPoint(BaseModel):
     """과거 데이터 포인트"""
     date: str = Field(..., description="날짜")
@@ -50,16 +66,92 @@ class HistoricalData(BaseModel):
     data: list[HistoricalDataPoint] = Field(..., description="과거 데이터 목록")
 
 
+class HistoricalColumns(BaseModel):
+    """과거 데이터 응답 모델 (열 단위, 필드별 병렬 배열)"""
+    symbol: str = Field(..., description="주식 심볼")
+    period: str = Field(..., description="조회 기간")
+    date: list[str] = Field(default_factory=list, description="날짜 목록")
+    open: list[Optional[float]] = Field(default_factory=list, description="시가 목록")
+    high: list[Optional[float]] = Field(default_factory=list, description="고가 목록")
+    low: list[Optional[float]] = Field(default_factory=list, description="저가 목록")
+    close: list[Optional[float]] = Field(default_factory=list, description="종가 목록")
+    volume: list[Optional[int]] = Field(default_factory=list, description="거래량 목록")
+
+
 class RankedStockQuote(BaseModel):
     """순위가 포함된 주식 종합 정보"""
     rank: int = Field(..., description="순위")
     quote: StockQuote = Field(..., description="주식 종합 정보")
 
 
+class ScoreBreakdown(BaseModel):
+    """복합 점수 구성"""
+    volume_score: float = Field(..., description="거래량 순위 점수 (0-100)")
+    change_score: float = Field(..., description="상승률 점수 (0-100)")
+    appearance_bonus: float = Field(..., description="출현 빈도 보너스 (스크리너 1개 추가 출현당 15점)")
+
+
+class TrendingStock(BaseModel):
+    """복합 점수 기준 화제 종목"""
+    rank: int = Field(..., description="순위")
+    symbol: str = Field(..., description="주식 심볼")
+    name: Optional[str] = Field(None, description="회사명")
+    price: Optional[float] = Field(None, description="현재가")
+    change_percent: Optional[float] = Field(None, description="변동률 (%)")
+    change_amount: Optional[float] = Field(None, description="가격 변동")
+    volume: Optional[int] = Field(None, description="거래량")
+    market_cap: Optional[float] = Field(None, description="시가총액")
+    composite_score: float = Field(..., description="복합 점수")
+    score_breakdown: ScoreBreakdown = Field(..., description="복합 점수 구성")
+    sources: List[str] = Field(default_factory=list, description="출현한 스크리너 목록")
+    sector: Optional[str] = Field(None, description="섹터")
+
+
+class TrendingMarketSummary(BaseModel):
+    """화제 종목 수집 요약"""
+    total_collected: int = Field(..., description="스크리너에서 수집한 전체 행 수")
+    filtered_count: int = Field(..., description="필터링 후 종목 수")
+    collection_time: str = Field(..., description="수집 시각 (UTC)")
+    market_status: Optional[str] = Field(None, description="시장 상태 (open, closed 등)")
+    last_trading_date: Optional[str] = Field(None, description="마지막 거래일")
+
+
+class TrendingStocksResult(BaseModel):
+    """화제 종목 목록 조회 결과"""
+    trending_stocks: List[TrendingStock] = Field(default_factory=list, description="화제 종목 목록")
+    market_summary: TrendingMarketSummary = Field(..., description="수집 요약")
+
+
+class TopTrendingStock(TrendingStock):
+    """TOP 1 화제 종목 (브리핑 메인 종목용 상세 정보 포함)"""
+    avg_volume: Optional[int] = Field(None, description="3개월 평균 거래량")
+    volume_ratio: Optional[float] = Field(None, description="평균 대비 거래량 배율")
+    industry: Optional[str] = Field(None, description="산업")
+    selection_reason: str = Field(..., description="선정 사유")
+
+
+class TrendingAlternative(BaseModel):
+    """TOP 1 후보 종목"""
+    rank: int = Field(..., description="순위")
+    symbol: str = Field(..., description="주식 심볼")
+    composite_score: float = Field(..., description="복합 점수")
+
+
+class TopTrendingStockResult(BaseModel):
+    """TOP 1 화제 종목 조회 결과"""
+    top_stock: TopTrendingStock = Field(..., description="복합 점수 최상위 종목")
+    alternatives: List[TrendingAlternative] = Field(default_factory=list, description="차순위 후보 종목")
+
+
 class BriefingRequest(BaseModel):
     """브리핑 생성 요청 모델"""
     ticker: str = Field(..., description="주식 티커 심볼 (예: TSLA, AAPL)")
     type: str = Field(default="most_actives", description="브리핑 타입")
+    format: str = Field(
+        default="markdown",
+        pattern="^(markdown|html|text)$",
+        description="출력 형식 (markdown, html, text)"
+    )
 
 
 class BriefingResponse(BaseModel):
@@ -67,7 +159,79 @@ class BriefingResponse(BaseModel):
     ticker: str = Field(..., description="주식 티커 심볼")
     type: str = Field(..., description="브리핑 타입")
     generated_at: str = Field(..., description="생성 시각")
-    content: str = Field(..., description="브리핑 마크다운 콘텐츠")
+    format: str = Field(default="markdown", description="출력 형식")
+    content: str = Field(..., description="브리핑 콘텐츠")
+    content_hash: Optional[str] = Field(None, description="입력 데이터 해시 (ETag, 저장된 브리핑 조회 키)")
+
+
+class BriefingBatchRequest(BaseModel):
+    """브리핑 일괄 생성 요청 모델"""
+    tickers: Optional[List[str]] = Field(
+        None,
+        max_length=20,
+        description="브리핑할 종목 목록 (생략 시 화제 종목 상위 top_n개 자동 선정)"
+    )
+    type: str = Field(default="most_actives", description="브리핑 타입 (tickers 지정 시 모든 종목에 적용)")
+    top_n: int = Field(default=5, ge=1, le=20, description="자동 선정 종목 수")
+    format: str = Field(
+        default="markdown",
+        pattern="^(markdown|html|text)$",
+        description="출력 형식 (markdown, html, text)"
+    )
+
+
+class BriefingBatchItem(BaseModel):
+    """종목별 브리핑 생성 결과"""
+    ticker: str = Field(..., description="주식 티커 심볼")
+    type: str = Field(..., description="브리핑 타입")
+    content: Optional[str] = Field(None, description="브리핑 콘텐츠 (실패 시 None)")
+    error: Optional[str] = Field(None, description="실패 사유")
+    content_hash: Optional[str] = Field(None, description="입력 데이터 해시 (저장된 브리핑 조회 키)")
+    elapsed_ms: float = Field(..., description="작성 소요 시간 (ms, 일괄 조회 제외)")
+
+
+class BriefingBatchResponse(BaseModel):
+    """브리핑 일괄 생성 결과 (매니페스트)"""
+    generated_at: str = Field(..., description="생성 시각")
+    succeeded: int = Field(..., description="성공한 브리핑 수")
+    failed: int = Field(..., description="실패한 브리핑 수")
+    prefetch_ms: float = Field(..., description="종합 정보/과거 데이터 일괄 조회 소요 시간 (ms)")
+    total_ms: float = Field(..., description="전체 소요 시간 (ms)")
+    briefings: List[BriefingBatchItem] = Field(default_factory=list, description="종목별 결과 (요청 순서)")
+
+
+class BriefingReportRequest(BaseModel):
+    """Word 브리핑 보고서 생성 요청 모델"""
+    tickers: Optional[List[str]] = Field(
+        None,
+        max_length=20,
+        description="보고서에 포함할 종목 목록 (생략 시 화제 종목 상위 top_n개 자동 선정)"
+    )
+    type: str = Field(default="most_actives", description="브리핑 타입 (tickers 지정 시 모든 종목에 적용)")
+    top_n: int = Field(default=5, ge=1, le=20, description="자동 선정 종목 수")
+    subscriber: Optional[str] = Field(None, max_length=50, description="구독자 이름 (지정 시 인사말 추가)")
+
+
+class BriefingJobStep(BaseModel):
+    """브리핑 작업 단계별 진행 상태"""
+    name: str = Field(..., description="단계 이름 (stock_selection, data_collection, content_generation)")
+    status: str = Field(default="pending", description="단계 상태 (pending, running, completed, skipped, failed)")
+    completed_at: Optional[str] = Field(None, description="완료 시각")
+
+
+class BriefingJob(BaseModel):
+    """브리핑 생성 작업 상태"""
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued, running, completed, failed)")
+    request: BriefingBatchRequest = Field(..., description="작업 요청")
+    created_at: str = Field(..., description="접수 시각")
+    started_at: Optional[str] = Field(None, description="시작 시각")
+    finished_at: Optional[str] = Field(None, description="종료 시각")
+    progress_percent: int = Field(default=0, description="진행률 (%)")
+    steps: List[BriefingJobStep] = Field(default_factory=list, description="단계별 진행 상태")
+    error: Optional[str] = Field(None, description="실패 사유")
+    status_url: str = Field(..., description="상태 조회 경로")
+    result_url: str = Field(..., description="결과 조회 경로")
 
 
 class ErrorResponse(BaseModel):
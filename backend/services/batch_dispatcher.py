@@ -0,0 +1,123 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List
+
+
+class BatchDispatcher:
+    """
+    단건 조회 묶음 처리기 (DataLoader 방식)
+
+    짧은 시간(window) 동안 들어온 단건 조회 요청을 모아 한 번의 일괄 조회로 처리하고,
+    요청마다 자기 키의 결과를 돌려받습니다.
+    - 묶음의 첫 요청 스레드가 window만큼 기다린 뒤 모인 키를 일괄 조회 (별도 스레드 없음)
+    - 묶음이 max_batch에 도달하면 기다리지 않고 바로 조회
+    - 대기 중이거나 조회 중인 키를 다시 요청하면 같은 결과를 공유
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Hashable]], Dict[Hashable, Any]],
+        window: float = 0.005,
+        max_batch: int = 50
+    ):
+        """
+        Args:
+            batch_fn: 키 목록을 받아 키별 결과를 반환하는 일괄 조회 함수
+                      (결과에 없는 키는 None, 예외 객체인 값은 해당 키의 요청에서 발생)
+            window: 요청을 모으는 시간 (초, 0이면 묶지 않고 바로 조회)
+            max_batch: 한 번에 조회할 최대 키 수
+        """
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.requests = 0
+        self.deduplicated = 0
+        self._futures: Dict[Hashable, Future] = {}
+        self._pending: List[Hashable] = []
+        self._collecting = False
+        self._lock = threading.Lock()
+
+    def load(self, key: Hashable) -> Any:
+        """
+        키 한 개 조회 (같은 묶음의 다른 요청과 함께 일괄 조회될 때까지 대기)
+
+        Args:
+            key: 조회 키
+
+        Returns:
+            Any: 키의 조회 결과 (없으면 None)
+        """
+        batch = None
+        leader = False
+        with self._lock:
+            self.requests += 1
+            future = self._futures.get(key)
+            if future is not None:
+                self.deduplicated += 1
+            else:
+                future = Future()
+                self._futures[key] = future
+                self._pending.append(key)
+                if len(self._pending) >= self.max_batch or self.window <= 0:
+                    batch = self._take()
+                elif not self._collecting:
+                    self._collecting = leader = True
+
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                batch = self._take()
+
+        if batch:
+            self._dispatch(batch)
+        return future.result()
+
+    def _take(self) -> List[Hashable]:
+        """대기 중인 키를 꺼내고 새 묶음 시작 (잠금을 잡은 상태에서 호출)"""
+        batch = self._pending
+        self._pending = []
+        self._collecting = False
+        return batch
+
+    def _dispatch(self, batch: List[Hashable]) -> None:
+        with self._lock:
+            self.batches += 1
+            futures = [(key, self._futures[key]) for key in batch]
+
+        try:
+            results = self.batch_fn(batch)
+        except BaseException as e:
+            results = {key: e for key in batch}
+        finally:
+            # 결과를 전달하기 전에 키를 비워야 이후 요청이 끝난 조회를 공유하지 않음
+            with self._lock:
+                for key, future in futures:
+                    if self._futures.get(key) is future:
+                        del self._futures[key]
+
+        for key, future in futures:
+            value = results.get(key)
+            if isinstance(value, BaseException):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        묶음 처리 통계 조회
+
+        Returns:
+            Dict: 요청 수, 일괄 조회 수, 중복 병합 수, 일괄 조회당 평균 키 수
+        """
+        with self._lock:
+            requests, batches, deduplicated = self.requests, self.batches, self.deduplicated
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "requests": requests,
+            "batches": batches,
+            "deduplicated": deduplicated,
+            "keys_per_batch": round((requests - deduplicated) / batches, 2) if batches else 0.0,
+        }
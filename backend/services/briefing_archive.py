@@ -0,0 +1,207 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from models.stock import StockQuote, HistoricalData, BriefingResponse
+from services import briefing_templates
+
+
+class BriefingArchive:
+    """
+    입력 데이터 해시 기반 브리핑 저장소 (content-addressed)
+
+    브리핑은 (티커, 타입, 형식, 종합 정보, 5일 종가, 템플릿) 해시를 키로 저장됩니다.
+    입력이 같으면 다시 렌더링하지 않고 저장된 콘텐츠와 최초 생성 시각을 그대로 응답하며,
+    키는 응답의 ETag로도 사용됩니다.
+
+    항목마다 JSON 파일 하나로 저장하고, 최근 사용 항목은 메모리에도 보관합니다.
+    보관 기간(max_age)이 지나거나 최대 항목 수를 넘으면 오래된 파일부터 삭제합니다.
+    """
+
+    # 일정 횟수의 저장마다 보관 정책 적용
+    PRUNE_INTERVAL = 50
+
+    def __init__(
+        self,
+        directory: str,
+        max_entries: int = 5000,
+        max_age: float = 30 * 24 * 60 * 60,
+        memory_size: int = 256
+    ):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.memory_size = memory_size
+        self.hits = 0
+        self.misses = 0
+        # 키 → (파일 저장 시각, 브리핑) (메모리 항목에도 파일과 같은 보관 기간 적용)
+        self._memory: "OrderedDict[str, Tuple[float, BriefingResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        ticker: str,
+        briefing_type: str,
+        output_format: str,
+        quote: StockQuote,
+        historical: Optional[HistoricalData] = None
+    ) -> str:
+        """
+        브리핑 입력 데이터 해시
+
+        Args:
+            ticker: 주식 티커 심볼
+            briefing_type: 브리핑 타입
+            output_format: 출력 형식
+            quote: 종목 종합 정보
+            historical: 최근 5일 과거 데이터
+
+        Returns:
+            str: 32자리 16진수 해시
+        """
+        closes = [(point.date, point.close) for point in historical.data] if historical else []
+        payload = json.dumps(
+            {
+                "ticker": ticker,
+                "type": briefing_type,
+                "format": output_format,
+                "template": briefing_templates.TEMPLATE_DIGEST,
+                "info": quote.info.model_dump(),
+                "price": quote.price.model_dump(),
+                "closes": closes,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _remember(self, key: str, briefing: BriefingResponse, written_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (written_at, briefing)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[BriefingResponse]:
+        """
+        저장된 브리핑 조회
+
+        Args:
+            key: 입력 데이터 해시
+
+        Returns:
+            BriefingResponse: 저장된 브리핑 또는 None (없거나 보관 기간이 지난 경우)
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if time.time() - entry[0] <= self.max_age:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                # 보관 기간이 지난 항목은 파일 기준으로 다시 확인 (다른 프로세스가 새로 저장했을 수 있음)
+                del self._memory[key]
+
+        briefing = None
+        path = self._path(key)
+        try:
+            written_at = os.path.getmtime(path)
+            if time.time() - written_at <= self.max_age:
+                with open(path, "r", encoding="utf-8") as f:
+                    briefing = BriefingResponse.model_validate_json(f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error loading archived briefing {key}: {str(e)}")
+
+        if briefing is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        self._remember(key, briefing, written_at)
+        with self._lock:
+            self.hits += 1
+        return briefing
+
+    def put(self, key: str, briefing: BriefingResponse) -> None:
+        """
+        브리핑 저장 (임시 파일에 쓴 뒤 교체하여 다른 프로세스가 불완전한 파일을 읽지 않도록 함)
+
+        Args:
+            key: 입력 데이터 해시
+            briefing: 저장할 브리핑
+        """
+        self._remember(key, briefing, time.time())
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".json.tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(briefing.model_dump_json())
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.PRUNE_INTERVAL == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        보관 정책 적용 (보관 기간이 지난 항목과 최대 항목 수 초과분을 오래된 순으로 삭제)
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except FileNotFoundError:
+                        continue
+        entries.sort(reverse=True)
+
+        cutoff = time.time() - self.max_age
+        removed = 0
+        for index, (mtime, path) in enumerate(entries):
+            if index < self.max_entries and mtime >= cutoff:
+                continue
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+        if removed:
+            # 메모리에 남은 항목도 다음 조회 시 파일 기준으로 다시 확인
+            with self._lock:
+                self._memory.clear()
+        return removed
+
+
+# 앱 전역 브리핑 저장소
+briefing_archive = BriefingArchive(
+    os.getenv(
+        "BRIEFING_ARCHIVE_DIR",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "briefings")
+    ),
+    max_entries=int(os.getenv("BRIEFING_ARCHIVE_MAX_ENTRIES", "5000")),
+    max_age=float(os.getenv("BRIEFING_ARCHIVE_MAX_AGE_DAYS", "30")) * 24 * 60 * 60
+)
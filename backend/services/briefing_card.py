@@ -0,0 +1,339 @@
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, wraps
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from models.stock import StockQuote
+from services import briefing_templates
+
+
+# 카드 크기 (output/images/briefing-card-template.html 기준 CSS 픽셀) 및 배율
+WIDTH = 1200
+HEIGHT = 630
+SCALE = int(os.getenv("BRIEFING_CARD_SCALE", "2"))
+
+# 색상 (템플릿 CSS와 동일)
+BACKGROUND_FROM = (0x1a, 0x1a, 0x2e)
+BACKGROUND_TO = (0x16, 0x21, 0x3e)
+ACCENT = (0x00, 0xff, 0x88)
+ACCENT_DARK = (0x00, 0xcc, 0x70)
+DOWN = (0xff, 0x4d, 0x6d)
+WHITE = (0xff, 0xff, 0xff)
+MUTED = (0x88, 0x99, 0xaa)
+TICKER = (0x66, 0x88, 0xaa)
+TAGLINE = (0x55, 0x66, 0x77)
+
+# 폰트 후보 (BRIEFING_CARD_FONT_REGULAR/BOLD로 지정하지 않으면 처음 발견한 파일 사용)
+FONT_CANDIDATES = {
+    'regular': [
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/truetype/noto/NotoSansKR-Regular.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "C:/Windows/Fonts/malgun.ttf",
+        "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    ],
+    'bold': [
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/truetype/noto/NotoSansKR-Bold.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf",
+        "C:/Windows/Fonts/malgunbd.ttf",
+        "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    ],
+}
+
+# 레이아웃 (CSS 픽셀, 템플릿의 여백을 630px 높이 안에 모두 들어가도록 조정)
+PADDING = 60
+MAIN_BOX = (60, 150, 1140, 470)
+INFO_BOXES = ((100, 345, 590, 440), (610, 345, 1100, 440))
+FOOTER_Y = 540
+
+# PNG 압축 수준
+PNG_COMPRESS_LEVEL = 6
+
+# 고정 팔레트 구성 (배경 색상 수 + 글자색별 배경→글자색 단계 수, 합계 256 이하)
+PALETTE_BACKGROUND_COLORS = 136
+PALETTE_RAMP_STEPS = 20
+
+
+# 공용 리소스(폰트 경로, 배경, 팔레트) 생성 잠금 (배경을 그리는 중에 폰트를 조회하므로 재진입 가능)
+_build_lock = threading.RLock()
+
+
+def _build_once(func):
+    """
+    인자별로 한 번만 만들어 보관
+
+    lru_cache는 동시에 처음 호출한 스레드가 각자 값을 만들므로,
+    잠금 안에서 다시 확인하여 카드 작성 풀이나 동시 요청에서도 한 번만 생성합니다.
+    """
+    results = {}
+
+    @wraps(func)
+    def wrapper(*args):
+        if args in results:
+            return results[args]
+        with _build_lock:
+            if args not in results:
+                results[args] = func(*args)
+            return results[args]
+    return wrapper
+
+
+def _px(value: float) -> int:
+    return int(round(value * SCALE))
+
+
+@_build_once
+def _font_path(weight: str) -> Optional[str]:
+    configured = os.getenv(f"BRIEFING_CARD_FONT_{weight.upper()}")
+    if configured:
+        return configured
+    for path in FONT_CANDIDATES[weight]:
+        if os.path.exists(path):
+            return path
+    print(f"Warning: no Korean {weight} font found for briefing cards, using Pillow default font")
+    return None
+
+
+@lru_cache(maxsize=None)
+def font(weight: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    폰트 로드 (굵기/크기별로 한 번만 읽어 캐시)
+
+    Args:
+        weight: regular 또는 bold
+        size: CSS 픽셀 크기 (배율은 내부에서 적용)
+    """
+    path = _font_path(weight)
+    if path is None:
+        return ImageFont.load_default(_px(size))
+    return ImageFont.truetype(path, _px(size))
+
+
+def _draw_spaced(draw: ImageDraw.ImageDraw, xy: Tuple[float, float], text: str,
+                 text_font: ImageFont.FreeTypeFont, fill, spacing: float) -> None:
+    """자간(letter-spacing)을 적용하여 텍스트 그리기 (짧은 라벨용)"""
+    x, y = _px(xy[0]), _px(xy[1])
+    for char in text:
+        draw.text((x, y), char, font=text_font, fill=fill)
+        x += draw.textlength(char, font=text_font) + _px(spacing)
+
+
+def _fit(draw: ImageDraw.ImageDraw, text: str, weight: str, size: int, max_width: float) -> ImageFont.FreeTypeFont:
+    """최대 너비 안에 들어가도록 글자 크기를 줄인 폰트"""
+    while size > 12 and draw.textlength(text, font=font(weight, size)) > _px(max_width):
+        size -= 4
+    return font(weight, size)
+
+
+@_build_once
+def background() -> Image.Image:
+    """
+    정적 배경 레이어 (한 번만 그려서 캐시, 카드마다 복사해서 사용)
+
+    그라데이션, 격자 무늬, 상단 강조선, 박스, 고정 문구를 포함합니다.
+    """
+    width, height = _px(WIDTH), _px(HEIGHT)
+
+    # 135도 선형 그라데이션
+    y, x = np.mgrid[0:height, 0:width]
+    t = ((x / width + y / height) / 2)[..., None]
+    gradient = np.asarray(BACKGROUND_FROM) * (1 - t) + np.asarray(BACKGROUND_TO) * t
+    card = Image.fromarray(gradient.astype(np.uint8), "RGB").convert("RGBA")
+
+    overlay = Image.new("RGBA", card.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+
+    # 오른쪽 격자 무늬 (400px, 40px 간격)
+    grid_color = (*ACCENT, 4)
+    for gx in range(WIDTH - 400, WIDTH, 40):
+        draw.line([(_px(gx), 0), (_px(gx), height)], fill=grid_color, width=_px(1))
+    for gy in range(0, HEIGHT, 40):
+        draw.line([(_px(WIDTH - 400), _px(gy)), (width, _px(gy))], fill=grid_color, width=_px(1))
+
+    # 메인 박스와 정보 박스
+    draw.rounded_rectangle([_px(v) for v in MAIN_BOX], radius=_px(20),
+                           fill=(255, 255, 255, 8), outline=(255, 255, 255, 26), width=_px(1))
+    draw.rounded_rectangle([_px(v) for v in INFO_BOXES[0]], radius=_px(12),
+                           fill=(0, 0, 0, 77), outline=(255, 255, 255, 13), width=_px(1))
+    draw.rounded_rectangle([_px(v) for v in INFO_BOXES[1]], radius=_px(12),
+                           fill=(*ACCENT, 20), outline=(*ACCENT, 51), width=_px(1))
+
+    # 고정 문구
+    draw.text((_px(PADDING), _px(52)), "당신이 잠든 사이", font=font('bold', 42), fill=WHITE)
+    draw.text((_px(PADDING), _px(110)), "While You Were Sleeping", font=font('regular', 18), fill=MUTED)
+    _draw_spaced(draw, (MAIN_BOX[0] + 40, MAIN_BOX[1] + 32), "TODAY'S HOT STOCK", font('bold', 16), MUTED, 2)
+    for (left, top, _, _), label in zip(INFO_BOXES, ("SELECTION CRITERIA", "SECTOR")):
+        _draw_spaced(draw, (left + 25, top + 20), label, font('bold', 14), TICKER, 1)
+    draw.text((_px(PADDING), _px(FOOTER_Y)), "AI-Powered Investment Intelligence",
+              font=font('regular', 14), fill=TAGLINE)
+    branding_font = font('bold', 16)
+    branding_width = draw.textlength("MARKET BRIEFING", font=branding_font)
+    branding_x = _px(WIDTH - PADDING) - branding_width
+    draw.text((branding_x, _px(FOOTER_Y - 1)), "MARKET BRIEFING", font=branding_font, fill=MUTED)
+    dot_x, dot_y = branding_x - _px(18), _px(FOOTER_Y + 6)
+    draw.ellipse([dot_x, dot_y, dot_x + _px(8), dot_y + _px(8)], fill=ACCENT)
+
+    card = Image.alpha_composite(card, overlay)
+
+    # 상단 강조선 (4px 가로 그라데이션)
+    bar = np.linspace(ACCENT, ACCENT_DARK, width).astype(np.uint8)
+    card.paste(Image.fromarray(np.repeat(bar[None, :, :], _px(4), axis=0), "RGB"), (0, 0))
+
+    # 모서리 라운드 (24px)
+    mask = Image.new("L", card.size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle([0, 0, width - 1, height - 1], radius=_px(24), fill=255)
+    result = Image.new("RGB", card.size, (0, 0, 0))
+    result.paste(card.convert("RGB"), mask=mask)
+    return result
+
+
+@_build_once
+def palette() -> Image.Image:
+    """
+    카드 공용 256색 팔레트 (한 번만 만들어 캐시)
+
+    배경 레이어의 대표 색상과, 배경색에서 각 글자색까지의 단계(안티앨리어싱 경계용)로 구성합니다.
+    카드를 팔레트 이미지로 변환하면 PNG 인코딩이 RGB보다 훨씬 빠르고 파일도 작아집니다.
+    """
+    base = background().quantize(PALETTE_BACKGROUND_COLORS, method=Image.Quantize.MEDIANCUT)
+    colors = base.getpalette()[:PALETTE_BACKGROUND_COLORS * 3]
+
+    # 배경 중간색 → 글자색 (6색 × 19단계 + 배경 136색 = 250색)
+    start = (np.asarray(BACKGROUND_FROM) + np.asarray(BACKGROUND_TO)) / 2
+    ramp = np.linspace(0, 1, PALETTE_RAMP_STEPS)[1:, None]
+    for color in (WHITE, MUTED, TICKER, ACCENT, DOWN, TAGLINE):
+        steps = start * (1 - ramp) + np.asarray(color) * ramp
+        colors.extend(int(v) for v in steps.round().astype(int).ravel())
+
+    result = Image.new("P", (1, 1))
+    result.putpalette(colors + [0] * (256 * 3 - len(colors)))
+    return result
+
+
+def warm() -> None:
+    """배경과 팔레트(폰트 포함)를 미리 생성 (앱 시작 시 백그라운드에서, 일괄 작성 전에 호출)"""
+    try:
+        palette()
+    except Exception as e:
+        print(f"Error preparing briefing card background: {str(e)}")
+
+
+def _change_text(quote: StockQuote) -> Tuple[str, tuple, int]:
+    """(변동률 문자열, 색상, 방향) — 방향은 1 상승, -1 하락, 0 보합"""
+    change_percent = quote.price.change_percent or 0
+    if change_percent > 0:
+        return f"+{change_percent:.1f}%", ACCENT, 1
+    if change_percent < 0:
+        return f"{change_percent:.1f}%", DOWN, -1
+    return "0.0%", MUTED, 0
+
+
+def render_card(
+    quote: StockQuote,
+    briefing_type: str = "most_actives",
+    date: Optional[datetime] = None,
+    selection: Optional[str] = None
+) -> bytes:
+    """
+    브리핑 카드 PNG 렌더링 (1200×630, SCALE 배율)
+
+    Args:
+        quote: 종목 종합 정보
+        briefing_type: 브리핑 타입 (선정 기준 문구에 사용)
+        date: 카드 날짜 (기본값: 오늘)
+        selection: 선정 기준 문구 (기본값: 브리핑 타입 제목)
+
+    Returns:
+        bytes: PNG 이미지
+    """
+    card = background().copy()
+    draw = ImageDraw.Draw(card)
+    left, top, right, _ = MAIN_BOX
+
+    # 날짜 배지
+    date_text = (date or datetime.now()).strftime("%Y.%m.%d")
+    date_font = font('bold', 28)
+    date_width = draw.textlength(date_text, font=date_font) / SCALE
+    box = (WIDTH - PADDING - date_width - 48, 58, WIDTH - PADDING, 58 + 62)
+    draw.rounded_rectangle([_px(v) for v in box], radius=_px(12),
+                           fill=(0x24, 0x2a, 0x42), outline=(0x33, 0x3b, 0x52), width=_px(1))
+    draw.text((_px(box[0] + 24), _px(box[1] + 12)), date_text, font=date_font, fill=MUTED)
+
+    # 변동률 (오른쪽 정렬, 글로우 포함)
+    change_text, change_color, direction = _change_text(quote)
+    change_font = font('bold', 64)
+    change_width = draw.textlength(change_text, font=change_font)
+    change_x, change_y = _px(right - 40) - change_width, _px(top + 62)
+    glow_box = (int(change_x) - _px(80), change_y - _px(20), _px(right - 20), change_y + _px(100))
+    glow = Image.new("RGBA", (glow_box[2] - glow_box[0], glow_box[3] - glow_box[1]), (0, 0, 0, 0))
+    ImageDraw.Draw(glow).text((change_x - glow_box[0], change_y - glow_box[1]), change_text,
+                              font=change_font, fill=(*change_color, 90))
+    glow = glow.filter(ImageFilter.GaussianBlur(_px(12)))
+    card.paste(glow, glow_box[:2], glow)
+    draw.text((change_x, change_y), change_text, font=change_font, fill=change_color)
+
+    # 방향 삼각형
+    if direction:
+        tx, ty = change_x - _px(68), change_y + _px(22)
+        if direction > 0:
+            points = [(tx, ty + _px(36)), (tx + _px(48), ty + _px(36)), (tx + _px(24), ty)]
+        else:
+            points = [(tx, ty), (tx + _px(48), ty), (tx + _px(24), ty + _px(36))]
+        draw.polygon(points, fill=change_color)
+    name_width = (change_x - _px(100)) / SCALE - (left + 40)
+
+    # 회사명, 티커
+    info = quote.info
+    name = (info.name or info.symbol).upper()
+    draw.text((_px(left + 40), _px(top + 58)), name,
+              font=_fit(draw, name, 'bold', 64, name_width), fill=WHITE)
+    draw.text((_px(left + 40), _px(top + 138)), info.symbol, font=font('bold', 30), fill=TICKER)
+
+    # 선정 기준, 섹터
+    values = (
+        selection or briefing_templates.TYPE_TITLES.get(briefing_type, briefing_templates.DEFAULT_TYPE_TITLE),
+        info.sector or info.industry or "N/A",
+    )
+    for (box_left, box_top, box_right, _), value, color in zip(INFO_BOXES, values, (WHITE, ACCENT)):
+        value_font = _fit(draw, value, 'bold', 24, box_right - box_left - 50)
+        draw.text((_px(box_left + 25), _px(box_top + 44)), value, font=value_font, fill=color)
+
+    # 고정 팔레트로 변환 후 인코딩 (RGB PNG 인코딩이 렌더링 시간 대부분을 차지함)
+    buffer = io.BytesIO()
+    card.quantize(palette=palette(), dither=Image.Dither.NONE).save(
+        buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL
+    )
+    return buffer.getvalue()
+
+
+def render_cards(
+    items: Iterable[Tuple[StockQuote, str]],
+    date: Optional[datetime] = None,
+    max_workers: int = 4
+) -> List[bytes]:
+    """
+    여러 카드 일괄 렌더링 (배경과 폰트를 공유하며 스레드 풀에서 동시에 작성)
+
+    Args:
+        items: (종목 종합 정보, 브리핑 타입) 목록
+        date: 카드 날짜 (기본값: 오늘)
+        max_workers: 동시 작성 수
+
+    Returns:
+        List[bytes]: 입력 순서대로 PNG 이미지
+    """
+    items = list(items)
+    date = date or datetime.now()
+    warm()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items) or 1)),
+                            thread_name_prefix="briefing-card") as pool:
+        return list(pool.map(lambda item: render_card(item[0], item[1], date), items))
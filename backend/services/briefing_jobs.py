@@ -0,0 +1,502 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from models.stock import (
+    BriefingBatchRequest,
+    BriefingBatchResponse,
+    BriefingJob,
+    BriefingJobStep
+)
+from services.briefing_service import BriefingService
+
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+FINISHED_STATUSES = (COMPLETED, FAILED)
+
+# 작업 단계 (종목을 지정한 작업은 stock_selection을 건너뜀)
+STEPS = ("stock_selection", "data_collection", "content_generation")
+
+
+class QueueFullError(Exception):
+    """대기 중인 작업 수가 한도를 넘음"""
+
+
+class JobStore(ABC):
+    """
+    작업 저장소 인터페이스
+
+    작업 상태(자주 조회)와 결과(완료 후 한 번 조회)를 따로 저장합니다.
+    """
+
+    @abstractmethod
+    def save_job(self, job: BriefingJob) -> None:
+        """작업 상태 저장"""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[BriefingJob]:
+        """작업 상태 조회"""
+
+    @abstractmethod
+    def find_unfinished(self, dedupe_key: str) -> Optional[BriefingJob]:
+        """중복 제거 키가 같은 미완료 작업 조회"""
+
+    @abstractmethod
+    def create_job(self, job: BriefingJob, dedupe_key: str) -> Tuple[BriefingJob, bool]:
+        """
+        새 작업 저장 (같은 키의 미완료 작업이 있으면 저장하지 않음)
+
+        조회와 저장을 한 번에 처리하므로 동시에 들어온 같은 요청 중 하나만 작업으로 등록됩니다.
+
+        Args:
+            job: 새 작업
+            dedupe_key: 중복 제거 키
+
+        Returns:
+            Tuple[BriefingJob, bool]: (작업, 새로 저장했는지 여부 — 기존 작업이면 False)
+        """
+
+    @abstractmethod
+    def save_result(self, job_id: str, result: BriefingBatchResponse) -> None:
+        """완료된 작업 결과 저장"""
+
+    @abstractmethod
+    def get_result(self, job_id: str) -> Optional[BriefingBatchResponse]:
+        """완료된 작업 결과 조회"""
+
+    def interrupt_unfinished(self) -> int:
+        """
+        이전 프로세스에서 끝나지 않은 작업을 실패로 표시 (시작 시 호출)
+
+        Returns:
+            int: 실패로 표시한 작업 수
+        """
+        return 0
+
+
+class MemoryJobStore(JobStore):
+    """프로세스 내부 작업 저장소 (최대 보관 수를 넘으면 오래된 종료 작업부터 제거)"""
+
+    def __init__(self, maxsize: int = 500):
+        self.maxsize = maxsize
+        self._jobs: "OrderedDict[str, BriefingJob]" = OrderedDict()
+        self._results: Dict[str, BriefingBatchResponse] = {}
+        # 미완료 작업의 중복 제거 키 → 작업 ID (작업이 끝나면 제거)
+        self._keys: Dict[str, str] = {}
+        self._job_keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def save_job(self, job: BriefingJob) -> None:
+        # 작업 스레드가 이후에 바꾸는 값이 조회 중인 응답에 섞이지 않도록 복사본을 저장
+        with self._lock:
+            self._jobs[job.job_id] = job.model_copy(deep=True)
+            if job.status in FINISHED_STATUSES:
+                key = self._job_keys.pop(job.job_id, None)
+                if key is not None and self._keys.get(key) == job.job_id:
+                    del self._keys[key]
+            if len(self._jobs) <= self.maxsize:
+                return
+            for job_id in [key for key, value in self._jobs.items() if value.status in FINISHED_STATUSES]:
+                if len(self._jobs) <= self.maxsize:
+                    break
+                del self._jobs[job_id]
+                self._results.pop(job_id, None)
+
+    def get_job(self, job_id: str) -> Optional[BriefingJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _find_unfinished(self, dedupe_key: str) -> Optional[BriefingJob]:
+        job = self._jobs.get(self._keys.get(dedupe_key))
+        return job if job is not None and job.status not in FINISHED_STATUSES else None
+
+    def find_unfinished(self, dedupe_key: str) -> Optional[BriefingJob]:
+        with self._lock:
+            return self._find_unfinished(dedupe_key)
+
+    def create_job(self, job: BriefingJob, dedupe_key: str) -> Tuple[BriefingJob, bool]:
+        with self._lock:
+            existing = self._find_unfinished(dedupe_key)
+            if existing is not None:
+                return existing, False
+            self._keys[dedupe_key] = job.job_id
+            self._job_keys[job.job_id] = dedupe_key
+        self.save_job(job)
+        return job, True
+
+    def save_result(self, job_id: str, result: BriefingBatchResponse) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                self._results[job_id] = result
+
+    def get_result(self, job_id: str) -> Optional[BriefingBatchResponse]:
+        with self._lock:
+            return self._results.get(job_id)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    SQLite 파일 기반 작업 저장소
+
+    여러 uvicorn 워커가 같은 파일을 사용하면 어느 워커에서든 작업 상태와 결과를 조회할 수 있고,
+    같은 요청의 중복 작업도 워커 간에 걸러집니다 (미완료 작업에만 걸린 dedupe_key 부분 고유 인덱스).
+    종료 후 retention 초가 지난 작업은 저장 시 주기적으로 삭제합니다.
+    """
+
+    PRUNE_INTERVAL = 100
+
+    # 이 시간(초) 동안 갱신이 없는 미완료 작업은 중단된 것으로 간주
+    # (같은 파일을 쓰는 다른 워커가 실행 중인 작업은 건드리지 않기 위함)
+    STALE_AFTER = 10 * 60
+
+    def __init__(self, path: str, retention: float = 7 * 24 * 60 * 60):
+        self.path = path
+        self.retention = retention
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS briefing_job ("
+                " job_id TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " job TEXT NOT NULL,"
+                " result TEXT,"
+                " updated_at REAL NOT NULL,"
+                " dedupe_key TEXT)"
+            )
+            # 중복 제거 키가 없던 이전 버전 파일 갱신
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(briefing_job)")}
+            if "dedupe_key" not in columns:
+                conn.execute("ALTER TABLE briefing_job ADD COLUMN dedupe_key TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS briefing_job_updated_at ON briefing_job (updated_at)")
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS briefing_job_dedupe ON briefing_job (dedupe_key)"
+                f" WHERE status NOT IN ('{COMPLETED}', '{FAILED}')"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def save_job(self, job: BriefingJob) -> None:
+        self._conn().execute(
+            "INSERT INTO briefing_job (job_id, status, job, updated_at) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (job_id) DO UPDATE SET"
+            " status = excluded.status, job = excluded.job, updated_at = excluded.updated_at",
+            (job.job_id, job.status, job.model_dump_json(), time.time())
+        )
+
+        with self._writes_lock:
+            self._writes += 1
+            prune = self._writes % self.PRUNE_INTERVAL == 0
+        if prune:
+            self._conn().execute(
+                "DELETE FROM briefing_job WHERE status IN (?, ?) AND updated_at <= ?",
+                (*FINISHED_STATUSES, time.time() - self.retention)
+            )
+
+    def get_job(self, job_id: str) -> Optional[BriefingJob]:
+        row = self._conn().execute(
+            "SELECT job FROM briefing_job WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return BriefingJob.model_validate_json(row[0]) if row else None
+
+    @staticmethod
+    def _interrupt(job: BriefingJob) -> BriefingJob:
+        job.status = FAILED
+        job.error = "서버 재시작으로 작업이 중단되었습니다."
+        job.finished_at = datetime.now().isoformat()
+        return job
+
+    def _find_unfinished(self, conn: sqlite3.Connection, dedupe_key: str) -> Optional[BriefingJob]:
+        """
+        같은 키의 미완료 작업 조회
+
+        STALE_AFTER 초 동안 갱신이 없는 작업은 종료된 워커가 남긴 것으로 보고 실패로 표시합니다
+        (그대로 두면 같은 요청을 다시 접수할 수 없음).
+        """
+        row = conn.execute(
+            "SELECT job, updated_at FROM briefing_job WHERE dedupe_key = ? AND status NOT IN (?, ?)",
+            (dedupe_key, *FINISHED_STATUSES)
+        ).fetchone()
+        if row is None:
+            return None
+
+        job = BriefingJob.model_validate_json(row[0])
+        if row[1] > time.time() - self.STALE_AFTER:
+            return job
+        self._interrupt(job)
+        conn.execute(
+            "UPDATE briefing_job SET status = ?, job = ?, updated_at = ? WHERE job_id = ?",
+            (job.status, job.model_dump_json(), time.time(), job.job_id)
+        )
+        return None
+
+    def find_unfinished(self, dedupe_key: str) -> Optional[BriefingJob]:
+        return self._find_unfinished(self._conn(), dedupe_key)
+
+    def create_job(self, job: BriefingJob, dedupe_key: str) -> Tuple[BriefingJob, bool]:
+        conn = self._conn()
+        # 쓰기 잠금을 먼저 잡아 다른 워커의 같은 요청과 조회-저장 순서가 섞이지 않게 함
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = self._find_unfinished(conn, dedupe_key)
+            if existing is None:
+                conn.execute(
+                    "INSERT INTO briefing_job (job_id, status, job, updated_at, dedupe_key) VALUES (?, ?, ?, ?, ?)",
+                    (job.job_id, job.status, job.model_dump_json(), time.time(), dedupe_key)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return (existing, False) if existing is not None else (job, True)
+
+    def save_result(self, job_id: str, result: BriefingBatchResponse) -> None:
+        self._conn().execute(
+            "UPDATE briefing_job SET result = ? WHERE job_id = ?",
+            (result.model_dump_json(), job_id)
+        )
+
+    def get_result(self, job_id: str) -> Optional[BriefingBatchResponse]:
+        row = self._conn().execute(
+            "SELECT result FROM briefing_job WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return BriefingBatchResponse.model_validate_json(row[0]) if row and row[0] else None
+
+    def interrupt_unfinished(self) -> int:
+        rows = self._conn().execute(
+            "SELECT job FROM briefing_job WHERE status NOT IN (?, ?) AND updated_at <= ?",
+            (*FINISHED_STATUSES, time.time() - self.STALE_AFTER)
+        ).fetchall()
+        for (data,) in rows:
+            self.save_job(self._interrupt(BriefingJob.model_validate_json(data)))
+        return len(rows)
+
+
+def create_job_store() -> JobStore:
+    """
+    환경 변수 설정에 따라 작업 저장소 생성
+
+    - BRIEFING_JOB_STORE: memory (기본값) 또는 sqlite
+    - BRIEFING_JOB_PATH: sqlite 파일 경로 (기본값: backend/.cache/briefing_jobs.sqlite3)
+    """
+    backend = os.getenv("BRIEFING_JOB_STORE", "memory").lower()
+
+    if backend == "sqlite":
+        default_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            ".cache",
+            "briefing_jobs.sqlite3"
+        )
+        return SQLiteJobStore(os.getenv("BRIEFING_JOB_PATH", default_path))
+
+    if backend != "memory":
+        raise ValueError(f"지원하지 않는 작업 저장소입니다: {backend}")
+
+    return MemoryJobStore()
+
+
+class BriefingJobQueue:
+    """
+    브리핑 생성 작업 큐
+
+    작업은 요청을 처리하는 실행기와 분리된 전용 스레드 풀(concurrency개)에서 실행되므로,
+    생성이 오래 걸려도 HTTP 요청 처리나 업스트림 조회 슬롯을 점유하지 않습니다.
+    같은 요청이 대기 중이거나 실행 중이면 새 작업을 만들지 않고 기존 작업을 반환합니다.
+    중복 확인은 저장소에서 하므로 sqlite 저장소를 공유하는 다른 워커의 작업도 포함되며,
+    max_pending은 이 프로세스가 실행할 작업 수에만 적용됩니다.
+    """
+
+    def __init__(self, store: JobStore, concurrency: int = 2, max_pending: int = 100):
+        self.store = store
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # 이 프로세스에서 대기 중이거나 실행 중인 작업 수
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def dedupe_key(request: BriefingBatchRequest) -> str:
+        """같은 결과를 만드는 요청은 같은 키 (종목 지정 시 top_n, 자동 선정 시 type은 무시)"""
+        if request.tickers:
+            payload = {
+                "tickers": [ticker.upper() for ticker in request.tickers],
+                "type": request.type,
+                "format": request.format,
+            }
+        else:
+            payload = {"top_n": request.top_n, "format": request.format}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def start(self) -> None:
+        """작업 풀 시작 (앱 시작 시 호출, 이전 프로세스의 미완료 작업은 실패로 표시)"""
+        if self._pool is not None:
+            return
+        interrupted = self.store.interrupt_unfinished()
+        if interrupted:
+            print(f"Marked {interrupted} interrupted briefing jobs as failed")
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="briefing-job")
+
+    def shutdown(self) -> None:
+        """작업 풀 종료 (앱 종료 시 호출, 대기 중인 작업은 취소)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def submit(self, request: BriefingBatchRequest) -> Tuple[BriefingJob, bool]:
+        """
+        작업 접수
+
+        Args:
+            request: 브리핑 일괄 생성 요청
+
+        Returns:
+            Tuple[BriefingJob, bool]: (작업, 새로 만든 작업 여부 — 진행 중인 동일 작업이면 False)
+
+        Raises:
+            QueueFullError: 진행 중인 작업 수가 max_pending 이상인 경우
+        """
+        key = BriefingJobQueue.dedupe_key(request)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                job = self.store.find_unfinished(key)
+                if job is not None:
+                    return job, False
+                raise QueueFullError(f"대기 중인 작업이 {self.max_pending}개를 넘었습니다.")
+
+            job_id = f"job_{uuid.uuid4().hex[:12]}"
+            job = BriefingJob(
+                job_id=job_id,
+                status=QUEUED,
+                request=request,
+                created_at=datetime.now().isoformat(),
+                steps=[
+                    BriefingJobStep(
+                        name=name,
+                        status="skipped" if name == "stock_selection" and request.tickers else "pending"
+                    )
+                    for name in STEPS
+                ],
+                status_url=f"/api/briefing/jobs/{job_id}",
+                result_url=f"/api/briefing/jobs/{job_id}/result"
+            )
+            job, created = self.store.create_job(job, key)
+            if not created:
+                return job, False
+            self._pending += 1
+
+            try:
+                if self._pool is None:
+                    self.start()
+                self._pool.submit(self._run, job)
+            except Exception as e:
+                # 실행을 예약하지 못한 작업은 대기 상태로 남기지 않고 실패로 표시
+                self._pending -= 1
+                job.status = FAILED
+                job.error = f"작업을 실행할 수 없습니다: {str(e)}"
+                job.finished_at = datetime.now().isoformat()
+                self.store.save_job(job)
+                raise
+        return job, True
+
+    def get(self, job_id: str) -> Optional[BriefingJob]:
+        """작업 상태 조회"""
+        return self.store.get_job(job_id)
+
+    def result(self, job_id: str) -> Optional[BriefingBatchResponse]:
+        """완료된 작업 결과 조회"""
+        return self.store.get_result(job_id)
+
+    def _update_step(self, job: BriefingJob, name: str, status: str) -> None:
+        """단계 상태 변경 후 진행률 갱신 및 저장"""
+        for step in job.steps:
+            if step.name == name:
+                step.status = status
+                if status in ("completed", "skipped"):
+                    step.completed_at = datetime.now().isoformat()
+        done = sum(1 for step in job.steps if step.status in ("completed", "skipped"))
+        job.progress_percent = int(done * 100 / len(job.steps))
+        self.store.save_job(job)
+
+    def _run(self, job: BriefingJob) -> None:
+        """작업 실행 (작업 풀 스레드)"""
+        job.status = RUNNING
+        job.started_at = datetime.now().isoformat()
+        self.store.save_job(job)
+        request = job.request
+        current = STEPS[0]
+
+        try:
+            if request.tickers:
+                items = [(ticker, request.type) for ticker in request.tickers]
+            else:
+                self._update_step(job, current, "running")
+                items = BriefingService.select_daily_tickers(request.top_n)
+                if not items:
+                    raise RuntimeError("브리핑 종목을 자동 선정할 수 없습니다.")
+                self._update_step(job, current, "completed")
+
+            current = "data_collection"
+            self._update_step(job, current, "running")
+
+            def on_prefetched() -> None:
+                nonlocal current
+                self._update_step(job, "data_collection", "completed")
+                current = "content_generation"
+                self._update_step(job, current, "running")
+
+            result = BriefingService.generate_briefings(
+                items,
+                output_format=request.format,
+                on_prefetched=on_prefetched
+            )
+            self.store.save_result(job.job_id, result)
+            self._update_step(job, current, "completed")
+            job.status = COMPLETED
+        except Exception as e:
+            print(f"Error running briefing job {job.job_id}: {str(e)}")
+            job.status = FAILED
+            job.error = str(e)
+            for step in job.steps:
+                if step.name == current:
+                    step.status = "failed"
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            self.store.save_job(job)
+            with self._lock:
+                self._pending -= 1
+
+
+# 앱 전역 작업 큐
+briefing_jobs = BriefingJobQueue(
+    create_job_store(),
+    concurrency=int(os.getenv("BRIEFING_JOB_CONCURRENCY", "2")),
+    max_pending=int(os.getenv("BRIEFING_JOB_MAX_PENDING", "100"))
+)
@@ -1,22 +1,42 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
+from models.stock import (
+    StockQuote,
+    StockQuoteBatch,
+    HistoricalData,
+    BriefingResponse,
+    BriefingBatchItem,
+    BriefingBatchResponse
+)
+from services import briefing_templates
+from services.briefing_archive import briefing_archive
 from services.stock_service import StockService
+from services.upstream import UpstreamUnavailableError
+from services.trending_service import TrendingStocksFetcher
 
 
 class BriefingService:
     """브리핑 생성 서비스"""
 
     @staticmethod
-    def generate_briefing(ticker: str, briefing_type: str = "most_actives") -> Optional[str]:
+    def generate_briefing(
+        ticker: str,
+        briefing_type: str = "most_actives",
+        output_format: str = "markdown"
+    ) -> Optional[BriefingResponse]:
         """
-        브리핑 마크다운 콘텐츠 생성
+        브리핑 생성 (입력 데이터가 같으면 저장된 브리핑 재사용)
 
         Args:
             ticker: 주식 티커 심볼
             briefing_type: 브리핑 타입 (most_actives, day_gainers, day_losers 등)
+            output_format: 출력 형식 (markdown, html, text)
 
         Returns:
-            str: 마크다운 형식의 브리핑 콘텐츠 또는 None
+            BriefingResponse: 브리핑 (content_hash 포함) 또는 None
         """
         try:
             # 종목 정보 조회
@@ -27,134 +47,231 @@ class BriefingService:
             # 과거 데이터 조회 (5일)
             historical = StockService.get_historical_data(ticker, "5d")
 
-            # 현재 시각
-            now = datetime.now()
-            date_str = now.strftime("%Y년 %m월 %d일")
-            time_str = now.strftime("%H:%M")
-
-            # 종목 정보 추출
-            info = quote.info
-            price = quote.price
-
-            # 변동률 계산
-            change_percent = price.change_percent or 0
-            change_direction = "상승" if change_percent > 0 else "하락" if change_percent < 0 else "보합"
-            change_emoji = "📈" if change_percent > 0 else "📉" if change_percent < 0 else "➡️"
-
-            # 거래량 분석
-            volume = price.volume or 0
-            volume_str = f"{volume:,}" if volume > 0 else "N/A"
-
-            # 시가총액
-            market_cap = info.market_cap or 0
-            market_cap_b = market_cap / 1_000_000_000 if market_cap > 0 else 0
-
-            # 브리핑 타입별 제목
-            type_titles = {
-                "most_actives": "거래량 급증",
-                "day_gainers": "급등 종목",
-                "day_losers": "급락 종목",
-            }
-            type_title = type_titles.get(briefing_type, "화제의 종목")
-
-            # 조건부 값 미리 계산
-            prev_close_str = f"${price.previous_close:.2f}" if price.previous_close else "N/A"
-            open_str = f"${price.open_price:.2f}" if price.open_price else "N/A"
-            high_str = f"${price.day_high:.2f}" if price.day_high else "N/A"
-            low_str = f"${price.day_low:.2f}" if price.day_low else "N/A"
-            day_low_val = price.day_low if price.day_low else 0
-            day_high_val = price.day_high if price.day_high else 0
-            timestamp_str = now.strftime("%Y-%m-%d %H:%M:%S")
-
-            # 마크다운 템플릿
-            briefing_content = f"""# 📊 {info.name} ({ticker}) - {type_title} 브리핑
-
-**생성 일시**: {date_str} {time_str}
-**브리핑 타입**: {type_title}
-
----
-
-## 💼 기업 개요
-
-- **회사명**: {info.name or ticker}
-- **티커**: {ticker}
-- **섹터**: {info.sector or 'N/A'}
-- **산업**: {info.industry or 'N/A'}
-- **거래소**: {info.exchange or 'N/A'}
-
----
-
-## 💰 현재 주가 정보
-
-| 항목 | 값 |
-|------|-----|
-| **현재가** | ${price.current_price:.2f} |
-| **전일 종가** | {prev_close_str} |
-| **변동** | {change_emoji} ${abs(price.change or 0):.2f} ({change_percent:+.2f}%) |
-| **상태** | {change_direction} |
-| **시가** | {open_str} |
-| **당일 최고가** | {high_str} |
-| **당일 최저가** | {low_str} |
-| **거래량** | {volume_str} |
-| **시가총액** | ${market_cap_b:.2f}B |
-
----
-
-## 📈 주요 포인트
-
-### {change_emoji} 가격 동향
-- 현재 주가는 **${price.current_price:.2f}**로, 전일 대비 **{change_percent:+.2f}%** {change_direction}했습니다.
-- 당일 가격 범위: ${day_low_val:.2f} ~ ${day_high_val:.2f}
-
-### 📊 거래량 분석
-- 오늘의 거래량은 **{volume_str}**를 기록했습니다.
-"""
-
-            # 브리핑 타입별 추가 분석
-            if briefing_type == "most_actives":
-                briefing_content += f"""- 이는 거래량 급증을 나타내며, 시장의 높은 관심을 받고 있습니다.
-"""
-            elif briefing_type == "day_gainers":
-                briefing_content += f"""- 급등세를 보이며 투자자들의 높은 매수세를 보이고 있습니다.
-"""
-            elif briefing_type == "day_losers":
-                briefing_content += f"""- 급락세를 보이며 매도 압력이 높은 상황입니다.
-"""
-
-            # 과거 데이터가 있으면 추가
-            if historical and historical.data:
-                recent_closes = [d.close for d in historical.data if d.close]
-                if len(recent_closes) >= 2:
-                    week_change = ((recent_closes[-1] - recent_closes[0]) / recent_closes[0]) * 100
-                    briefing_content += f"""
-### 📅 최근 5일 추세
-- 5일 전 대비: **{week_change:+.2f}%**
-- 최근 5일간 종가 추이를 통해 {"상승" if week_change > 0 else "하락"} 트렌드를 보이고 있습니다.
-"""
-
-            briefing_content += f"""
----
-
-## ⚠️ 투자 유의사항
-
-이 브리핑은 실시간 시장 데이터를 기반으로 자동 생성되었습니다.
-투자 결정 시에는 다음 사항을 고려하시기 바랍니다:
-
-- 📰 최신 뉴스 및 공시 확인
-- 📊 기술적 지표 분석
-- 💼 기업 재무제표 검토
-- 🌐 산업 동향 파악
-- ⚖️ 리스크 관리
-
-> **면책조항**: 이 브리핑은 정보 제공 목적으로만 사용되며, 투자 권유나 조언으로 해석되어서는 안 됩니다.
-
----
-
-*생성 시각: {timestamp_str}*
-"""
-
-            return briefing_content
+            return BriefingService.archived_briefing(
+                ticker, briefing_type, quote, historical, output_format=output_format
+            )
 
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             print(f"Error generating briefing for {ticker}: {str(e)}")
             return None
+
+    @staticmethod
+    def archived_briefing(
+        ticker: str,
+        briefing_type: str,
+        quote: StockQuote,
+        historical: Optional[HistoricalData] = None,
+        now: Optional[datetime] = None,
+        output_format: str = "markdown"
+    ) -> BriefingResponse:
+        """
+        저장된 브리핑 조회, 없으면 작성 후 저장 (업스트림 호출 없음)
+
+        입력 데이터 해시가 같은 브리핑이 있으면 최초 생성 시각과 콘텐츠를 그대로 반환합니다.
+
+        Args:
+            ticker: 주식 티커 심볼
+            briefing_type: 브리핑 타입
+            quote: 종목 종합 정보
+            historical: 최근 5일 과거 데이터
+            now: 생성 시각 (기본값: 현재 시각)
+            output_format: 출력 형식 (markdown, html, text)
+
+        Returns:
+            BriefingResponse: 브리핑 (content_hash 포함)
+        """
+        key = briefing_archive.key(ticker, briefing_type, output_format, quote, historical)
+        briefing = briefing_archive.get(key)
+        if briefing is not None:
+            return briefing
+
+        now = now or datetime.now()
+        briefing = BriefingResponse(
+            ticker=ticker,
+            type=briefing_type,
+            generated_at=now.isoformat(),
+            format=output_format,
+            content=BriefingService.render_briefing(
+                ticker, briefing_type, quote, historical, now, output_format
+            ),
+            content_hash=key
+        )
+        try:
+            briefing_archive.put(key, briefing)
+        except OSError as e:
+            # 저장 실패는 응답에 영향을 주지 않음 (다음 요청에서 다시 작성)
+            print(f"Error archiving briefing for {ticker}: {str(e)}")
+        return briefing
+
+    @staticmethod
+    def render_briefing(
+        ticker: str,
+        briefing_type: str,
+        quote: StockQuote,
+        historical: Optional[HistoricalData] = None,
+        now: Optional[datetime] = None,
+        output_format: str = "markdown"
+    ) -> str:
+        """
+        조회된 데이터로 브리핑 작성 (업스트림 호출 없음)
+
+        Args:
+            ticker: 주식 티커 심볼
+            briefing_type: 브리핑 타입
+            quote: 종목 종합 정보
+            historical: 최근 5일 과거 데이터
+            now: 생성 시각 (기본값: 현재 시각)
+            output_format: 출력 형식 (markdown, html, text)
+
+        Returns:
+            str: 브리핑 콘텐츠
+        """
+        values = briefing_templates.briefing_values(ticker, briefing_type, quote, historical, now)
+        return briefing_templates.render(values, briefing_type, output_format)
+
+    # 일괄 생성 시 동시 작성 수 (작성 스레드 풀 크기)
+    BATCH_MAX_WORKERS = 8
+
+    @staticmethod
+    def shutdown() -> None:
+        """일괄 조회/작성 스레드 풀 종료 (앱 종료 시 호출, 대기 중인 작업은 취소)"""
+        _prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def prefetch(tickers: List[str]) -> StockQuoteBatch:
+        """
+        종합 정보와 5일 일봉을 동시에 일괄 조회 (다중 심볼 요청 2회)
+
+        과거 데이터는 저장소에 채워 두기만 하며, 조회에 실패해도 종합 정보는 반환합니다
+        (5일 추세만 생략됨).
+
+        Args:
+            tickers: 티커 목록 (대문자, 중복 없음)
+
+        Returns:
+            StockQuoteBatch: 종합 정보 일괄 조회 결과
+        """
+        quotes_future = _prefetch_pool.submit(StockService.get_stock_quotes, tickers)
+        history_future = _prefetch_pool.submit(StockService.prefetch_history, tickers, "5d")
+        batch = quotes_future.result()
+        try:
+            history_future.result()
+        except Exception as e:
+            print(f"Error prefetching briefing history: {str(e)}")
+        return batch
+
+    @staticmethod
+    def select_daily_tickers(top_n: int = 5) -> List[Tuple[str, str]]:
+        """
+        오늘의 브리핑 종목 자동 선정 (복합 점수 상위 종목)
+
+        Args:
+            top_n: 선정할 종목 수
+
+        Returns:
+            List[Tuple]: (티커, 브리핑 타입) 목록 (타입은 종목이 처음 등장한 스크리너)
+        """
+        result = TrendingStocksFetcher.get_trending_stocks(limit=top_n)
+        if result is None:
+            return []
+        return [
+            (stock.symbol, stock.sources[0] if stock.sources else "most_actives")
+            for stock in result.trending_stocks
+        ]
+
+    @staticmethod
+    def generate_briefings(
+        items: List[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        output_format: str = "markdown",
+        on_prefetched: Optional[Callable[[], None]] = None
+    ) -> BriefingBatchResponse:
+        """
+        여러 종목의 브리핑 일괄 생성
+
+        모든 종목의 종합 정보와 5일 일봉을 먼저 한 번에 받아 둔 뒤(다중 심볼 요청 2회),
+        종목별 브리핑을 스레드 풀에서 동시에 작성합니다.
+        작성 단계는 저장소와 캐시만 사용하므로 종목 수가 늘어도 업스트림 호출 수는 늘지 않습니다.
+
+        Args:
+            items: (티커, 브리핑 타입) 목록
+            max_workers: 동시 작성 수 (기본값, 최대: BATCH_MAX_WORKERS)
+            output_format: 출력 형식 (markdown, html, text)
+            on_prefetched: 일괄 조회가 끝나면 호출할 함수 (작업 진행 상태 갱신용)
+
+        Returns:
+            BriefingBatchResponse: 종목별 결과와 소요 시간 (매니페스트)
+        """
+        started = time.perf_counter()
+        items = [(ticker.upper(), briefing_type) for ticker, briefing_type in items]
+        tickers = list(dict.fromkeys(ticker for ticker, _ in items))
+
+        batch = BriefingService.prefetch(tickers)
+        prefetch_ms = (time.perf_counter() - started) * 1000
+        if on_prefetched is not None:
+            on_prefetched()
+
+        now = datetime.now()
+
+        def render(item: Tuple[str, str]) -> BriefingBatchItem:
+            ticker, briefing_type = item
+            render_started = time.perf_counter()
+            quote = batch.quotes.get(ticker)
+            if quote is None:
+                return BriefingBatchItem(
+                    ticker=ticker,
+                    type=briefing_type,
+                    error=batch.errors.get(ticker, "종목 정보를 찾을 수 없습니다."),
+                    elapsed_ms=round((time.perf_counter() - render_started) * 1000, 1)
+                )
+
+            try:
+                historical = StockService.get_historical_data(ticker, "5d")
+                briefing = BriefingService.archived_briefing(
+                    ticker, briefing_type, quote, historical, now, output_format
+                )
+                return BriefingBatchItem(
+                    ticker=ticker,
+                    type=briefing_type,
+                    content=briefing.content,
+                    content_hash=briefing.content_hash,
+                    elapsed_ms=round((time.perf_counter() - render_started) * 1000, 1)
+                )
+            except Exception as e:
+                print(f"Error generating briefing for {ticker}: {str(e)}")
+                return BriefingBatchItem(
+                    ticker=ticker,
+                    type=briefing_type,
+                    error=str(e),
+                    elapsed_ms=round((time.perf_counter() - render_started) * 1000, 1)
+                )
+
+        # 공용 작성 풀에서 이 호출의 작업은 동시에 workers개까지만 실행
+        workers = max(1, min(max_workers or BriefingService.BATCH_MAX_WORKERS, len(items)))
+        slots = threading.BoundedSemaphore(workers)
+        futures = []
+        for item in items:
+            slots.acquire()
+            future = _render_pool.submit(render, item)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+        briefings = [future.result() for future in futures]
+
+        succeeded = sum(1 for briefing in briefings if briefing.content is not None)
+        return BriefingBatchResponse(
+            generated_at=now.isoformat(),
+            succeeded=succeeded,
+            failed=len(briefings) - succeeded,
+            prefetch_ms=round(prefetch_ms, 1),
+            total_ms=round((time.perf_counter() - started) * 1000, 1),
+            briefings=briefings
+        )
+
+
+# 일괄 조회(종합 정보, 과거 데이터)와 브리핑 작성 전용 스레드 풀
+# 요청 처리 실행기 스레드 안에서 사용하므로 공용 실행기와 분리, 앱 종료 시 BriefingService.shutdown()
+_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="briefing-prefetch")
+_render_pool = ThreadPoolExecutor(max_workers=BriefingService.BATCH_MAX_WORKERS, thread_name_prefix="briefing")
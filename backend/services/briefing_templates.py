@@ -0,0 +1,423 @@
+import hashlib
+import html
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from string import Formatter
+from typing import Dict, Mapping, Optional, Tuple
+
+from models.stock import StockQuote, HistoricalData
+
+
+# 출력 형식과 브리핑 타입
+FORMATS = ('markdown', 'html', 'text')
+BRIEFING_TYPES = ('most_actives', 'day_gainers', 'day_losers')
+
+# 브리핑 타입별 제목 (그 외 타입은 DEFAULT_TYPE_TITLE)
+TYPE_TITLES = {
+    'most_actives': '거래량 급증',
+    'day_gainers': '급등 종목',
+    'day_losers': '급락 종목',
+}
+DEFAULT_TYPE_TITLE = '화제의 종목'
+
+# 브리핑 타입별 거래량 분석 문장
+TYPE_ANALYSIS = {
+    'most_actives': '이는 거래량 급증을 나타내며, 시장의 높은 관심을 받고 있습니다.',
+    'day_gainers': '급등세를 보이며 투자자들의 높은 매수세를 보이고 있습니다.',
+    'day_losers': '급락세를 보이며 매도 압력이 높은 상황입니다.',
+}
+
+# 정적 구간 내용 (형식과 무관한 원문)
+CAUTION_INTRO = [
+    '이 브리핑은 실시간 시장 데이터를 기반으로 자동 생성되었습니다.',
+    '투자 결정 시에는 다음 사항을 고려하시기 바랍니다:',
+]
+CAUTION_ITEMS = [
+    '📰 최신 뉴스 및 공시 확인',
+    '📊 기술적 지표 분석',
+    '💼 기업 재무제표 검토',
+    '🌐 산업 동향 파악',
+    '⚖️ 리스크 관리',
+]
+DISCLAIMER = '이 브리핑은 정보 제공 목적으로만 사용되며, 투자 권유나 조언으로 해석되어서는 안 됩니다.'
+
+
+# ============================================
+# 형식별 템플릿 원문
+# {field}는 briefing_values의 값, {>name}은 정적 조각(fragment)으로 컴파일 시 포함됩니다.
+# ============================================
+
+MARKDOWN_TEMPLATES = {
+    'body': """# 📊 {name_title} ({ticker}) - {type_title} 브리핑
+
+**생성 일시**: {date} {time}
+**브리핑 타입**: {type_title}
+
+---
+
+## 💼 기업 개요
+
+- **회사명**: {name}
+- **티커**: {ticker}
+- **섹터**: {sector}
+- **산업**: {industry}
+- **거래소**: {exchange}
+
+---
+
+## 💰 현재 주가 정보
+
+| 항목 | 값 |
+|------|-----|
+| **현재가** | ${current_price} |
+| **전일 종가** | {previous_close} |
+| **변동** | {change_emoji} ${change_abs} ({change_percent}%) |
+| **상태** | {change_direction} |
+| **시가** | {open_price} |
+| **당일 최고가** | {day_high} |
+| **당일 최저가** | {day_low} |
+| **거래량** | {volume} |
+| **시가총액** | ${market_cap_b}B |
+
+---
+
+## 📈 주요 포인트
+
+### {change_emoji} 가격 동향
+- 현재 주가는 **${current_price}**로, 전일 대비 **{change_percent}%** {change_direction}했습니다.
+- 당일 가격 범위: ${day_low_value} ~ ${day_high_value}
+
+### 📊 거래량 분석
+- 오늘의 거래량은 **{volume}**를 기록했습니다.
+{>analysis}""",
+    'trend': """
+### 📅 최근 5일 추세
+- 5일 전 대비: **{week_change}%**
+- 최근 5일간 종가 추이를 통해 {week_direction} 트렌드를 보이고 있습니다.
+""",
+    'footer': """
+---
+
+{>caution}
+
+{>disclaimer}
+
+---
+
+*생성 시각: {timestamp}*
+""",
+}
+
+HTML_TEMPLATES = {
+    'body': """<article class="briefing briefing-{briefing_type}">
+<h1>📊 {name_title} ({ticker}) - {type_title} 브리핑</h1>
+<p><strong>생성 일시</strong>: {date} {time}<br>
+<strong>브리핑 타입</strong>: {type_title}</p>
+<hr>
+<h2>💼 기업 개요</h2>
+<ul>
+<li><strong>회사명</strong>: {name}</li>
+<li><strong>티커</strong>: {ticker}</li>
+<li><strong>섹터</strong>: {sector}</li>
+<li><strong>산업</strong>: {industry}</li>
+<li><strong>거래소</strong>: {exchange}</li>
+</ul>
+<hr>
+<h2>💰 현재 주가 정보</h2>
+<table>
+<thead><tr><th>항목</th><th>값</th></tr></thead>
+<tbody>
+<tr><th>현재가</th><td>${current_price}</td></tr>
+<tr><th>전일 종가</th><td>{previous_close}</td></tr>
+<tr><th>변동</th><td>{change_emoji} ${change_abs} ({change_percent}%)</td></tr>
+<tr><th>상태</th><td>{change_direction}</td></tr>
+<tr><th>시가</th><td>{open_price}</td></tr>
+<tr><th>당일 최고가</th><td>{day_high}</td></tr>
+<tr><th>당일 최저가</th><td>{day_low}</td></tr>
+<tr><th>거래량</th><td>{volume}</td></tr>
+<tr><th>시가총액</th><td>${market_cap_b}B</td></tr>
+</tbody>
+</table>
+<hr>
+<h2>📈 주요 포인트</h2>
+<h3>{change_emoji} 가격 동향</h3>
+<ul>
+<li>현재 주가는 <strong>${current_price}</strong>로, 전일 대비 <strong>{change_percent}%</strong> {change_direction}했습니다.</li>
+<li>당일 가격 범위: ${day_low_value} ~ ${day_high_value}</li>
+</ul>
+<h3>📊 거래량 분석</h3>
+<ul>
+<li>오늘의 거래량은 <strong>{volume}</strong>를 기록했습니다.</li>
+{>analysis}</ul>
+""",
+    'trend': """<h3>📅 최근 5일 추세</h3>
+<ul>
+<li>5일 전 대비: <strong>{week_change}%</strong></li>
+<li>최근 5일간 종가 추이를 통해 {week_direction} 트렌드를 보이고 있습니다.</li>
+</ul>
+""",
+    'footer': """<hr>
+{>caution}
+{>disclaimer}
+<hr>
+<p><em>생성 시각: {timestamp}</em></p>
+</article>
+""",
+}
+
+TEXT_TEMPLATES = {
+    'body': """📊 {name_title} ({ticker}) - {type_title} 브리핑
+
+생성 일시: {date} {time}
+브리핑 타입: {type_title}
+
+[💼 기업 개요]
+- 회사명: {name}
+- 티커: {ticker}
+- 섹터: {sector}
+- 산업: {industry}
+- 거래소: {exchange}
+
+[💰 현재 주가 정보]
+- 현재가: ${current_price}
+- 전일 종가: {previous_close}
+- 변동: {change_emoji} ${change_abs} ({change_percent}%)
+- 상태: {change_direction}
+- 시가: {open_price}
+- 당일 최고가: {day_high}
+- 당일 최저가: {day_low}
+- 거래량: {volume}
+- 시가총액: ${market_cap_b}B
+
+[📈 주요 포인트]
+{change_emoji} 가격 동향
+- 현재 주가는 ${current_price}로, 전일 대비 {change_percent}% {change_direction}했습니다.
+- 당일 가격 범위: ${day_low_value} ~ ${day_high_value}
+
+📊 거래량 분석
+- 오늘의 거래량은 {volume}를 기록했습니다.
+{>analysis}""",
+    'trend': """
+📅 최근 5일 추세
+- 5일 전 대비: {week_change}%
+- 최근 5일간 종가 추이를 통해 {week_direction} 트렌드를 보이고 있습니다.
+""",
+    'footer': """
+{>caution}
+
+{>disclaimer}
+
+생성 시각: {timestamp}
+""",
+}
+
+TEMPLATES = {
+    'markdown': MARKDOWN_TEMPLATES,
+    'html': HTML_TEMPLATES,
+    'text': TEXT_TEMPLATES,
+}
+
+# 템플릿 원문과 정적 문장의 해시 (문구가 바뀌면 저장된 브리핑을 재사용하지 않도록 캐시 키에 포함)
+TEMPLATE_DIGEST = hashlib.sha256(repr((
+    TEMPLATES, TYPE_TITLES, DEFAULT_TYPE_TITLE, TYPE_ANALYSIS, CAUTION_INTRO, CAUTION_ITEMS, DISCLAIMER
+)).encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def fragment(output_format: str, name: str, briefing_type: str = '') -> str:
+    """
+    정적 조각 렌더링 (형식/타입별로 한 번만 생성하여 캐시)
+
+    Args:
+        output_format: 출력 형식 (markdown, html, text)
+        name: 조각 이름 (caution, disclaimer, analysis)
+        briefing_type: 브리핑 타입 (analysis 조각에만 사용)
+
+    Returns:
+        str: 렌더링된 조각
+    """
+    if name == 'analysis':
+        sentence = TYPE_ANALYSIS.get(briefing_type)
+        if sentence is None:
+            return ''
+        if output_format == 'html':
+            return f"<li>{html.escape(sentence)}</li>\n"
+        return f"- {sentence}\n"
+
+    if name == 'caution':
+        if output_format == 'html':
+            items = "\n".join(f"<li>{html.escape(item)}</li>" for item in CAUTION_ITEMS)
+            intro = "<br>\n".join(html.escape(line) for line in CAUTION_INTRO)
+            return f"<h2>⚠️ 투자 유의사항</h2>\n<p>{intro}</p>\n<ul>\n{items}\n</ul>"
+        items = "\n".join(f"- {item}" for item in CAUTION_ITEMS)
+        intro = "\n".join(CAUTION_INTRO)
+        heading = "## ⚠️ 투자 유의사항" if output_format == 'markdown' else "[⚠️ 투자 유의사항]"
+        return f"{heading}\n\n{intro}\n\n{items}"
+
+    if name == 'disclaimer':
+        if output_format == 'html':
+            return f"<blockquote><strong>면책조항</strong>: {html.escape(DISCLAIMER)}</blockquote>"
+        if output_format == 'markdown':
+            return f"> **면책조항**: {DISCLAIMER}"
+        return f"※ 면책조항: {DISCLAIMER}"
+
+    raise KeyError(f"알 수 없는 조각입니다: {name}")
+
+
+class CompiledTemplate:
+    """
+    미리 컴파일된 템플릿
+
+    정적 조각을 포함한 템플릿 원문을 고정 문자열 구간과 필드 목록으로 분해해 두고,
+    렌더링 시에는 필드 값만 꺼내 고정 구간 사이에 끼워 한 번에 이어 붙입니다.
+    (매 렌더링마다 템플릿을 다시 해석하는 str.format보다 빠름)
+    """
+
+    __slots__ = ('literals', 'fields', '_getter')
+
+    def __init__(self, source: str, output_format: str, briefing_type: str = ''):
+        literals = ['']
+        fields = []
+        for literal, field, format_spec, conversion in Formatter().parse(source):
+            literals[-1] += literal
+            if field is None:
+                continue
+            if field.startswith('>'):
+                literals[-1] += fragment(output_format, field[1:], briefing_type)
+                continue
+            if format_spec or conversion:
+                # 값은 briefing_values에서 미리 서식화하므로 서식 지정자는 사용하지 않음
+                raise ValueError(f"템플릿 필드에는 서식 지정자를 사용할 수 없습니다: {field}")
+            fields.append(field)
+            literals.append('')
+
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.fields: Tuple[str, ...] = tuple(fields)
+        # 필드가 하나뿐이어도 항상 튜플을 반환하도록 감쌈
+        getter = itemgetter(*fields) if fields else (lambda values: ())
+        self._getter = getter if len(fields) != 1 else (lambda values: (getter(values),))
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """값 매핑으로 렌더링 (필드 값이 없으면 KeyError)"""
+        parts = [None] * (len(self.literals) + len(self.fields))
+        parts[0::2] = self.literals
+        parts[1::2] = self._getter(values)
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def compiled_template(output_format: str, briefing_type: str, with_trend: bool) -> CompiledTemplate:
+    """
+    형식/브리핑 타입/5일 추세 포함 여부별 컴파일된 템플릿 (최초 사용 시 한 번만 컴파일)
+
+    알 수 없는 브리핑 타입은 타입별 분석 문장이 없는 기본 템플릿을 공유합니다.
+    """
+    if briefing_type not in TYPE_ANALYSIS:
+        briefing_type = ''
+
+    templates = TEMPLATES[output_format]
+    source = templates['body'] + (templates['trend'] if with_trend else '') + templates['footer']
+    return CompiledTemplate(source, output_format, briefing_type)
+
+
+@lru_cache(maxsize=64)
+def _time_values(now: datetime) -> Tuple[str, str, str]:
+    """생성 시각 문자열 (일괄 생성 시 같은 시각을 공유하므로 캐시)"""
+    return now.strftime("%Y년 %m월 %d일"), now.strftime("%H:%M"), now.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def briefing_values(
+    ticker: str,
+    briefing_type: str,
+    quote: StockQuote,
+    historical: Optional[HistoricalData] = None,
+    now: Optional[datetime] = None
+) -> Dict[str, str]:
+    """
+    브리핑 템플릿 값 계산 (모든 출력 형식이 같은 값을 사용)
+
+    Args:
+        ticker: 주식 티커 심볼
+        briefing_type: 브리핑 타입
+        quote: 종목 종합 정보
+        historical: 최근 5일 과거 데이터
+        now: 생성 시각 (기본값: 현재 시각)
+
+    Returns:
+        Dict: 필드명별 서식화된 문자열 (week_change는 5일 추세를 계산할 수 있을 때만 포함)
+    """
+    now = now or datetime.now()
+    info = quote.info
+    price = quote.price
+
+    # 변동률 계산
+    change_percent = price.change_percent or 0
+    change_direction = "상승" if change_percent > 0 else "하락" if change_percent < 0 else "보합"
+    change_emoji = "📈" if change_percent > 0 else "📉" if change_percent < 0 else "➡️"
+
+    volume = price.volume or 0
+    market_cap = info.market_cap or 0
+    date, time, timestamp = _time_values(now)
+
+    values = {
+        'ticker': ticker,
+        'briefing_type': briefing_type,
+        'type_title': TYPE_TITLES.get(briefing_type, DEFAULT_TYPE_TITLE),
+        'name_title': str(info.name),
+        'name': info.name or ticker,
+        'sector': info.sector or 'N/A',
+        'industry': info.industry or 'N/A',
+        'exchange': info.exchange or 'N/A',
+        'date': date,
+        'time': time,
+        'timestamp': timestamp,
+        'current_price': f"{price.current_price:.2f}",
+        'previous_close': f"${price.previous_close:.2f}" if price.previous_close else "N/A",
+        'open_price': f"${price.open_price:.2f}" if price.open_price else "N/A",
+        'day_high': f"${price.day_high:.2f}" if price.day_high else "N/A",
+        'day_low': f"${price.day_low:.2f}" if price.day_low else "N/A",
+        'day_high_value': f"{price.day_high if price.day_high else 0:.2f}",
+        'day_low_value': f"{price.day_low if price.day_low else 0:.2f}",
+        'change_emoji': change_emoji,
+        'change_direction': change_direction,
+        'change_abs': f"{abs(price.change or 0):.2f}",
+        'change_percent': f"{change_percent:+.2f}",
+        'volume': f"{volume:,}" if volume > 0 else "N/A",
+        'market_cap_b': f"{market_cap / 1_000_000_000 if market_cap > 0 else 0:.2f}",
+    }
+
+    # 과거 데이터가 있으면 5일 추세 추가
+    if historical and historical.data:
+        recent_closes = [d.close for d in historical.data if d.close]
+        if len(recent_closes) >= 2:
+            week_change = ((recent_closes[-1] - recent_closes[0]) / recent_closes[0]) * 100
+            values['week_change'] = f"{week_change:+.2f}"
+            values['week_direction'] = "상승" if week_change > 0 else "하락"
+
+    return values
+
+
+def render(values: Mapping[str, str], briefing_type: str, output_format: str = 'markdown') -> str:
+    """
+    브리핑 렌더링
+
+    Args:
+        values: briefing_values 결과
+        briefing_type: 브리핑 타입
+        output_format: 출력 형식 (markdown, html, text)
+
+    Returns:
+        str: 렌더링된 브리핑
+    """
+    template = compiled_template(output_format, briefing_type, 'week_change' in values)
+    if output_format == 'html':
+        values = {key: html.escape(value) for key, value in values.items()}
+    return template.render(values)
+
+
+# 기본 브리핑 타입 템플릿은 임포트 시 미리 컴파일
+for _output_format in FORMATS:
+    for _briefing_type in BRIEFING_TYPES:
+        compiled_template(_output_format, _briefing_type, True)
+        compiled_template(_output_format, _briefing_type, False)
@@ -0,0 +1,489 @@
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+
+class ModelCodec:
+    """
+    캐시 값 직렬화 (pydantic 모델 ↔ 압축 JSON 바이트)
+
+    등록된 pydantic 모델은 모델명 태그와 함께 저장되어 원래 타입으로 복원됩니다.
+    일정 크기 이상의 값(과거 데이터 등)은 zlib으로 압축합니다.
+    """
+
+    COMPRESS_THRESHOLD = 1024
+
+    _RAW = b"j"
+    _COMPRESSED = b"z"
+
+    def __init__(self, models: Iterable[Type[BaseModel]] = ()):
+        self._models: Dict[str, Type[BaseModel]] = {model.__name__: model for model in models}
+
+    def _to_json(self, value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return {"__model__": type(value).__name__, "data": value.model_dump(mode="json")}
+        if isinstance(value, (list, tuple)):
+            return [self._to_json(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._to_json(item) for key, item in value.items()}
+        return value
+
+    def _from_json(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._from_json(item) for item in value]
+        if isinstance(value, dict):
+            model = self._models.get(value.get("__model__")) if "__model__" in value else None
+            if model is not None:
+                return model.model_validate(value["data"])
+            return {key: self._from_json(item) for key, item in value.items()}
+        return value
+
+    def encode(self, value: Any) -> bytes:
+        """값을 바이트로 직렬화"""
+        payload = json.dumps(
+            self._to_json(value),
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+        if len(payload) >= self.COMPRESS_THRESHOLD:
+            return self._COMPRESSED + zlib.compress(payload, 6)
+        return self._RAW + payload
+
+    def decode(self, data: bytes) -> Any:
+        """바이트를 값으로 역직렬화"""
+        flag, payload = data[:1], data[1:]
+        if flag == self._COMPRESSED:
+            payload = zlib.decompress(payload)
+        return self._from_json(json.loads(payload.decode("utf-8")))
+
+
+class CacheBackend(ABC):
+    """
+    캐시 저장소 인터페이스
+
+    TTLCache는 저장소에 값의 보관/만료만 맡기고 single-flight와 통계는 직접 처리합니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환. 만료된 항목은 미스로 처리"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """값을 ttl초 동안 저장"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """전체 항목 삭제"""
+
+    @abstractmethod
+    def size(self) -> int:
+        """저장된 항목 수"""
+
+    def acquire_lease(self, key: str, ttl: float) -> bool:
+        """
+        다른 프로세스와의 중복 조회를 막기 위한 조회 권한 획득
+
+        프로세스 간에 공유되지 않는 저장소는 항상 True를 반환합니다.
+        """
+        return True
+
+    def release_lease(self, key: str) -> None:
+        """조회 권한 반환"""
+        return None
+
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 내부 LRU 저장소 (최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거)"""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return False, None
+
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.evictions = 0
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    SQLite 파일 기반 공유 저장소
+
+    여러 uvicorn 워커가 같은 파일을 사용하여 캐시를 공유합니다.
+    값은 ModelCodec으로 직렬화되며, 만료 시각은 프로세스 간 비교가 가능하도록
+    벽시계 시간(time.time)으로 저장합니다.
+    """
+
+    # 일정 횟수의 저장마다 만료 항목 정리 및 최대 항목 수 확인
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, path: str, codec: ModelCodec, maxsize: int = 10000):
+        self.path = path
+        self.codec = codec
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lease ("
+                " key TEXT PRIMARY KEY,"
+                " expires_at REAL NOT NULL)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        row = self._conn().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+            (key, time.time())
+        ).fetchone()
+        if row is None:
+            return False, None
+        return True, self.codec.decode(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._conn().execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, self.codec.encode(value), time.time() + ttl)
+        )
+
+        with self._writes_lock:
+            self._writes += 1
+            prune = self._writes % self.PRUNE_INTERVAL == 0
+        if prune:
+            self._prune()
+
+    def _prune(self) -> None:
+        """만료 항목 삭제 후 최대 항목 수를 넘으면 만료가 임박한 항목부터 제거"""
+        conn = self._conn()
+        now = time.time()
+        conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+        conn.execute("DELETE FROM lease WHERE expires_at <= ?", (now,))
+
+        overflow = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.maxsize
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                " SELECT key FROM cache ORDER BY expires_at LIMIT ?)",
+                (overflow,)
+            )
+            self.evictions += overflow
+
+    def delete(self, key: str) -> None:
+        self._conn().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM cache")
+        conn.execute("DELETE FROM lease")
+        self.evictions = 0
+
+    def size(self) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM cache WHERE expires_at > ?", (time.time(),)
+        ).fetchone()[0]
+
+    def acquire_lease(self, key: str, ttl: float) -> bool:
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT expires_at FROM lease WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[0] > now:
+                conn.execute("COMMIT")
+                return False
+
+            conn.execute(
+                "INSERT OR REPLACE INTO lease (key, expires_at) VALUES (?, ?)",
+                (key, now + ttl)
+            )
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def release_lease(self, key: str) -> None:
+        self._conn().execute("DELETE FROM lease WHERE key = ?", (key,))
+
+
+def create_cache_backend(
+    models: Iterable[Type[BaseModel]] = (),
+    maxsize: int = 2048
+) -> CacheBackend:
+    """
+    환경 변수 설정에 따라 캐시 저장소 생성
+
+    - STOCK_CACHE_BACKEND: memory (기본값) 또는 sqlite
+    - STOCK_CACHE_PATH: sqlite 파일 경로 (기본값: backend/.cache/stock_cache.sqlite3)
+
+    Args:
+        models: 직렬화할 pydantic 모델 목록 (공유 저장소에서 타입 복원용)
+        maxsize: 최대 항목 수
+
+    Returns:
+        CacheBackend: 캐시 저장소
+    """
+    backend = os.getenv("STOCK_CACHE_BACKEND", "memory").lower()
+
+    if backend == "sqlite":
+        default_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            ".cache",
+            "stock_cache.sqlite3"
+        )
+        path = os.getenv("STOCK_CACHE_PATH", default_path)
+        return SQLiteCacheBackend(path, ModelCodec(models), maxsize=maxsize)
+
+    if backend != "memory":
+        raise ValueError(f"지원하지 않는 캐시 저장소입니다: {backend}")
+
+    return MemoryCacheBackend(maxsize=maxsize)
+
+
+class _InFlight:
+    """진행 중인 조회 (동일 키의 동시 요청이 결과를 공유)"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """
+    TTL 기반 캐시 (저장소 교체 가능)
+
+    - 항목마다 만료 시간(TTL)을 따로 지정
+    - 저장소는 CacheBackend 구현으로 교체 가능 (기본값: 프로세스 내부 LRU)
+    - 같은 키에 대한 동시 캐시 미스는 한 번의 조회 결과를 공유 (single-flight)
+    - 공유 저장소에서는 다른 프로세스가 조회 중인 키를 기다렸다가 결과를 재사용
+    """
+
+    # 다른 프로세스의 조회 결과를 기다리는 최대 시간 (초) 및 확인 간격
+    LEASE_TTL = 10.0
+    LEASE_POLL_INTERVAL = 0.05
+
+    def __init__(self, maxsize: int = 2048, backend: Optional[CacheBackend] = None):
+        self.backend = backend or MemoryCacheBackend(maxsize=maxsize)
+        self._inflight: Dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Tuple[bool, Any]: (적중 여부, 값)
+        """
+        found, value = self.backend.get(key)
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found, value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 유효 시간 (초)
+        """
+        self.backend.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        """캐시 항목 삭제"""
+        self.backend.delete(key)
+
+    def clear(self) -> None:
+        """전체 캐시 및 통계 초기화"""
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def single_flight(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        같은 키에 대한 동시 조회를 하나의 loader 호출로 병합 (결과는 캐시하지 않음)
+
+        Args:
+            key: 병합 키
+            loader: 조회 함수
+
+        Returns:
+            Any: loader 결과 (후속 요청은 선행 요청의 결과를 공유)
+        """
+        with self._lock:
+            inflight = self._inflight.get(key)
+            leader = inflight is None
+            if leader:
+                inflight = _InFlight()
+                self._inflight[key] = inflight
+
+        if not leader:
+            inflight.event.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return inflight.value
+
+        try:
+            inflight.value = loader()
+            return inflight.value
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            inflight.event.set()
+
+    def _wait_for_other_process(self, key: str) -> Tuple[bool, Any]:
+        """다른 프로세스가 조회 중인 키의 결과가 저장될 때까지 대기"""
+        deadline = time.monotonic() + self.LEASE_TTL
+        while time.monotonic() < deadline:
+            time.sleep(self.LEASE_POLL_INTERVAL)
+            found, value = self.backend.get(key)
+            if found:
+                return True, value
+            if self.backend.acquire_lease(key, self.LEASE_TTL):
+                # 상대 프로세스가 조회에 실패하여 권한이 반환됨
+                self.backend.release_lease(key)
+                break
+        return False, None
+
+    def get_or_load(self, key: str, ttl: float, loader: Callable[[], Any]) -> Any:
+        """
+        캐시 조회 후 없으면 loader로 조회하여 저장
+
+        같은 키를 동시에 조회하는 요청은 하나의 loader 호출 결과를 함께 사용합니다.
+        None 결과(조회 실패)는 캐시하지 않습니다.
+
+        Args:
+            key: 캐시 키
+            ttl: 유효 시간 (초)
+            loader: 캐시 미스 시 호출할 조회 함수
+
+        Returns:
+            Any: 캐시된 값 또는 loader 결과
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+
+        def load():
+            leased = self.backend.acquire_lease(key, self.LEASE_TTL)
+            if not leased:
+                found, value = self._wait_for_other_process(key)
+                if found:
+                    return value
+
+            try:
+                value = loader()
+                if value is not None:
+                    self.set(key, value, ttl)
+                return value
+            finally:
+                if leased:
+                    self.backend.release_lease(key)
+
+        return self.single_flight(key, load)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict: 저장소 종류, 항목 수, 적중/미스 횟수, 적중률, 제거 횟수
+        """
+        with self._lock:
+            hits = self.hits
+            misses = self.misses
+
+        total = hits + misses
+        return {
+            "backend": type(self.backend).__name__,
+            "size": self.backend.size(),
+            "maxsize": getattr(self.backend, "maxsize", None),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "evictions": getattr(self.backend, "evictions", 0),
+        }
@@ -0,0 +1,252 @@
+import tempfile
+from datetime import date
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+from models.stock import HistoricalColumns, TrendingStocksResult
+
+
+# 공용 스타일 구성 요소 (불변 객체이므로 모든 통합 문서에서 공유)
+FONT_NAME = '맑은 고딕'
+THIN_SIDE = Side(style='thin', color='000000')
+THIN_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+HEADER_FILL = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+UP_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+DOWN_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+
+# 숫자 서식
+PRICE_FORMAT = '"$"#,##0.00'
+PERCENT_FORMAT = '+0.0%;-0.0%;0.0%'
+INTEGER_FORMAT = '#,##0'
+SCORE_FORMAT = '0.0'
+DATE_FORMAT = 'yyyy-mm-dd'
+
+# 스트리밍 응답 조각 크기
+CHUNK_SIZE = 64 * 1024
+
+
+def _style(
+    name: str,
+    size: int = 10,
+    bold: bool = False,
+    color: Optional[str] = None,
+    fill: Optional[PatternFill] = None,
+    horizontal: str = 'left',
+    number_format: str = 'General',
+    border: bool = True
+) -> NamedStyle:
+    style = NamedStyle(name=name)
+    style.font = Font(name=FONT_NAME, size=size, bold=bold, color=color)
+    if fill is not None:
+        style.fill = fill
+    if border:
+        style.border = THIN_BORDER
+    style.alignment = Alignment(horizontal=horizontal, vertical='center')
+    style.number_format = number_format
+    return style
+
+
+def _named_styles() -> List[NamedStyle]:
+    """
+    통합 문서에 등록할 이름 있는 스타일 목록
+
+    셀마다 Font/PatternFill/Border를 새로 만들지 않고, 통합 문서당 한 번 등록한 스타일을 이름으로 참조합니다.
+    (NamedStyle은 등록한 통합 문서에 묶이므로 통합 문서마다 새로 생성)
+    """
+    return [
+        _style('title', size=14, bold=True, color="1F4E78", horizontal='center', border=False),
+        _style('header', size=11, bold=True, color="FFFFFF", fill=HEADER_FILL, horizontal='center'),
+        _style('rank', horizontal='center'),
+        _style('text'),
+        _style('price', horizontal='right', number_format=PRICE_FORMAT),
+        _style('integer', horizontal='right', number_format=INTEGER_FORMAT),
+        _style('score', horizontal='right', number_format=SCORE_FORMAT),
+        _style('date', horizontal='center', number_format=DATE_FORMAT),
+        _style('change', horizontal='right', number_format=PERCENT_FORMAT),
+        _style('change_up', bold=True, color="006100", fill=UP_FILL, horizontal='right', number_format=PERCENT_FORMAT),
+        _style('change_down', bold=True, color="9C0006", fill=DOWN_FILL, horizontal='right', number_format=PERCENT_FORMAT),
+    ]
+
+
+class ExcelExportService:
+    """
+    엑셀 내보내기 서비스
+
+    openpyxl 쓰기 전용(write-only) 모드로 행을 순서대로 기록하므로,
+    수천 행의 화제 종목이나 수년치 과거 데이터를 내보내도 메모리 사용량이 행 수에 비례해 늘지 않습니다.
+    """
+
+    TRENDING_COLUMNS = [
+        ("순위", 8, 'rank'),
+        ("티커", 10, 'text'),
+        ("종목명", 28, 'text'),
+        ("주가", 12, 'price'),
+        ("등락률", 12, 'change'),
+        ("거래량", 16, 'integer'),
+        ("시가총액", 20, 'integer'),
+        ("복합 점수", 11, 'score'),
+        ("섹터", 22, 'text'),
+        ("출현 스크리너", 36, 'text'),
+    ]
+    HISTORY_COLUMNS = [
+        ("날짜", 12, 'date'),
+        ("시가", 12, 'price'),
+        ("고가", 12, 'price'),
+        ("저가", 12, 'price'),
+        ("종가", 12, 'price'),
+        ("거래량", 16, 'integer'),
+    ]
+
+    @staticmethod
+    def new_workbook() -> Workbook:
+        """이름 있는 스타일이 등록된 쓰기 전용 통합 문서 생성"""
+        workbook = Workbook(write_only=True)
+        for style in _named_styles():
+            workbook.add_named_style(style)
+        return workbook
+
+    @staticmethod
+    def _cell(sheet: Any, value, style: str) -> WriteOnlyCell:
+        """
+        스타일이 지정된 셀 생성
+
+        통합 문서에 등록한 이름 있는 스타일을 이름으로만 참조하므로
+        셀마다 Font/PatternFill/Border 객체를 만들거나 비교하지 않습니다.
+        """
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.style = style
+        return cell
+
+    @staticmethod
+    def _begin_sheet(workbook: Workbook, title: str, heading: str, columns: list) -> Any:
+        """시트 생성 후 제목 행(병합)과 머리글 행 기록 (쓰기 전용 시트는 열 너비를 행보다 먼저 지정해야 함)"""
+        sheet = workbook.create_sheet(title=title[:31])
+        for index, (_, width, _) in enumerate(columns, 1):
+            sheet.column_dimensions[get_column_letter(index)].width = width
+        sheet.merged_cells.add(f"A1:{get_column_letter(len(columns))}1")
+        sheet.row_dimensions[1].height = 25
+        sheet.row_dimensions[2].height = 20
+        sheet.freeze_panes = 'A3'
+
+        cell = ExcelExportService._cell
+        sheet.append([cell(sheet, heading, 'title')])
+        sheet.append([cell(sheet, name, 'header') for name, _, _ in columns])
+        return sheet
+
+    @staticmethod
+    def _change_style(change_percent: Optional[float]) -> str:
+        if change_percent is None or change_percent == 0:
+            return 'change'
+        return 'change_up' if change_percent > 0 else 'change_down'
+
+    @staticmethod
+    def write_trending_sheet(workbook: Workbook, result: TrendingStocksResult, title: str = "화제 종목") -> int:
+        """
+        화제 종목 시트 기록
+
+        Args:
+            workbook: new_workbook()으로 만든 통합 문서
+            result: 화제 종목 목록 조회 결과
+            title: 시트 이름
+
+        Returns:
+            int: 기록한 종목 수
+        """
+        collected = result.market_summary.collection_time[:10].replace("-", ".")
+        heading = f"{title} TOP {len(result.trending_stocks)} | {collected}"
+        sheet = ExcelExportService._begin_sheet(workbook, title, heading, ExcelExportService.TRENDING_COLUMNS)
+        cell = ExcelExportService._cell
+
+        for stock in result.trending_stocks:
+            change = stock.change_percent / 100 if stock.change_percent is not None else None
+            sheet.append([
+                cell(sheet, stock.rank, 'rank'),
+                cell(sheet, stock.symbol, 'text'),
+                cell(sheet, stock.name, 'text'),
+                cell(sheet, stock.price, 'price'),
+                cell(sheet, change, ExcelExportService._change_style(stock.change_percent)),
+                cell(sheet, stock.volume, 'integer'),
+                cell(sheet, stock.market_cap, 'integer'),
+                cell(sheet, stock.composite_score, 'score'),
+                cell(sheet, stock.sector, 'text'),
+                cell(sheet, ", ".join(stock.sources), 'text'),
+            ])
+        return len(result.trending_stocks)
+
+    @staticmethod
+    def write_history_sheet(workbook: Workbook, data: HistoricalColumns) -> int:
+        """
+        과거 데이터 시트 기록 (종목별 시트, 열 단위 데이터를 행으로 순회)
+
+        Args:
+            workbook: new_workbook()으로 만든 통합 문서
+            data: 열 단위 과거 데이터
+
+        Returns:
+            int: 기록한 행 수
+        """
+        heading = f"{data.symbol} 일봉 ({data.period})"
+        sheet = ExcelExportService._begin_sheet(workbook, data.symbol, heading, ExcelExportService.HISTORY_COLUMNS)
+        cell = ExcelExportService._cell
+
+        for day, open_, high, low, close, volume in zip(
+            data.date, data.open, data.high, data.low, data.close, data.volume
+        ):
+            sheet.append([
+                cell(sheet, date.fromisoformat(day[:10]), 'date'),
+                cell(sheet, open_, 'price'),
+                cell(sheet, high, 'price'),
+                cell(sheet, low, 'price'),
+                cell(sheet, close, 'price'),
+                cell(sheet, volume, 'integer'),
+            ])
+        return len(data.date)
+
+    @staticmethod
+    def iter_workbook(writers: Iterable[Callable[[Workbook], object]]) -> Iterator[bytes]:
+        """
+        통합 문서를 작성하여 조각 단위로 반환 (스트리밍 응답용)
+
+        쓰기 전용 통합 문서는 임시 파일에 저장한 뒤 CHUNK_SIZE씩 읽어서 내보내므로
+        완성된 파일 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            writers: 통합 문서에 시트를 기록하는 함수 목록
+
+        Yields:
+            bytes: xlsx 파일 조각
+        """
+        workbook = ExcelExportService.new_workbook()
+        for write in writers:
+            write(workbook)
+
+        with tempfile.TemporaryFile() as f:
+            workbook.save(f)
+            f.seek(0)
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    @staticmethod
+    def save_workbook(path: str, writers: Iterable[Callable[[Workbook], object]]) -> str:
+        """
+        통합 문서를 작성하여 파일로 저장
+
+        Args:
+            path: 저장 경로
+            writers: 통합 문서에 시트를 기록하는 함수 목록
+
+        Returns:
+            str: 저장 경로
+        """
+        workbook = ExcelExportService.new_workbook()
+        for write in writers:
+            write(workbook)
+        workbook.save(path)
+        return path
@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from starlette.requests import Request
+
+
+class UpstreamTimeoutError(Exception):
+    """서비스 호출이 제한 시간 안에 끝나지 않음"""
+
+
+class ClientDisconnectedError(Exception):
+    """서비스 호출이 끝나기 전에 클라이언트 연결이 끊어짐"""
+
+
+class UpstreamExecutor:
+    """
+    블로킹 서비스 호출(yahooquery)을 전용 스레드 풀에서 실행
+
+    FastAPI 핸들러는 async이므로 블로킹 호출을 직접 실행하면 이벤트 루프 전체가 멈춥니다.
+    동시 실행 수는 스레드 풀 크기로 제한되며, 호출마다 제한 시간을 두고
+    클라이언트 연결이 끊어지면 대기 중인 호출을 취소합니다.
+    """
+
+    # 클라이언트 연결 종료 확인 간격 (초)
+    DISCONNECT_POLL_INTERVAL = 0.2
+
+    def __init__(self, max_workers: int = 16, timeout: float = 15.0):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="upstream"
+        )
+
+    async def _wait_disconnect(self, request: Request) -> None:
+        while not await request.is_disconnected():
+            await asyncio.sleep(self.DISCONNECT_POLL_INTERVAL)
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        request: Optional[Request] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        함수를 스레드 풀에서 실행하고 결과를 기다림
+
+        Args:
+            func: 실행할 블로킹 함수
+            *args: 함수 인자
+            request: 연결 종료를 감지할 요청 (지정 시 연결이 끊어지면 호출 취소)
+            timeout: 제한 시간 (초, 기본값: 실행기 설정값)
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            Any: 함수 반환값
+
+        Raises:
+            UpstreamTimeoutError: 제한 시간 초과
+            ClientDisconnectedError: 클라이언트 연결 종료
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
+        watcher = asyncio.ensure_future(self._wait_disconnect(request)) if request else None
+
+        waiters = {future, watcher} if watcher else {future}
+        try:
+            done, _ = await asyncio.wait(
+                waiters,
+                timeout=timeout if timeout is not None else self.timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        finally:
+            if watcher:
+                watcher.cancel()
+
+        if future in done:
+            return future.result()
+
+        # 아직 시작되지 않은 호출은 취소됨 (실행 중인 스레드는 끝까지 실행)
+        future.cancel()
+        if watcher in done:
+            raise ClientDisconnectedError()
+        raise UpstreamTimeoutError(f"{getattr(func, '__name__', 'call')} 호출 시간이 초과되었습니다.")
+
+    def shutdown(self) -> None:
+        """스레드 풀 종료 (대기 중인 호출 취소)"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# 서비스 전역 실행기 (환경 변수로 동시 실행 수와 제한 시간 설정)
+executor = UpstreamExecutor(
+    max_workers=int(os.getenv("STOCK_SERVICE_MAX_WORKERS", "16")),
+    timeout=float(os.getenv("STOCK_SERVICE_TIMEOUT", "15"))
+)
+
+
+async def run_blocking(
+    func: Callable[..., Any],
+    *args: Any,
+    request: Optional[Request] = None,
+    timeout: Optional[float] = None,
+    **kwargs: Any
+) -> Any:
+    """전역 실행기에서 블로킹 함수 실행 (UpstreamExecutor.run 참고)"""
+    return await executor.run(func, *args, request=request, timeout=timeout, **kwargs)
@@ -0,0 +1,233 @@
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# 저장하는 열 (date는 1970-01-01 기준 일수, 나머지는 float64이며 결측치는 NaN)
+BAR_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# 기간별 시작일 계산 (1d, 5d는 최근 거래일 수 기준)
+PERIOD_OFFSETS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+    '5y': pd.DateOffset(years=5),
+    '10y': pd.DateOffset(years=10),
+}
+PERIOD_BARS = {
+    '1d': 1,
+    '5d': 5,
+}
+
+# 전체 기간(max)을 보유했음을 나타내는 시작일
+FULL_COVERAGE = np.iinfo(np.int32).min
+
+
+def history_to_bars(hist: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    yahooquery history DataFrame을 열별 NumPy 배열로 변환
+
+    Args:
+        hist: ticker.history() 결과 (index: date 또는 (symbol, date))
+
+    Returns:
+        Dict: date(int32 일수), open, high, low, close, volume(float64) 배열
+    """
+    index = hist.index
+    dates = index.get_level_values(-1) if isinstance(index, pd.MultiIndex) else index
+
+    try:
+        date_index = pd.DatetimeIndex(dates)
+        if date_index.tz is not None:
+            # 현지 시각 기준 날짜 유지
+            date_index = date_index.tz_localize(None)
+        days = date_index.to_numpy().astype('datetime64[D]')
+    except (TypeError, ValueError):
+        # 장중 마지막 행처럼 타임존이 섞여 있으면 개별 변환
+        days = np.array([d.strftime('%Y-%m-%d') for d in dates], dtype='datetime64[D]')
+
+    bars = {'date': days.astype(np.int32)}
+    for name in BAR_COLUMNS:
+        if name in hist.columns:
+            bars[name] = pd.to_numeric(hist[name], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            bars[name] = np.full(len(days), np.nan)
+    return bars
+
+
+def merge_bars(old: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    두 일봉 배열을 날짜순으로 병합 (같은 날짜는 새 데이터로 교체)
+
+    Args:
+        old: 기존 일봉 배열
+        new: 새로 조회한 일봉 배열
+
+    Returns:
+        Dict: 병합된 일봉 배열
+    """
+    merged = {name: np.concatenate([old[name], new[name]]) for name in ['date'] + BAR_COLUMNS}
+
+    # 뒤쪽(새 데이터)을 우선하도록 역순에서 날짜별 첫 항목 선택
+    reversed_dates = merged['date'][::-1]
+    _, first = np.unique(reversed_dates, return_index=True)
+    keep = len(reversed_dates) - 1 - first
+    return {name: values[keep] for name, values in merged.items()}
+
+
+class HistoryStore:
+    """
+    종목별 일봉(OHLCV) 로컬 저장소
+
+    종목마다 .npz 파일 하나에 열별 배열과 메타 정보(보유 시작일, 마지막 조회 시각)를 저장합니다.
+    기간 조회는 저장된 배열을 잘라서 응답하고, 업스트림에서는 마지막 저장일 이후만 추가로 받습니다.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def lock(self, symbol: str) -> threading.Lock:
+        """종목별 갱신 잠금"""
+        with self._locks_lock:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.directory, f"{symbol.upper()}.npz")
+
+    def load(self, symbol: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        저장된 일봉 조회
+
+        Returns:
+            Dict: 열별 배열과 covered_from(보유 시작일), fetched_at(마지막 조회 시각) 또는 None
+        """
+        path = self._path(symbol)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path) as data:
+                return {name: data[name] for name in data.files}
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading history store for {symbol}: {str(e)}")
+            return None
+
+    def save(self, symbol: str, bars: Dict[str, np.ndarray]) -> None:
+        """일봉 저장 (임시 파일에 쓴 뒤 교체하여 다른 프로세스가 불완전한 파일을 읽지 않도록 함)"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **bars)
+            os.replace(tmp_path, self._path(symbol))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def period_start(period: str, today: Optional[np.datetime64] = None) -> int:
+        """
+        기간의 시작일 (1970-01-01 기준 일수, max는 FULL_COVERAGE)
+
+        1d, 5d처럼 거래일 수로 정의된 기간에는 사용하지 않습니다.
+        """
+        today = today if today is not None else np.datetime64('today', 'D')
+        if period == 'max':
+            return FULL_COVERAGE
+        if period == 'ytd':
+            return int(today.astype('datetime64[Y]').astype('datetime64[D]').astype(np.int32))
+
+        start = pd.Timestamp(today) - PERIOD_OFFSETS[period]
+        return int(np.datetime64(start.date(), 'D').astype(np.int32))
+
+    @staticmethod
+    def coverage_start(period: str, bars: Dict[str, np.ndarray]) -> int:
+        """기간 조회로 받은 일봉이 보장하는 보유 시작일"""
+        if period in PERIOD_BARS:
+            return int(bars['date'][0])
+        return HistoryStore.period_start(period)
+
+    @staticmethod
+    def slice_period(bars: Dict[str, np.ndarray], period: str) -> Dict[str, np.ndarray]:
+        """저장된 일봉에서 기간에 해당하는 구간만 선택"""
+        if period in PERIOD_BARS:
+            count = PERIOD_BARS[period]
+            return {name: bars[name][-count:] for name in ['date'] + BAR_COLUMNS}
+
+        start = HistoryStore.period_start(period)
+        first = int(np.searchsorted(bars['date'], start, side='left'))
+        return {name: bars[name][first:] for name in ['date'] + BAR_COLUMNS}
+
+    @staticmethod
+    def is_covered(bars: Dict[str, np.ndarray], period: str) -> bool:
+        """저장된 일봉이 기간 전체를 포함하는지 확인"""
+        if period in PERIOD_BARS:
+            return len(bars['date']) >= PERIOD_BARS[period]
+        return int(bars['covered_from']) <= HistoryStore.period_start(period)
+
+    @staticmethod
+    def covering_period(covered_from: int) -> str:
+        """보유 시작일을 포함하는 가장 짧은 조회 기간 (전체 다시 받기용)"""
+        if covered_from <= FULL_COVERAGE:
+            return 'max'
+        for period in PERIOD_OFFSETS:
+            if HistoryStore.period_start(period) <= covered_from:
+                return period
+        return 'max'
+
+    @staticmethod
+    def covered_at(bars: Dict[str, np.ndarray]) -> float:
+        """보유 기간 전체를 마지막으로 받은 시각 (이전 형식 파일은 0)"""
+        return float(bars['covered_at']) if 'covered_at' in bars else 0.0
+
+    @staticmethod
+    def is_expired(bars: Dict[str, np.ndarray], max_age: float) -> bool:
+        """보유 기간 전체를 마지막으로 받은 지 max_age(초)가 지났는지 확인"""
+        return time.time() - HistoryStore.covered_at(bars) >= max_age
+
+    @staticmethod
+    def is_adjusted(stored: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> bool:
+        """
+        다시 받은 일봉의 종가가 저장된 같은 날짜의 종가와 다른지 확인 (액면분할, 배당 수정주가 반영)
+
+        장중에 저장되었을 수 있는 마지막 저장일은 비교하지 않습니다. (마감된 봉만 비교)
+        """
+        closed = stored['date'][:-1] if len(stored['date']) > 1 else stored['date']
+        common, stored_index, new_index = np.intersect1d(closed, new['date'], return_indices=True)
+        if len(common) == 0:
+            return False
+        old_close = stored['close'][stored_index]
+        new_close = new['close'][new_index]
+        valid = ~(np.isnan(old_close) | np.isnan(new_close))
+        return not np.allclose(old_close[valid], new_close[valid], rtol=1e-4)
+
+    @staticmethod
+    def with_meta(
+        bars: Dict[str, np.ndarray],
+        covered_from: int,
+        covered_at: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        보유 시작일, 전체 기간 조회 시각, 마지막 조회 시각을 포함한 저장용 배열
+
+        Args:
+            bars: 일봉 배열
+            covered_from: 보유 시작일
+            covered_at: 보유 기간 전체를 마지막으로 받은 시각 (기본값: 현재 시각)
+        """
+        now = time.time()
+        result = {name: bars[name] for name in ['date'] + BAR_COLUMNS}
+        result['covered_from'] = np.array(covered_from, dtype=np.int64)
+        result['covered_at'] = np.array(now if covered_at is None else covered_at)
+        result['fetched_at'] = np.array(now)
+        return result
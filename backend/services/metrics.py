@@ -0,0 +1,237 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# 응답 시간/업스트림 호출 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class _Shard:
+    """스레드별 측정값 (소유 스레드만 기록하므로 잠금 없음)"""
+
+    __slots__ = ('thread', 'counters', 'histograms')
+
+    def __init__(self, thread: Optional[threading.Thread] = None):
+        self.thread = thread
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.histograms: Dict[Tuple[str, Labels], List[float]] = {}
+
+    def merge_into(
+        self,
+        counters: Dict[Tuple[str, Labels], float],
+        histograms: Dict[Tuple[str, Labels], List[float]]
+    ) -> None:
+        """측정값을 합산 대상에 더함"""
+        # dict 복사는 GIL 아래에서 한 번에 수행되므로 기록 중인 스레드와 충돌하지 않음
+        for key, value in dict(self.counters).items():
+            counters[key] = counters.get(key, 0) + value
+        for key, values in dict(self.histograms).items():
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = list(values)
+            else:
+                for i, value in enumerate(values):
+                    merged[i] += value
+
+
+class MetricsRegistry:
+    """
+    카운터/히스토그램 수집기 (Prometheus 텍스트 형식 출력)
+
+    측정값은 스레드별 저장소(shard)에 기록하므로 기록할 때 잠금을 잡지 않습니다.
+    잠금은 스레드가 처음 기록할 때(저장소 등록)와 /metrics 조회 시 저장소 목록을 복사할 때만 사용하며,
+    조회 시 모든 스레드의 값을 합산합니다.
+    요청마다 만들어지는 짧은 스레드의 저장소가 쌓이지 않도록, 종료된 스레드의 저장소는
+    등록/조회 시 하나의 누적 저장소(retired)에 합친 뒤 목록에서 제거합니다.
+    """
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # 처리 중인 요청 수 (MetricsMiddleware가 이벤트 루프 스레드에서만 갱신)
+        self.in_flight = 0
+        self._descriptions: Dict[str, Tuple[str, str]] = {}
+        self._shards: List[_Shard] = []
+        self._retired = _Shard()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, metric_type: str, help_text: str) -> None:
+        """지표 종류(counter, histogram)와 설명 등록"""
+        self._descriptions[name] = (metric_type, help_text)
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._retire_finished()
+                self._shards.append(shard)
+        return shard
+
+    def _retire_finished(self) -> None:
+        """종료된 스레드의 저장소를 누적 저장소에 합치고 목록에서 제거 (잠금을 잡은 상태에서 호출)"""
+        finished = [shard for shard in self._shards if not shard.thread.is_alive()]
+        if not finished:
+            return
+        for shard in finished:
+            shard.merge_into(self._retired.counters, self._retired.histograms)
+        self._shards = [shard for shard in self._shards if shard.thread.is_alive()]
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1) -> None:
+        """카운터 증가"""
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        """히스토그램에 값 기록 (구간별 개수, 합계, 개수)"""
+        histograms = self._shard().histograms
+        key = (name, labels)
+        values = histograms.get(key)
+        if values is None:
+            # 구간별 개수 + (+Inf 구간) + 합계 + 개수
+            values = histograms[key] = [0.0] * (len(self.buckets) + 3)
+        values[bisect_left(self.buckets, value)] += 1
+        values[-2] += value
+        values[-1] += 1
+
+    def collect(self) -> Tuple[Dict[Tuple[str, Labels], float], Dict[Tuple[str, Labels], List[float]]]:
+        """
+        모든 스레드의 측정값 합산
+
+        Returns:
+            Tuple: (카운터 값, 히스토그램 값)
+        """
+        counters: Dict[Tuple[str, Labels], float] = {}
+        histograms: Dict[Tuple[str, Labels], List[float]] = {}
+        with self._lock:
+            self._retire_finished()
+            shards = list(self._shards)
+            # 누적 저장소는 잠금 안에서만 바뀌므로 잠금을 잡은 채로 합산
+            self._retired.merge_into(counters, histograms)
+
+        for shard in shards:
+            shard.merge_into(counters, histograms)
+        return counters, histograms
+
+    def render(self, gauges: Iterable[Tuple[str, str, Labels, float]] = ()) -> str:
+        """
+        Prometheus 텍스트 형식 출력
+
+        Args:
+            gauges: 조회 시점에 계산한 추가 지표 (이름, 종류, 레이블, 값)
+
+        Returns:
+            str: text/plain; version=0.0.4 형식 본문
+        """
+        counters, histograms = self.collect()
+        samples: Dict[str, List[str]] = {}
+
+        for (name, labels), value in sorted(counters.items()):
+            samples.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for (name, labels), values in sorted(histograms.items()):
+            lines = samples.setdefault(name, [])
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float('inf'),), values):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else _format_value(bound)
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(values[-2])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(values[-1])}")
+
+        types = {name: description[0] for name, description in self._descriptions.items()}
+        for name, metric_type, labels, value in gauges:
+            types.setdefault(name, metric_type)
+            samples.setdefault(name, []).append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        output = []
+        for name, lines in samples.items():
+            metric_type, help_text = self._descriptions.get(name, (types.get(name, 'untyped'), ''))
+            if help_text:
+                output.append(f"# HELP {name} {help_text}")
+            output.append(f"# TYPE {name} {metric_type}")
+            output.extend(lines)
+        return "\n".join(output) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(str(value))}"' for key, value in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return 'NaN'
+    if value in (float('inf'), float('-inf')):
+        return '+Inf' if value > 0 else '-Inf'
+    return str(int(value)) if value == int(value) else repr(float(value))
+
+
+class MetricsMiddleware:
+    """
+    라우트별 응답 시간 측정 ASGI 미들웨어
+
+    응답 본문 전송이 끝날 때까지의 시간을 (메서드, 경로 템플릿, 상태 코드)별 히스토그램으로 기록하고,
+    처리 중인 요청 수를 집계합니다. 경로 템플릿(/stocks/quote/{symbol})으로 기록하므로 심볼별로 지표가 늘지 않습니다.
+    이벤트 루프 스레드에서만 실행되므로 처리 중 요청 수(registry.in_flight)는 잠금 없이 갱신합니다.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry, exclude: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.registry = registry
+        self.exclude = set(exclude)
+        self._route_paths: Dict[Callable, str] = {}
+
+    def _route_path(self, scope: Dict[str, Any]) -> str:
+        endpoint = scope.get('endpoint')
+        if endpoint is None:
+            return 'unmatched'
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            # 라우터가 scope에 남긴 엔드포인트로 경로 템플릿 조회 (엔드포인트별 한 번)
+            path = next(
+                (route.path for route in scope['app'].routes if getattr(route, 'endpoint', None) is endpoint),
+                scope['path']
+            )
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        self.registry.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.registry.in_flight -= 1
+            self.registry.observe(
+                'http_request_duration_seconds',
+                (('method', scope['method']), ('route', self._route_path(scope)), ('status', str(status))),
+                time.perf_counter() - started
+            )
+
+
+# 앱 전역 지표 수집기
+metrics = MetricsRegistry()
+metrics.describe('http_request_duration_seconds', 'histogram', '라우트별 응답 시간 (초, 응답 본문 전송 완료까지)')
@@ -0,0 +1,151 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Set
+
+from services.executor import run_blocking
+from services.stock_service import StockService
+
+
+class QuoteSubscription:
+    """실시간 시세 구독 (클라이언트 연결 1개)"""
+
+    # 구독자별 대기 이벤트 최대 개수 (느린 클라이언트는 전체 스냅샷으로 재동기화)
+    QUEUE_SIZE = 100
+
+    def __init__(self, symbols: Set[str]):
+        self.symbols = symbols
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+
+
+class QuoteStreamHub:
+    """
+    실시간 시세 공유 폴러
+
+    구독 중인 모든 종목을 하나의 백그라운드 작업이 주기적으로 일괄 조회하고,
+    값이 바뀐 필드만 해당 종목의 구독자들에게 전달합니다.
+    업스트림 호출 수는 접속자 수가 아니라 구독 중인 종목 수에만 비례합니다.
+    """
+
+    def __init__(self, interval: float = 15.0):
+        self.interval = interval
+        self._subscriptions: Set[QuoteSubscription] = set()
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def symbols(self) -> List[str]:
+        """구독 중인 전체 종목 (중복 제거)"""
+        symbols: Set[str] = set()
+        for subscription in self._subscriptions:
+            symbols |= subscription.symbols
+        return sorted(symbols)
+
+    def subscribe(self, symbols: List[str]) -> QuoteSubscription:
+        """
+        종목 구독 시작
+
+        이미 조회된 종목은 즉시 스냅샷을 받고, 나머지는 다음 폴링에서 받습니다.
+
+        Args:
+            symbols: 구독할 종목 심볼 목록
+
+        Returns:
+            QuoteSubscription: 구독 정보 (queue에서 이벤트를 꺼내 사용)
+        """
+        subscription = QuoteSubscription({symbol.upper() for symbol in symbols})
+        self._subscriptions.add(subscription)
+
+        snapshot = self._snapshot(subscription.symbols)
+        if snapshot:
+            subscription.queue.put_nowait({"event": "snapshot", "data": snapshot})
+
+        # 새 종목은 다음 주기를 기다리지 않고 바로 조회
+        if any(symbol not in self._latest for symbol in subscription.symbols):
+            self._wakeup.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription) -> None:
+        """구독 종료 (구독자가 없는 종목의 최신 값은 정리)"""
+        self._subscriptions.discard(subscription)
+        active = set(self.symbols())
+        for symbol in list(self._latest):
+            if symbol not in active:
+                del self._latest[symbol]
+
+    def _snapshot(self, symbols: Set[str]) -> Dict[str, Dict[str, Any]]:
+        return {symbol: self._latest[symbol] for symbol in symbols if symbol in self._latest}
+
+    def _deliver(self, subscription: QuoteSubscription, event: Dict[str, Any]) -> None:
+        try:
+            subscription.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 밀린 변경분을 버리고 현재 전체 값으로 재동기화
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+            subscription.queue.put_nowait({
+                "event": "snapshot",
+                "data": self._snapshot(subscription.symbols)
+            })
+
+    async def poll_once(self) -> None:
+        """구독 중인 종목을 한 번 일괄 조회하고 변경분을 전달"""
+        symbols = self.symbols()
+        if not symbols:
+            return
+
+        batch = await run_blocking(StockService.get_stock_quotes, symbols)
+
+        changes: Dict[str, Dict[str, Any]] = {}
+        for symbol, quote in batch.quotes.items():
+            current = quote.price.model_dump()
+            previous = self._latest.get(symbol, {})
+            changed = {
+                field: value for field, value in current.items()
+                if previous.get(field) != value
+            }
+            if changed:
+                self._latest[symbol] = current
+                changes[symbol] = changed
+
+        if not changes:
+            return
+
+        for subscription in list(self._subscriptions):
+            updates = {symbol: changes[symbol] for symbol in subscription.symbols if symbol in changes}
+            if updates:
+                self._deliver(subscription, {"event": "update", "data": updates})
+
+    async def _run(self) -> None:
+        """구독자가 있는 동안 주기적으로 폴링"""
+        while self._subscriptions:
+            self._wakeup.clear()
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error polling quote stream: {str(e)}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self) -> None:
+        """폴러 종료 (앱 종료 시 호출)"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+# 앱 전역 시세 허브 (폴링 주기는 QUOTE_STREAM_INTERVAL 초, 기본값은 가격 캐시 유효 시간)
+quote_hub = QuoteStreamHub(
+    interval=float(os.getenv("QUOTE_STREAM_INTERVAL", str(StockService.PRICE_CACHE_TTL)))
+)
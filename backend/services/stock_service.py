@@ -1,17 +1,365 @@
-from yahooquery import Ticker, Screener
-from typing import Optional, Dict, Any, List
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+from typing import Optional, Dict, Any, List, Tuple
 from models.stock import (
     StockInfo,
     StockPrice,
     StockQuote,
+    StockQuoteBatch,
     HistoricalData,
-    HistoricalDataPoint
+    HistoricalDataPoint,
+    HistoricalColumns
 )
+from services.batch_dispatcher import BatchDispatcher
+from services.cache import TTLCache, create_cache_backend
+from services.history_store import HistoryStore, BAR_COLUMNS, PERIOD_BARS, history_to_bars, merge_bars
+from services.upstream import upstream, UpstreamUnavailableError
+from services.yahoo_client import yahoo_client
 
 
 class StockService:
     """주식 데이터 조회 서비스"""
 
+    # 종합 정보 조회에 필요한 quoteSummary 모듈 (한 번의 요청으로 함께 조회)
+    QUOTE_MODULES = ['price', 'summaryDetail', 'assetProfile']
+    # 가격 정보 조회에 필요한 모듈 (기본 정보가 캐시되어 있을 때 사용)
+    PRICE_MODULES = ['price', 'summaryDetail']
+
+    # 데이터 종류별 캐시 유효 시간 (초)
+    INFO_CACHE_TTL = 6 * 60 * 60      # 회사명, 섹터, 산업 등은 거의 변하지 않음
+    PRICE_CACHE_TTL = 15
+    SCREENER_CACHE_TTL = 60
+    HISTORY_CACHE_TTL = {
+        '1d': 60,
+        '5d': 5 * 60,
+        '1mo': 15 * 60,
+        '3mo': 30 * 60,
+        '6mo': 60 * 60,
+        'ytd': 60 * 60,
+        '1y': 60 * 60,
+        '2y': 6 * 60 * 60,
+        '5y': 6 * 60 * 60,
+        '10y': 12 * 60 * 60,
+        'max': 12 * 60 * 60,
+    }
+    DEFAULT_HISTORY_CACHE_TTL = 15 * 60
+
+    # 로컬 일봉 저장소의 당일 봉 재조회 간격 (초)
+    HISTORY_TAIL_REFRESH_INTERVAL = 60
+    # 로컬 일봉 저장소의 보유 기간 전체 재조회 간격 (초, 놓친 수정주가 반영을 주기적으로 바로잡음)
+    HISTORY_FULL_REFRESH_INTERVAL = 7 * 24 * 60 * 60
+
+    # 종목별 일봉 로컬 저장소 (기간 조회 시 부족한 최신 구간만 추가로 받음)
+    history_store = HistoryStore(
+        os.getenv(
+            "STOCK_HISTORY_DIR",
+            os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "history")
+        )
+    )
+
+    # 서비스 전역 캐시 (STOCK_CACHE_BACKEND=sqlite 이면 워커 간 공유)
+    cache = TTLCache(
+        backend=create_cache_backend(
+            models=[StockInfo, StockPrice, HistoricalColumns],
+            maxsize=2048
+        )
+    )
+
+    # 단건 모듈 조회 묶음 처리 (STOCK_BATCH_WINDOW_MS 동안 모인 종목을 한 번의 다중 심볼 요청으로 조회)
+    BATCH_WINDOW = float(os.getenv("STOCK_BATCH_WINDOW_MS", "5")) / 1000
+    BATCH_MAX_SIZE = int(os.getenv("STOCK_BATCH_MAX_SIZE", "50"))
+    _dispatchers: Dict[Tuple[str, ...], BatchDispatcher] = {}
+    _dispatchers_lock = threading.Lock()
+
+    @staticmethod
+    def _modules_dispatcher(modules: List[str]) -> BatchDispatcher:
+        """모듈 조합별 묶음 처리기 (최초 사용 시 생성)"""
+        key = tuple(modules)
+        dispatcher = StockService._dispatchers.get(key)
+        if dispatcher is None:
+            with StockService._dispatchers_lock:
+                dispatcher = StockService._dispatchers.get(key)
+                if dispatcher is None:
+                    dispatcher = BatchDispatcher(
+                        lambda symbols: StockService._dispatch_modules(symbols, list(key)),
+                        window=StockService.BATCH_WINDOW,
+                        max_batch=StockService.BATCH_MAX_SIZE
+                    )
+                    StockService._dispatchers[key] = dispatcher
+        return dispatcher
+
+    @staticmethod
+    def dispatcher_stats() -> Dict[str, Any]:
+        """모듈 조합별 묶음 처리 통계"""
+        return {",".join(key): dispatcher.stats() for key, dispatcher in StockService._dispatchers.items()}
+
+    @staticmethod
+    def _fetch_modules(symbol: str, modules: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        quoteSummary 모듈 조회
+
+        같은 시점에 들어온 다른 종목의 단건 조회와 묶어 한 번의 다중 심볼 요청으로 조회하며,
+        대기 중이거나 조회 중인 같은 종목 요청은 결과를 공유합니다.
+
+        Args:
+            symbol: 주식 심볼
+            modules: 조회할 모듈 목록 (예: price, summaryDetail, assetProfile)
+
+        Returns:
+            Dict: 모듈명별 데이터 또는 None (조회 실패 시)
+        """
+        return StockService._modules_dispatcher(modules).load(symbol.upper())
+
+    @staticmethod
+    def _dispatch_modules(symbols: List[str], modules: List[str]) -> Dict[str, Any]:
+        """
+        묶음 처리기의 일괄 조회 함수
+
+        Args:
+            symbols: 대문자 심볼 목록
+            modules: 조회할 모듈 목록
+
+        Returns:
+            Dict: 심볼별 모듈 데이터 (없는 심볼은 제외, 업스트림을 호출할 수 없고 보관된 데이터도 없으면 예외 객체)
+        """
+        try:
+            # 요청 전체가 실패하면 에러 메시지 문자열이 반환되므로 재시도
+            data = upstream.call(
+                'modules',
+                lambda: yahoo_client.ticker(symbols).get_modules(modules),
+                accept=lambda data: isinstance(data, dict),
+                module=StockService._module_label(modules)
+            )
+        except UpstreamUnavailableError as e:
+            # 업스트림을 호출할 수 없으면 마지막으로 받은 모듈 데이터로 응답
+            results: Dict[str, Any] = {}
+            for symbol in symbols:
+                stale = StockService._stale_modules(symbol, modules, 'modules')
+                results[symbol] = stale if stale is not None else e
+            return results
+
+        results = {}
+        for symbol in symbols:
+            modules_data = data.get(symbol)
+            # 에러 체크 (존재하지 않는 심볼은 에러 메시지 문자열로 반환됨)
+            if isinstance(modules_data, dict):
+                StockService._remember_modules(symbol, modules_data)
+                results[symbol] = modules_data
+        return results
+
+    @staticmethod
+    def _module_label(modules: List[str]) -> str:
+        """호출 시간 지표의 모듈 레이블 (예: ['price', 'summaryDetail'] → price+summary_detail)"""
+        return '+'.join(
+            ''.join(f"_{c.lower()}" if c.isupper() else c for c in module) for module in modules
+        )
+
+    @staticmethod
+    def _remember_modules(symbol: str, modules_data: Dict[str, Any]) -> None:
+        """모듈별 마지막 조회 결과 보관 (업스트림 차단 시 대신 응답)"""
+        for module, value in modules_data.items():
+            upstream.remember(f"modules:{symbol.upper()}:{module}", value)
+
+    @staticmethod
+    def _stale_modules(symbol: str, modules: List[str], operation: str) -> Optional[Dict[str, Any]]:
+        """보관된 모듈 데이터 조회 (요청한 모듈이 모두 있을 때만 반환)"""
+        stale = {}
+        for module in modules:
+            found, value = upstream.recall(f"modules:{symbol.upper()}:{module}")
+            if not found:
+                return None
+            stale[module] = value
+        upstream.served_stale(operation)
+        return stale
+
+    @staticmethod
+    def _fetch_modules_batch(
+        symbols: List[str],
+        modules: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        복수 종목의 quoteSummary 모듈을 한 번의 다중 심볼 요청으로 조회
+
+        Args:
+            symbols: 주식 심볼 목록
+            modules: 조회할 모듈 목록
+
+        Returns:
+            Tuple[Dict, Dict]: (심볼별 모듈 데이터, 심볼별 실패 사유)
+        """
+        results = {}
+        errors = {}
+        try:
+            # 요청 전체가 실패하면 에러 메시지 문자열이 반환되므로 재시도
+            data = upstream.call(
+                'modules_batch',
+                lambda: yahoo_client.ticker(symbols).get_modules(modules),
+                accept=lambda data: isinstance(data, dict),
+                module=StockService._module_label(modules)
+            )
+        except UpstreamUnavailableError as e:
+            print(f"Error fetching modules for {', '.join(symbols)}: {str(e)}")
+            for symbol in symbols:
+                stale = StockService._stale_modules(symbol, modules, 'modules_batch')
+                if stale is not None:
+                    results[symbol] = stale
+                else:
+                    errors[symbol] = str(e)
+            return results, errors
+
+        for symbol in symbols:
+            modules_data = data.get(symbol)
+            if isinstance(modules_data, dict):
+                results[symbol] = modules_data
+                StockService._remember_modules(symbol, modules_data)
+            else:
+                errors[symbol] = str(modules_data or "데이터가 없습니다.")
+
+        return results, errors
+
+    @staticmethod
+    def _build_stock_info(symbol: str, modules_data: Dict[str, Any]) -> Optional[StockInfo]:
+        """
+        조회된 모듈 데이터로 StockInfo 생성
+
+        Args:
+            symbol: 주식 심볼
+            modules_data: 모듈명별 데이터 (price, summaryDetail, assetProfile)
+
+        Returns:
+            StockInfo: 주식 기본 정보 또는 None
+        """
+        info = modules_data.get('summaryDetail', {})
+        profile = modules_data.get('assetProfile', {})
+        price_info = modules_data.get('price', {})
+
+        # 에러 체크
+        if isinstance(info, str) or isinstance(profile, str) or isinstance(price_info, str):
+            return None
+
+        return StockInfo(
+            symbol=symbol.upper(),
+            name=price_info.get('shortName'),
+            currency=info.get('currency'),
+            exchange=price_info.get('exchangeName'),
+            market_cap=price_info.get('marketCap'),
+            sector=profile.get('sector'),
+            industry=profile.get('industry')
+        )
+
+    @staticmethod
+    def _build_stock_price(symbol: str, modules_data: Dict[str, Any]) -> Optional[StockPrice]:
+        """
+        조회된 모듈 데이터로 StockPrice 생성
+
+        Args:
+            symbol: 주식 심볼
+            modules_data: 모듈명별 데이터 (price, summaryDetail)
+
+        Returns:
+            StockPrice: 주식 가격 정보 또는 None
+        """
+        info = modules_data.get('summaryDetail', {})
+        price_info = modules_data.get('price', {})
+
+        # 에러 체크
+        if isinstance(info, str) or isinstance(price_info, str):
+            return None
+
+        current_price = price_info.get('regularMarketPrice')
+        previous_close = price_info.get('regularMarketPreviousClose')
+
+        # 변동 계산
+        change = None
+        change_percent = None
+        if current_price and previous_close:
+            change = current_price - previous_close
+            change_percent = (change / previous_close) * 100
+
+        return StockPrice(
+            symbol=symbol.upper(),
+            current_price=current_price,
+            previous_close=previous_close,
+            open_price=price_info.get('regularMarketOpen'),
+            day_high=price_info.get('regularMarketDayHigh'),
+            day_low=price_info.get('regularMarketDayLow'),
+            volume=price_info.get('regularMarketVolume'),
+            change=change,
+            change_percent=change_percent
+        )
+
+    @staticmethod
+    def _store_quote(
+        symbol: str,
+        modules_data: Dict[str, Any],
+        info: Optional[StockInfo] = None
+    ) -> Optional[StockQuote]:
+        """
+        모듈 데이터로 종합 정보를 생성하고 기본 정보/가격 정보를 각각 캐시에 저장
+
+        Args:
+            symbol: 주식 심볼 (대문자)
+            modules_data: 모듈명별 데이터
+            info: 캐시된 기본 정보 (있으면 모듈 데이터에서 다시 생성하지 않음)
+
+        Returns:
+            StockQuote: 주식 종합 정보 또는 None
+        """
+        cache = StockService.cache
+
+        if info is None:
+            info = StockService._build_stock_info(symbol, modules_data)
+            if info:
+                cache.set(f"info:{symbol}", info, StockService.INFO_CACHE_TTL)
+
+            profile = modules_data.get('assetProfile')
+            if isinstance(profile, dict):
+                cache.set(f"profile:{symbol}", profile, StockService.INFO_CACHE_TTL)
+
+        price = StockService._build_stock_price(symbol, modules_data)
+        if price:
+            cache.set(f"price:{symbol}", price, StockService.PRICE_CACHE_TTL)
+
+        if not info or not price:
+            return None
+
+        return StockQuote(info=info, price=price)
+
+    @staticmethod
+    def _load_quote(symbol: str) -> Optional[StockQuote]:
+        """
+        캐시를 거쳐 종합 정보 조회
+
+        기본 정보가 캐시되어 있으면 가격 관련 모듈만 조회하며,
+        같은 심볼의 동시 요청은 한 번의 조회로 병합됩니다.
+
+        Args:
+            symbol: 주식 심볼
+
+        Returns:
+            StockQuote: 주식 종합 정보 또는 None
+        """
+        key = symbol.upper()
+        cache = StockService.cache
+
+        found_info, info = cache.get(f"info:{key}")
+        found_price, price = cache.get(f"price:{key}")
+        if found_info and found_price:
+            return StockQuote(info=info, price=price)
+
+        def load() -> Optional[StockQuote]:
+            modules = StockService.PRICE_MODULES if found_info else StockService.QUOTE_MODULES
+            modules_data = StockService._fetch_modules(symbol, modules)
+            if not modules_data:
+                return None
+
+            return StockService._store_quote(key, modules_data, info if found_info else None)
+
+        return cache.single_flight(f"quote:{key}", load)
+
     @staticmethod
     def get_stock_info(symbol: str) -> Optional[StockInfo]:
         """
@@ -24,24 +372,15 @@ class StockService:
             StockInfo: 주식 기본 정보 또는 None
         """
         try:
-            ticker = Ticker(symbol)
-            info = ticker.summary_detail.get(symbol, {})
-            profile = ticker.asset_profile.get(symbol, {})
-            price_info = ticker.price.get(symbol, {})
-
-            # 에러 체크
-            if isinstance(info, str) or isinstance(profile, str) or isinstance(price_info, str):
-                return None
+            found, info = StockService.cache.get(f"info:{symbol.upper()}")
+            if found:
+                return info
 
-            return StockInfo(
-                symbol=symbol.upper(),
-                name=price_info.get('shortName'),
-                currency=info.get('currency'),
-                exchange=price_info.get('exchangeName'),
-                market_cap=price_info.get('marketCap'),
-                sector=profile.get('sector'),
-                industry=profile.get('industry')
-            )
+            # 기본 정보에는 price 모듈도 필요하므로 종합 정보로 조회하여 함께 캐시
+            quote = StockService._load_quote(symbol)
+            return quote.info if quote else None
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             print(f"Error fetching stock info for {symbol}: {str(e)}")
             return None
@@ -57,36 +396,21 @@ class StockService:
         Returns:
             StockPrice: 주식 가격 정보 또는 None
         """
-        try:
-            ticker = Ticker(symbol)
-            info = ticker.summary_detail.get(symbol, {})
-            price_info = ticker.price.get(symbol, {})
-
-            # 에러 체크
-            if isinstance(info, str) or isinstance(price_info, str):
+        def load() -> Optional[StockPrice]:
+            modules_data = StockService._fetch_modules(symbol, StockService.PRICE_MODULES)
+            if not modules_data:
                 return None
 
-            current_price = price_info.get('regularMarketPrice')
-            previous_close = price_info.get('regularMarketPreviousClose')
-
-            # 변동 계산
-            change = None
-            change_percent = None
-            if current_price and previous_close:
-                change = current_price - previous_close
-                change_percent = (change / previous_close) * 100
-
-            return StockPrice(
-                symbol=symbol.upper(),
-                current_price=current_price,
-                previous_close=previous_close,
-                open_price=price_info.get('regularMarketOpen'),
-                day_high=price_info.get('regularMarketDayHigh'),
-                day_low=price_info.get('regularMarketDayLow'),
-                volume=price_info.get('regularMarketVolume'),
-                change=change,
-                change_percent=change_percent
+            return StockService._build_stock_price(symbol, modules_data)
+
+        try:
+            return StockService.cache.get_or_load(
+                f"price:{symbol.upper()}",
+                StockService.PRICE_CACHE_TTL,
+                load
             )
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             print(f"Error fetching stock price for {symbol}: {str(e)}")
             return None
@@ -102,13 +426,130 @@ class StockService:
         Returns:
             StockQuote: 주식 종합 정보 또는 None
         """
-        info = StockService.get_stock_info(symbol)
-        price = StockService.get_stock_price(symbol)
-
-        if not info or not price:
+        try:
+            # price, summaryDetail, assetProfile을 한 번의 요청으로 조회
+            return StockService._load_quote(symbol)
+        except UpstreamUnavailableError:
+            raise
+        except Exception as e:
+            print(f"Error fetching stock quote for {symbol}: {str(e)}")
             return None
 
-        return StockQuote(info=info, price=price)
+    @staticmethod
+    def get_stock_quotes(symbols: List[str]) -> StockQuoteBatch:
+        """
+        복수 종목 종합 정보 일괄 조회 (한 번의 다중 심볼 요청)
+
+        캐시된 종목은 제외하고, 기본 정보가 캐시된 종목은 가격 모듈만 조회합니다.
+
+        Args:
+            symbols: 주식 심볼 목록 (예: ['AAPL', 'TSLA'])
+
+        Returns:
+            StockQuoteBatch: 심볼별 종합 정보와 실패한 심볼의 사유
+        """
+        # 대문자 변환 및 중복 제거 (요청 순서 유지)
+        symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+        result = StockQuoteBatch()
+        if not symbols:
+            return result
+
+        cache = StockService.cache
+        quotes: Dict[str, StockQuote] = {}
+        cached_info: Dict[str, StockInfo] = {}
+        need_full = []
+        need_price = []
+
+        for symbol in symbols:
+            found_info, info = cache.get(f"info:{symbol}")
+            found_price, price = cache.get(f"price:{symbol}")
+            if found_info and found_price:
+                quotes[symbol] = StockQuote(info=info, price=price)
+            elif found_info:
+                cached_info[symbol] = info
+                need_price.append(symbol)
+            else:
+                need_full.append(symbol)
+
+        for group, modules in (
+            (need_full, StockService.QUOTE_MODULES),
+            (need_price, StockService.PRICE_MODULES)
+        ):
+            if not group:
+                continue
+
+            data, errors = StockService._fetch_modules_batch(group, modules)
+            result.errors.update(errors)
+
+            for symbol, modules_data in data.items():
+                quote = StockService._store_quote(symbol, modules_data, cached_info.get(symbol))
+                if quote:
+                    quotes[symbol] = quote
+                else:
+                    result.errors[symbol] = "종목 정보를 해석할 수 없습니다."
+
+        result.quotes = {symbol: quotes[symbol] for symbol in symbols if symbol in quotes}
+        return result
+
+    @staticmethod
+    def _fetch_asset_profiles(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        복수 종목의 assetProfile(섹터, 산업) 일괄 조회
+
+        Args:
+            symbols: 주식 심볼 목록
+
+        Returns:
+            Dict: 심볼별 assetProfile 데이터 (조회 실패한 심볼은 제외)
+        """
+        cache = StockService.cache
+        profiles = {}
+        missing = []
+        for symbol in symbols:
+            found, profile = cache.get(f"profile:{symbol.upper()}")
+            if found:
+                profiles[symbol] = profile
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return profiles
+
+        data, _ = StockService._fetch_modules_batch(missing, ['assetProfile'])
+        for symbol, modules_data in data.items():
+            profile = modules_data.get('assetProfile')
+            if isinstance(profile, dict):
+                profiles[symbol] = profile
+                cache.set(f"profile:{symbol.upper()}", profile, StockService.INFO_CACHE_TTL)
+
+        return profiles
+
+    @staticmethod
+    def _screener_quote_to_modules(
+        quote: Dict[str, Any],
+        profile: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        스크리너 결과 행을 quoteSummary 모듈 형태로 변환
+
+        스크리너 행은 price 모듈과 같은 regularMarket* 필드를 포함하므로
+        _build_stock_info / _build_stock_price를 그대로 사용할 수 있습니다.
+
+        Args:
+            quote: 스크리너 결과 행
+            profile: assetProfile 데이터 (섹터, 산업)
+
+        Returns:
+            Dict: 모듈명별 데이터 (price, summaryDetail, assetProfile)
+        """
+        price_info = dict(quote)
+        price_info.setdefault('exchangeName', quote.get('fullExchangeName'))
+
+        return {
+            'price': price_info,
+            'summaryDetail': {'currency': quote.get('currency')},
+            'assetProfile': profile or {}
+        }
 
     @staticmethod
     def get_historical_data(
@@ -125,47 +566,445 @@ class StockService:
         Returns:
             HistoricalData: 과거 데이터 또는 None
         """
+        columns = StockService.get_historical_columns(symbol, period)
+        if not columns:
+            return None
+
+        return HistoricalData(
+            symbol=columns.symbol,
+            period=columns.period,
+            data=StockService._columns_to_points(columns)
+        )
+
+    @staticmethod
+    def get_historical_columns(
+        symbol: str,
+        period: str = "1mo"
+    ) -> Optional[HistoricalColumns]:
+        """
+        주식 과거 데이터 조회 (열 단위)
+
+        Args:
+            symbol: 주식 심볼
+            period: 조회 기간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+
+        Returns:
+            HistoricalColumns: 필드별 병렬 배열 형태의 과거 데이터 또는 None
+        """
+        ttl = StockService.HISTORY_CACHE_TTL.get(period, StockService.DEFAULT_HISTORY_CACHE_TTL)
+        return StockService.cache.get_or_load(
+            f"history:{symbol.upper()}:{period}",
+            ttl,
+            lambda: StockService._load_historical_columns(symbol, period)
+        )
+
+    @staticmethod
+    def _load_historical_columns(symbol: str, period: str) -> Optional[HistoricalColumns]:
+        """
+        주식 과거 데이터 원본 조회 (캐시 미사용)
+
+        Args:
+            symbol: 주식 심볼
+            period: 조회 기간
+
+        Returns:
+            HistoricalColumns: 열 단위 과거 데이터 또는 None
+        """
+        key = symbol.upper()
+        store = StockService.history_store
+
         try:
-            ticker = Ticker(symbol)
-            hist = ticker.history(period=period)
+            with store.lock(key):
+                bars = store.load(key)
 
-            # 데이터가 비어있거나 에러인 경우
-            if hist.empty or isinstance(hist, str):
+                try:
+                    if bars is not None and store.is_expired(bars, StockService.HISTORY_FULL_REFRESH_INTERVAL):
+                        bars = StockService._redownload_history(symbol, bars, period)
+                    elif bars is not None and store.is_covered(bars, period):
+                        bars = StockService._refresh_history_tail(symbol, bars)
+                    else:
+                        bars = StockService._download_history(symbol, period, bars)
+                except UpstreamUnavailableError:
+                    # 업스트림을 호출할 수 없으면 저장된 일봉으로 응답 (최신 구간이나 앞 구간이 빠질 수 있음)
+                    if bars is None:
+                        raise
+                    upstream.served_stale('history')
+
+            if bars is None:
                 return None
 
-            # DataFrame을 리스트로 변환
-            data_points = []
-            for index, row in hist.iterrows():
-                # index가 튜플인 경우 (symbol, date) 형태
-                if isinstance(index, tuple):
-                    date = index[1].strftime('%Y-%m-%d')
-                else:
-                    date = index.strftime('%Y-%m-%d')
-
-                data_points.append(
-                    HistoricalDataPoint(
-                        date=date,
-                        open=float(row.get('open', 0)) if row.get('open') else None,
-                        high=float(row.get('high', 0)) if row.get('high') else None,
-                        low=float(row.get('low', 0)) if row.get('low') else None,
-                        close=float(row.get('close', 0)) if row.get('close') else None,
-                        volume=int(row.get('volume', 0)) if row.get('volume') else None
-                    )
-                )
+            bars = store.slice_period(bars, period)
+            if len(bars['date']) == 0:
+                return None
 
-            return HistoricalData(
-                symbol=symbol.upper(),
+            # 값 타입이 보장되므로 검증 생략
+            return HistoricalColumns.model_construct(
+                symbol=key,
                 period=period,
-                data=data_points
+                **StockService._bars_to_columns(bars)
             )
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             print(f"Error fetching historical data for {symbol}: {str(e)}")
             return None
 
+    @staticmethod
+    def prefetch_history(symbols: List[str], period: str = "5d") -> Dict[str, str]:
+        """
+        여러 종목의 일봉을 한 번의 다중 심볼 요청으로 저장소에 미리 받아 둠
+
+        저장소가 기간을 이미 포함하는 종목은 마지막 저장일 이후만 함께 받고,
+        최근에 갱신한 종목은 건너뜁니다. 이후 get_historical_data 호출은 업스트림 없이 응답합니다.
+
+        Args:
+            symbols: 주식 심볼 목록
+            period: 조회 기간
+
+        Returns:
+            Dict: 심볼별 조회 실패 사유 (모두 성공하면 빈 Dict)
+        """
+        store = StockService.history_store
+        keys = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+
+        missing = []
+        stale: Dict[str, Dict[str, np.ndarray]] = {}
+        refresh: List[str] = []
+        for key in keys:
+            bars = store.load(key)
+            if bars is None or not store.is_covered(bars, period):
+                missing.append(key)
+            elif store.is_expired(bars, StockService.HISTORY_FULL_REFRESH_INTERVAL):
+                refresh.append(key)
+            elif time.time() - float(bars['fetched_at']) >= StockService.HISTORY_TAIL_REFRESH_INTERVAL:
+                stale[key] = bars
+
+        errors: Dict[str, str] = {}
+        requests = []
+        if missing:
+            requests.append((missing, {'period': period}))
+        if stale:
+            # 가장 오래된 비교 기준일(마지막 마감 봉)부터 받으면 모든 종목의 꼬리 구간을 포함
+            earliest = min(StockService._tail_start(bars) for bars in stale.values())
+            requests.append((list(stale), {'start': str(np.datetime64(earliest, 'D'))}))
+
+        for request_symbols, params in requests:
+            try:
+                hist = upstream.call('history', lambda: yahoo_client.ticker(request_symbols).history(**params))
+            except UpstreamUnavailableError as e:
+                print(f"Error prefetching history for {', '.join(request_symbols)}: {str(e)}")
+                errors.update({key: str(e) for key in request_symbols})
+                continue
+
+            frames = StockService._split_history(hist)
+            for key in request_symbols:
+                frame = frames.get(key)
+                if frame is None or frame.empty:
+                    if key in missing:
+                        errors[key] = "과거 데이터를 찾을 수 없습니다."
+                    continue
+
+                with store.lock(key):
+                    new = history_to_bars(frame)
+                    covered_from = store.coverage_start(period, new) if key in missing else int(new['date'][0])
+                    if StockService._store_history(key, store.load(key), new, covered_from) is None:
+                        refresh.append(key)
+
+        # 보유 기간 전체를 받은 지 오래되었거나 수정주가가 바뀐 종목은 종목별로 전체 기간을 다시 받음
+        for key in refresh:
+            try:
+                with store.lock(key):
+                    stored = store.load(key)
+                    if stored is not None:
+                        StockService._redownload_history(key, stored, period)
+            except UpstreamUnavailableError as e:
+                print(f"Error refreshing history for {key}: {str(e)}")
+                errors[key] = str(e)
+
+        return errors
+
+    @staticmethod
+    def _split_history(hist: Any) -> Dict[str, pd.DataFrame]:
+        """다중 심볼 history() 결과를 심볼별 DataFrame으로 분리"""
+        # 일부 심볼이 실패하면 심볼별 DataFrame 또는 에러 메시지 Dict로 반환됨
+        if isinstance(hist, dict):
+            return {
+                symbol.upper(): frame for symbol, frame in hist.items()
+                if isinstance(frame, pd.DataFrame)
+            }
+        if not isinstance(hist, pd.DataFrame) or hist.empty:
+            return {}
+        if not isinstance(hist.index, pd.MultiIndex):
+            return {}
+        return {
+            str(symbol).upper(): frame
+            for symbol, frame in hist.groupby(level=0, sort=False)
+        }
+
+    @staticmethod
+    def _download_history(
+        symbol: str,
+        period: str,
+        stored: Optional[Dict[str, np.ndarray]] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        기간 전체 일봉을 업스트림에서 받아 저장소에 병합
+
+        Args:
+            symbol: 주식 심볼
+            period: 조회 기간
+            stored: 기존 저장 일봉 (없으면 None)
+
+        Returns:
+            Dict: 저장된 전체 일봉 배열 또는 None (조회 실패 시)
+        """
+        hist = upstream.call('history', lambda: yahoo_client.ticker(symbol).history(period=period))
+
+        # 데이터가 비어있거나 에러인 경우
+        if not isinstance(hist, pd.DataFrame) or hist.empty:
+            return None
+
+        new = history_to_bars(hist)
+        bars = StockService._store_history(symbol, stored, new, StockService.history_store.coverage_start(period, new))
+        if bars is None:
+            # 저장된 앞 구간의 수정주가가 바뀌었으면 보유 기간 전체를 다시 받음
+            return StockService._redownload_history(symbol, stored, period)
+        return bars
+
+    @staticmethod
+    def _store_history(
+        symbol: str,
+        stored: Optional[Dict[str, np.ndarray]],
+        new: Dict[str, np.ndarray],
+        covered_from: int
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        새로 받은 일봉을 저장된 일봉과 병합하여 저장
+
+        액면분할이나 배당으로 수정주가가 바뀌면(겹치는 마감 봉의 종가가 다르면) 저장된 일봉을 버립니다.
+        새 일봉이 저장된 보유 기간을 모두 포함하지 않으면 병합할 수 없으므로 저장하지 않습니다.
+
+        Args:
+            symbol: 주식 심볼
+            stored: 기존 저장 일봉 (없으면 None)
+            new: 새로 조회한 일봉
+            covered_from: 새 일봉이 보장하는 보유 시작일
+
+        Returns:
+            Dict: 저장된 전체 일봉 배열 또는 None (보유 기간 전체를 다시 받아야 하는 경우)
+        """
+        store = StockService.history_store
+        bars = new
+        covered_at = None
+        if stored is not None:
+            stored_from = int(stored['covered_from'])
+            if store.is_adjusted(stored, new):
+                if covered_from > stored_from:
+                    return None
+            else:
+                bars = merge_bars(stored, new)
+                if covered_from > stored_from:
+                    # 이번에 받지 않은 앞 구간은 이전 전체 조회 시각을 유지
+                    covered_at = store.covered_at(stored)
+                covered_from = min(covered_from, stored_from)
+
+        bars = store.with_meta(bars, covered_from, covered_at)
+        store.save(symbol.upper(), bars)
+        return bars
+
+    @staticmethod
+    def _redownload_history(
+        symbol: str,
+        stored: Dict[str, np.ndarray],
+        period: Optional[str] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        저장된 일봉을 버리고 보유 기간(과 요청 기간) 전체를 다시 받음
+
+        Args:
+            symbol: 주식 심볼
+            stored: 기존 저장 일봉
+            period: 함께 포함할 조회 기간
+
+        Returns:
+            Dict: 저장된 전체 일봉 배열 (다시 받은 데이터가 비어 있으면 기존 일봉)
+        """
+        store = StockService.history_store
+        covered_from = int(stored['covered_from'])
+        if period is not None and period not in PERIOD_BARS:
+            covered_from = min(covered_from, store.period_start(period))
+
+        bars = StockService._download_history(symbol, store.covering_period(covered_from))
+        return bars if bars is not None else stored
+
+    @staticmethod
+    def _tail_start(stored: Dict[str, np.ndarray]) -> int:
+        """꼬리 구간 조회 시작일 (수정주가 비교를 위해 마지막 마감 봉부터)"""
+        dates = stored['date']
+        return int(dates[-2] if len(dates) > 1 else dates[-1])
+
+    @staticmethod
+    def _refresh_history_tail(symbol: str, stored: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        마지막 마감 봉부터 오늘까지의 일봉만 받아 저장소를 갱신
+
+        마지막 저장일도 다시 받아 장중에 저장된 당일 봉을 최신 값으로 교체하고,
+        다시 받은 마감 봉의 종가가 저장된 값과 다르면(수정주가 반영) 보유 기간 전체를 다시 받습니다.
+        최근에 갱신했다면 업스트림을 호출하지 않습니다.
+
+        Args:
+            symbol: 주식 심볼
+            stored: 기존 저장 일봉
+
+        Returns:
+            Dict: 갱신된 전체 일봉 배열
+        """
+        if time.time() - float(stored['fetched_at']) < StockService.HISTORY_TAIL_REFRESH_INTERVAL:
+            return stored
+
+        start = np.datetime64(StockService._tail_start(stored), 'D')
+        hist = upstream.call('history', lambda: yahoo_client.ticker(symbol).history(start=str(start)))
+
+        store = StockService.history_store
+        if isinstance(hist, pd.DataFrame) and not hist.empty:
+            new = history_to_bars(hist)
+            bars = StockService._store_history(symbol, stored, new, int(new['date'][0]))
+            if bars is None:
+                return StockService._redownload_history(symbol, stored)
+            return bars
+
+        bars = store.with_meta(stored, int(stored['covered_from']), store.covered_at(stored))
+        store.save(symbol.upper(), bars)
+        return bars
+
+    # 바이너리 과거 데이터의 열 순서와 타입 (리틀 엔디언)
+    HISTORY_BINARY_COLUMNS = [
+        ('date', '<i4'),
+        ('open', '<f8'),
+        ('high', '<f8'),
+        ('low', '<f8'),
+        ('close', '<f8'),
+        ('volume', '<f8'),
+    ]
+
+    @staticmethod
+    def pack_historical_columns(columns: HistoricalColumns) -> bytes:
+        """
+        열 단위 과거 데이터를 바이너리로 직렬화 (차트 클라이언트용)
+
+        HISTORY_BINARY_COLUMNS 순서대로 각 열을 N개(행 수)씩 이어 붙입니다.
+        - date: int32, 1970-01-01 기준 일수
+        - open, high, low, close, volume: float64, 결측치는 NaN
+
+        Args:
+            columns: 열 단위 과거 데이터
+
+        Returns:
+            bytes: 패킹된 열 배열
+        """
+        parts = []
+        for name, dtype in StockService.HISTORY_BINARY_COLUMNS:
+            if name == 'date':
+                values = np.array(columns.date, dtype='datetime64[D]').astype(dtype)
+            else:
+                # None은 float 배열 변환 시 NaN이 됨
+                values = np.array(getattr(columns, name), dtype=dtype)
+            parts.append(values.tobytes())
+        return b''.join(parts)
+
+    @staticmethod
+    def _fetch_screener_quotes(screener_type: str, count: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        스크리너 결과 조회 (캐시 사용)
+
+        Args:
+            screener_type: 스크리너 타입
+            count: 조회할 종목 개수
+
+        Returns:
+            List[Dict]: 심볼이 있는 스크리너 결과 행 목록 또는 None
+        """
+        def load() -> Optional[List[Dict[str, Any]]]:
+            # 업스트림을 호출할 수 없으면 마지막으로 받은 스크리너 결과로 응답
+            data = upstream.call(
+                'screener',
+                lambda: yahoo_client.screener().get_screeners(screener_type, count=count),
+                accept=lambda data: isinstance(data, dict),
+                stale_key=f"screener:{screener_type}:{count}"
+            )
+
+            # 종목 리스트 추출
+            quotes = data.get(screener_type, {}).get('quotes', [])
+            quotes = [quote for quote in quotes if quote.get('symbol')]
+            return quotes or None
+
+        return StockService.cache.get_or_load(
+            f"screener:{screener_type}:{count}",
+            StockService.SCREENER_CACHE_TTL,
+            load
+        )
+
+    @staticmethod
+    def _bars_to_columns(bars: Dict[str, np.ndarray]) -> Dict[str, List[Any]]:
+        """
+        일봉 배열을 응답용 열별 리스트로 변환
+
+        날짜 포맷과 NaN → None 변환을 열 단위로 처리하며, 0은 유효한 값으로 유지합니다.
+
+        Args:
+            bars: date(일수), open, high, low, close, volume 배열
+
+        Returns:
+            Dict: date, open, high, low, close, volume 열별 값 리스트
+        """
+        dates = bars['date'].astype('datetime64[D]')
+        columns: Dict[str, List[Any]] = {'date': np.datetime_as_string(dates, unit='D').tolist()}
+
+        for name in BAR_COLUMNS:
+            values = bars[name]
+            missing = np.isnan(values)
+
+            if name == 'volume':
+                values = np.where(missing, 0, values).astype(np.int64)
+
+            column = values.tolist()
+            for i in np.flatnonzero(missing).tolist():
+                column[i] = None
+            columns[name] = column
+
+        return columns
+
+    @staticmethod
+    def _columns_to_points(columns: HistoricalColumns) -> List[HistoricalDataPoint]:
+        """
+        열 단위 과거 데이터를 HistoricalDataPoint 목록으로 변환
+
+        값의 타입은 _bars_to_columns에서 이미 보장되므로 검증 없이 생성합니다.
+
+        Args:
+            columns: 열 단위 과거 데이터
+
+        Returns:
+            List[HistoricalDataPoint]: 과거 데이터 포인트 목록
+        """
+        construct = HistoricalDataPoint.model_construct
+        return [
+            construct(date=date, open=open_, high=high, low=low, close=close, volume=volume)
+            for date, open_, high, low, close, volume in zip(
+                columns.date,
+                columns.open,
+                columns.high,
+                columns.low,
+                columns.close,
+                columns.volume
+            )
+        ]
+
     @staticmethod
     def get_top_stocks(
         screener_type: str = "most_actives",
-        count: int = 5
+        count: int = 5,
+        fast: bool = True
     ) -> List[Dict[str, Any]]:
         """
         TOP N 종목 조회 (Screener 사용)
@@ -173,6 +1012,8 @@ class StockService:
         Args:
             screener_type: 스크리너 타입 (most_actives, day_gainers, day_losers 등)
             count: 조회할 종목 개수 (1-10)
+            fast: True이면 스크리너 결과로 직접 종합 정보를 구성하고
+                  섹터/산업만 한 번의 일괄 조회로 보충 (False이면 종목별 상세 조회)
 
         Returns:
             List[Dict]: 순위가 포함된 종목 리스트
@@ -181,20 +1022,38 @@ class StockService:
             # count 범위 검증 (1-10)
             count = max(1, min(10, count))
 
-            # Screener로 데이터 조회
-            screener = Screener()
-            data = screener.get_screeners(screener_type, count=count)
+            # Screener로 데이터 조회 (캐시 사용)
+            quotes = StockService._fetch_screener_quotes(screener_type, count) or []
+            symbols = [quote['symbol'] for quote in quotes]
 
-            # 종목 리스트 추출
-            quotes = data.get(screener_type, {}).get('quotes', [])
+            if fast:
+                # 스크리너에 없는 섹터/산업 정보만 일괄 조회로 보충
+                profiles = StockService._fetch_asset_profiles(symbols)
+
+                results = []
+                for rank, quote in enumerate(quotes, start=1):
+                    symbol = quote['symbol']
+                    modules_data = StockService._screener_quote_to_modules(
+                        quote, profiles.get(symbol)
+                    )
+                    info = StockService._build_stock_info(symbol, modules_data)
+                    price = StockService._build_stock_price(symbol, modules_data)
+
+                    if info and price:
+                        results.append({
+                            'rank': rank,
+                            'quote': StockQuote(info=info, price=price)
+                        })
+
+                return results
+
+            # 모든 종목의 상세 정보를 한 번에 조회
+            batch = StockService.get_stock_quotes(symbols)
 
             # 결과 리스트 생성 (순위 포함)
             results = []
-            for rank, quote in enumerate(quotes, start=1):
-                symbol = quote.get('symbol')
-
-                # 각 종목의 상세 정보 조회
-                stock_quote = StockService.get_stock_quote(symbol)
+            for rank, symbol in enumerate(symbols, start=1):
+                stock_quote = batch.quotes.get(symbol.upper())
 
                 if stock_quote:
                     results.append({
@@ -204,6 +1063,8 @@ class StockService:
 
             return results
 
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             print(f"Error fetching top stocks ({screener_type}): {str(e)}")
             return []
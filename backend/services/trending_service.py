@@ -0,0 +1,517 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.stock import (
+    StockQuote,
+    ScoreBreakdown,
+    TrendingStock,
+    TrendingMarketSummary,
+    TrendingStocksResult,
+    TopTrendingStock,
+    TrendingAlternative,
+    TopTrendingStockResult
+)
+from services.stock_service import StockService
+
+
+# 스크리너 결과 필드 → 점수 계산용 열 이름
+QUOTE_FIELDS = {
+    'symbol': 'symbol',
+    'shortName': 'short_name',
+    'longName': 'long_name',
+    'regularMarketPrice': 'price',
+    'regularMarketChangePercent': 'change_percent',
+    'regularMarketChange': 'change_amount',
+    'regularMarketVolume': 'volume',
+    'averageDailyVolume3Month': 'avg_volume',
+    'marketCap': 'market_cap',
+    'quoteType': 'quote_type',
+    'marketState': 'market_state',
+    'regularMarketTime': 'market_time',
+}
+NUMERIC_COLUMNS = ['price', 'change_percent', 'change_amount', 'volume', 'avg_volume', 'market_cap', 'market_time']
+
+# 스크리너 조회 전용 스레드 풀 (요청 처리 스레드 안에서 세 스크리너를 동시에 조회)
+# 공용 실행기 스레드가 자기 풀의 작업을 기다리다 막히지 않도록 분리, 앱 종료 시 TrendingStocksFetcher.shutdown()
+_screener_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="screener")
+
+
+class TrendingStocksFetcher:
+    """
+    화제 종목 수집기 (화제종목_수집_설계서.md의 복합 점수 시스템)
+
+    most_actives, day_gainers, day_losers 스크리너를 동시에 조회한 뒤
+    거래량 순위, 상승률, 출현 빈도로 복합 점수를 계산합니다.
+    점수 계산은 모두 열 단위 연산이며, 종목별 출현 스크리너는 비트마스크로 집계합니다.
+    """
+
+    SCREENER_TYPES = ['most_actives', 'day_gainers', 'day_losers']
+    SCREENER_LABELS = {
+        'most_actives': '거래량 상위',
+        'day_gainers': '상승률 상위',
+        'day_losers': '하락률 상위',
+    }
+    # 스크리너별 조회 종목 수
+    SCREENER_COUNT = 25
+
+    DEFAULT_EXCLUDE_SYMBOLS = [
+        'SPY', 'QQQ', 'IWM', 'DIA',  # ETF
+        'TQQQ', 'SQQQ', 'UVXY', 'SOXL', 'SOXS',  # 레버리지
+    ]
+    DEFAULT_MIN_MARKET_CAP = 1e9
+    SORT_COLUMNS = ['composite_score', 'volume', 'change_percent']
+
+    # 복합 점수 가중치 (거래량 40%, 상승률 40%, 출현 빈도 20%)
+    VOLUME_WEIGHT = 0.4
+    CHANGE_WEIGHT = 0.4
+    APPEARANCE_WEIGHT = 0.2
+    # 상승률 1%당 점수 (20% 상승 = 100점)
+    CHANGE_SCORE_SCALE = 5
+    # 스크리너 1개 추가 출현당 보너스
+    APPEARANCE_BONUS = 15
+
+    # 동일 섹터 최대 종목 수와 섹터 조회 후보 배수 (limit의 몇 배까지 섹터를 확인할지)
+    MAX_PER_SECTOR = 2
+    SECTOR_CANDIDATE_FACTOR = 3
+
+    MARKET_STATUS = {
+        'REGULAR': 'open',
+        'PRE': 'pre_market',
+        'POST': 'after_hours',
+        'POSTPOST': 'closed',
+        'PREPRE': 'closed',
+        'CLOSED': 'closed',
+    }
+
+    @staticmethod
+    def shutdown() -> None:
+        """스크리너 조회 스레드 풀 종료 (앱 종료 시 호출, 대기 중인 조회는 취소)"""
+        _screener_pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def fetch_screeners(screener_types: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        스크리너 동시 조회 (캐시 사용)
+
+        Args:
+            screener_types: 조회할 스크리너 타입 목록
+
+        Returns:
+            Dict: 스크리너 타입별 결과 행 목록 (조회 실패 시 빈 목록)
+        """
+        futures = {
+            screener_type: _screener_pool.submit(
+                StockService._fetch_screener_quotes,
+                screener_type,
+                TrendingStocksFetcher.SCREENER_COUNT
+            )
+            for screener_type in screener_types
+        }
+
+        rows_by_source = {}
+        for screener_type, future in futures.items():
+            try:
+                rows_by_source[screener_type] = future.result() or []
+            except Exception as e:
+                print(f"Error fetching screener ({screener_type}): {str(e)}")
+                rows_by_source[screener_type] = []
+        return rows_by_source
+
+    @staticmethod
+    def screener_frame(rows_by_source: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+        """
+        스크리너 결과 행을 하나의 DataFrame으로 변환
+
+        source_mask 열은 행이 나온 스크리너의 비트 (SCREENER_TYPES 순서)입니다.
+        """
+        rows = []
+        masks = []
+        for bit, screener_type in enumerate(TrendingStocksFetcher.SCREENER_TYPES):
+            source_rows = [row for row in rows_by_source.get(screener_type) or [] if row.get('symbol')]
+            rows.extend(source_rows)
+            masks.append(np.full(len(source_rows), 1 << bit, dtype=np.uint8))
+
+        # 필드별로 한 번씩만 순회하여 열 배열 생성 (숫자 열의 None은 NaN)
+        columns: Dict[str, Any] = {}
+        for field, name in QUOTE_FIELDS.items():
+            values = [row.get(field) for row in rows]
+            if name in NUMERIC_COLUMNS:
+                try:
+                    values = np.array(values, dtype=np.float64)
+                except (TypeError, ValueError):
+                    values = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy()
+            columns[name] = values
+
+        df = pd.DataFrame(columns)
+        df['name'] = df['short_name'].fillna(df['long_name'])
+        df['source_mask'] = np.concatenate(masks)
+        return df
+
+    @staticmethod
+    def score(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        복합 점수 계산 (종목별 집계 후 점수 내림차순 정렬)
+
+        - volume_score: 거래량 백분위 순위 (0-100)
+        - change_score: 상승률 × 5 (0-100, 하락은 0)
+        - appearance_bonus: (출현 스크리너 수 - 1) × 15
+        - composite_score: 0.4 × volume_score + 0.4 × change_score + 0.2 × appearance_bonus
+
+        종목별 집계는 심볼 코드로 정렬한 뒤 reduceat으로 구간별 최댓값/OR을 구합니다.
+        변동률과 거래량은 최댓값, 나머지는 첫 행 값을 사용하며
+        같은 스크리너에 중복 출현한 종목은 한 번만 셉니다.
+
+        Args:
+            df: screener_frame 결과
+
+        Returns:
+            pd.DataFrame: 종목별 집계와 점수 (동점은 먼저 수집된 순서 유지)
+        """
+        score_columns = [
+            'symbol', 'name', 'price', 'change_percent', 'change_amount', 'volume', 'avg_volume',
+            'market_cap', 'quote_type', 'source_mask', 'appearance_count',
+            'volume_score', 'change_score', 'appearance_bonus', 'composite_score'
+        ]
+        if df.empty:
+            return pd.DataFrame(columns=score_columns)
+
+        codes, _ = pd.factorize(df['symbol'], sort=False)
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        first = order[starts]
+
+        def first_of(column: str) -> np.ndarray:
+            return df[column].to_numpy()[first]
+
+        def max_of(column: str) -> np.ndarray:
+            return np.fmax.reduceat(df[column].to_numpy(dtype=np.float64)[order], starts)
+
+        masks = np.bitwise_or.reduceat(df['source_mask'].to_numpy(dtype=np.uint8)[order], starts)
+        appearance_count = np.unpackbits(masks[:, None], axis=1).sum(axis=1)
+
+        cls = TrendingStocksFetcher
+        volume = max_of('volume')
+        change_percent = max_of('change_percent')
+        volume_score = pd.Series(volume).rank(pct=True).fillna(0.0).to_numpy() * 100
+        change_score = np.clip(np.nan_to_num(change_percent) * cls.CHANGE_SCORE_SCALE, 0.0, 100.0)
+        appearance_bonus = (appearance_count - 1) * float(cls.APPEARANCE_BONUS)
+        composite_score = (
+            volume_score * cls.VOLUME_WEIGHT
+            + change_score * cls.CHANGE_WEIGHT
+            + appearance_bonus * cls.APPEARANCE_WEIGHT
+        )
+
+        # 종목 코드는 첫 출현 순서이므로 안정 정렬하면 동점은 먼저 수집된 종목이 앞섬
+        ranking = np.argsort(-composite_score, kind='stable')
+        scored = pd.DataFrame({
+            'symbol': first_of('symbol'),
+            'name': first_of('name'),
+            'price': first_of('price'),
+            'change_percent': change_percent,
+            'change_amount': first_of('change_amount'),
+            'volume': volume,
+            'avg_volume': first_of('avg_volume'),
+            'market_cap': first_of('market_cap'),
+            'quote_type': first_of('quote_type'),
+            'source_mask': masks,
+            'appearance_count': appearance_count,
+            'volume_score': volume_score,
+            'change_score': change_score,
+            'appearance_bonus': appearance_bonus,
+            'composite_score': composite_score,
+        })
+        return scored.take(ranking).reset_index(drop=True)
+
+    @staticmethod
+    def filter_candidates(
+        scored: pd.DataFrame,
+        min_market_cap: float,
+        exclude_symbols: List[str],
+        exclude_etf: bool = True
+    ) -> pd.DataFrame:
+        """
+        시가총액, 제외 종목, ETF 필터 적용
+
+        시가총액 조건을 만족하는 종목이 없으면 시가총액 조건만 제외하고 다시 선택합니다.
+        """
+        excluded = scored['symbol'].isin(exclude_symbols)
+        if exclude_etf:
+            excluded |= scored['quote_type'].notna() & (scored['quote_type'] != 'EQUITY')
+
+        filtered = scored[(scored['market_cap'] >= min_market_cap) & ~excluded]
+        if filtered.empty:
+            filtered = scored[~excluded]
+        return filtered
+
+    @staticmethod
+    def cap_sectors(candidates: pd.DataFrame, max_per_sector: int) -> pd.DataFrame:
+        """동일 섹터 종목 수 제한 (섹터를 모르는 종목은 제한하지 않음)"""
+        sector_rank = candidates.groupby('sector', sort=False, dropna=False).cumcount()
+        return candidates[candidates['sector'].isna() | (sector_rank < max_per_sector)]
+
+    @staticmethod
+    def _rank(
+        screener_types: List[str],
+        limit: int,
+        min_market_cap: float,
+        exclude_symbols: List[str],
+        exclude_etf: bool,
+        sort_by: str = 'composite_score',
+        max_per_sector: Optional[int] = None
+    ) -> Optional[Tuple[pd.DataFrame, int, pd.DataFrame, Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, Any]]]]:
+        """
+        스크리너 조회부터 최종 종목 선정까지 수행
+
+        Returns:
+            Tuple: (전체 수집 행, 필터링 후 종목 수, 선정 종목, 스크리너별 원본 행, 심볼별 assetProfile)
+                   또는 수집된 종목이 없으면 None
+        """
+        rows_by_source = TrendingStocksFetcher.fetch_screeners(screener_types)
+        frame = TrendingStocksFetcher.screener_frame(rows_by_source)
+        if frame.empty:
+            return None
+
+        scored = TrendingStocksFetcher.score(frame)
+        filtered = TrendingStocksFetcher.filter_candidates(
+            scored, min_market_cap, exclude_symbols, exclude_etf
+        )
+        if sort_by != 'composite_score':
+            filtered = filtered.sort_values(sort_by, ascending=False, kind='mergesort', na_position='last')
+
+        # 섹터는 스크리너 결과에 없으므로 상위 후보만 한 번의 일괄 조회로 보충
+        window = limit * TrendingStocksFetcher.SECTOR_CANDIDATE_FACTOR if max_per_sector else limit
+        candidates = filtered.head(window).copy()
+        profiles = StockService._fetch_asset_profiles(candidates['symbol'].tolist())
+        candidates['sector'] = candidates['symbol'].map(
+            {symbol: profile.get('sector') for symbol, profile in profiles.items()}
+        )
+        candidates['industry'] = candidates['symbol'].map(
+            {symbol: profile.get('industry') for symbol, profile in profiles.items()}
+        )
+
+        if max_per_sector:
+            candidates = TrendingStocksFetcher.cap_sectors(candidates, max_per_sector)
+
+        return frame, len(filtered), candidates.head(limit), rows_by_source, profiles
+
+    @staticmethod
+    def _sources(mask: int) -> List[str]:
+        return [
+            screener_type
+            for bit, screener_type in enumerate(TrendingStocksFetcher.SCREENER_TYPES)
+            if mask >> bit & 1
+        ]
+
+    @staticmethod
+    def _optional(value: Any) -> Any:
+        """NaN을 None으로 변환"""
+        return None if pd.isna(value) else value
+
+    @staticmethod
+    def _to_trending_stock(rank: int, row: Dict[str, Any], model=TrendingStock, **extra: Any) -> TrendingStock:
+        optional = TrendingStocksFetcher._optional
+        volume = optional(row['volume'])
+        return model(
+            rank=rank,
+            symbol=row['symbol'],
+            name=optional(row['name']),
+            price=optional(row['price']),
+            change_percent=optional(row['change_percent']),
+            change_amount=optional(row['change_amount']),
+            volume=int(volume) if volume is not None else None,
+            market_cap=optional(row['market_cap']),
+            composite_score=round(float(row['composite_score']), 2),
+            score_breakdown=ScoreBreakdown(
+                volume_score=round(float(row['volume_score']), 2),
+                change_score=round(float(row['change_score']), 2),
+                appearance_bonus=float(row['appearance_bonus'])
+            ),
+            sources=TrendingStocksFetcher._sources(int(row['source_mask'])),
+            sector=optional(row['sector']),
+            **extra
+        )
+
+    @staticmethod
+    def _market_summary(frame: pd.DataFrame, filtered_count: int) -> TrendingMarketSummary:
+        states = frame['market_state'].dropna()
+        state = states.iloc[0] if not states.empty else None
+
+        last_trading_date = None
+        market_time = frame['market_time'].max()
+        if pd.notna(market_time):
+            last_trading_date = (
+                pd.Timestamp(int(market_time), unit='s', tz='UTC')
+                .tz_convert('America/New_York')
+                .date()
+                .isoformat()
+            )
+
+        return TrendingMarketSummary(
+            total_collected=len(frame),
+            filtered_count=filtered_count,
+            collection_time=datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            market_status=TrendingStocksFetcher.MARKET_STATUS.get(state, state.lower()) if state else None,
+            last_trading_date=last_trading_date
+        )
+
+    @staticmethod
+    def get_trending_stocks(
+        screener_type: str = 'all',
+        limit: int = 10,
+        min_market_cap: float = DEFAULT_MIN_MARKET_CAP,
+        exclude_etf: bool = True,
+        sort_by: str = 'composite_score'
+    ) -> Optional[TrendingStocksResult]:
+        """
+        복합 점수 기준 화제 종목 목록 조회
+
+        Args:
+            screener_type: most_actives, day_gainers, day_losers 또는 all (세 스크리너 모두)
+            limit: 반환할 종목 수 (최대 50)
+            min_market_cap: 최소 시가총액 (USD)
+            exclude_etf: ETF/레버리지 종목 제외 여부
+            sort_by: 정렬 기준 (composite_score, volume, change_percent)
+
+        Returns:
+            TrendingStocksResult: 화제 종목 목록과 수집 요약 또는 None (수집 실패)
+        """
+        screener_types = (
+            TrendingStocksFetcher.SCREENER_TYPES if screener_type == 'all' else [screener_type]
+        )
+        ranked = TrendingStocksFetcher._rank(
+            screener_types,
+            limit=max(1, min(50, limit)),
+            min_market_cap=min_market_cap,
+            exclude_symbols=TrendingStocksFetcher.DEFAULT_EXCLUDE_SYMBOLS if exclude_etf else [],
+            exclude_etf=exclude_etf,
+            sort_by=sort_by,
+            max_per_sector=TrendingStocksFetcher.MAX_PER_SECTOR
+        )
+        if ranked is None:
+            return None
+
+        frame, filtered_count, selected, _, _ = ranked
+        stocks = [
+            TrendingStocksFetcher._to_trending_stock(rank, row)
+            for rank, row in enumerate(selected.to_dict('records'), start=1)
+        ]
+        return TrendingStocksResult(
+            trending_stocks=stocks,
+            market_summary=TrendingStocksFetcher._market_summary(frame, filtered_count)
+        )
+
+    @staticmethod
+    def _selection_reason(row: Dict[str, Any]) -> str:
+        labels = [
+            TrendingStocksFetcher.SCREENER_LABELS[source]
+            for source in TrendingStocksFetcher._sources(int(row['source_mask']))
+        ]
+        reason = " + ".join(labels)
+        if pd.notna(row['change_percent']):
+            reason += f" + 당일 변동률 {row['change_percent']:+.2f}%"
+        return f"{reason}로 복합 점수 최고"
+
+    @staticmethod
+    def get_top_stock(
+        min_market_cap: float = DEFAULT_MIN_MARKET_CAP,
+        exclude_symbols: Optional[List[str]] = None,
+        alternatives: int = 2
+    ) -> Optional[TopTrendingStockResult]:
+        """
+        TOP 1 화제 종목 조회 (브리핑 메인 종목용)
+
+        Args:
+            min_market_cap: 최소 시가총액 (USD)
+            exclude_symbols: 제외할 종목 (기본값: 주요 ETF/레버리지)
+            alternatives: 함께 반환할 차순위 후보 수
+
+        Returns:
+            TopTrendingStockResult: 최상위 종목과 차순위 후보 또는 None (수집 실패)
+        """
+        if exclude_symbols is None:
+            exclude_symbols = TrendingStocksFetcher.DEFAULT_EXCLUDE_SYMBOLS
+
+        ranked = TrendingStocksFetcher._rank(
+            TrendingStocksFetcher.SCREENER_TYPES,
+            limit=1 + alternatives,
+            min_market_cap=min_market_cap,
+            exclude_symbols=[symbol.upper() for symbol in exclude_symbols],
+            exclude_etf=True
+        )
+        if ranked is None:
+            return None
+
+        _, _, selected, _, _ = ranked
+        if selected.empty:
+            return None
+
+        rows = selected.to_dict('records')
+        top = rows[0]
+        volume_ratio = None
+        if pd.notna(top['volume']) and pd.notna(top['avg_volume']) and top['avg_volume'] > 0:
+            volume_ratio = round(float(top['volume'] / top['avg_volume']), 2)
+
+        top_stock = TrendingStocksFetcher._to_trending_stock(
+            1,
+            top,
+            model=TopTrendingStock,
+            avg_volume=int(top['avg_volume']) if pd.notna(top['avg_volume']) else None,
+            volume_ratio=volume_ratio,
+            industry=TrendingStocksFetcher._optional(top['industry']),
+            selection_reason=TrendingStocksFetcher._selection_reason(top)
+        )
+        return TopTrendingStockResult(
+            top_stock=top_stock,
+            alternatives=[
+                TrendingAlternative(
+                    rank=rank,
+                    symbol=row['symbol'],
+                    composite_score=round(float(row['composite_score']), 2)
+                )
+                for rank, row in enumerate(rows[1:], start=2)
+            ]
+        )
+
+    @staticmethod
+    def get_trending_quotes(limit: int = 6) -> List[StockQuote]:
+        """
+        복합 점수 상위 종목의 종합 정보 (프론트엔드 화제 종목 카드용)
+
+        스크리너 결과 행으로 종합 정보를 구성하므로 종목별 추가 조회가 없습니다.
+
+        Args:
+            limit: 반환할 종목 수
+
+        Returns:
+            List[StockQuote]: 점수 순 종합 정보 목록 (수집 실패 시 빈 목록)
+        """
+        ranked = TrendingStocksFetcher._rank(
+            TrendingStocksFetcher.SCREENER_TYPES,
+            limit=limit,
+            min_market_cap=TrendingStocksFetcher.DEFAULT_MIN_MARKET_CAP,
+            exclude_symbols=TrendingStocksFetcher.DEFAULT_EXCLUDE_SYMBOLS,
+            exclude_etf=True,
+            max_per_sector=TrendingStocksFetcher.MAX_PER_SECTOR
+        )
+        if ranked is None:
+            return []
+
+        _, _, selected, rows_by_source, profiles = ranked
+        raw_rows = {}
+        for rows in rows_by_source.values():
+            for row in rows:
+                raw_rows.setdefault(row['symbol'], row)
+
+        quotes = []
+        for symbol in selected['symbol']:
+            modules_data = StockService._screener_quote_to_modules(raw_rows[symbol], profiles.get(symbol))
+            info = StockService._build_stock_info(symbol, modules_data)
+            price = StockService._build_stock_price(symbol, modules_data)
+            if info and price:
+                quotes.append(StockQuote(info=info, price=price))
+        return quotes
@@ -0,0 +1,237 @@
+import asyncio
+import os
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from models.stock import (
+    RankedStockQuote,
+    StockQuote,
+    TrendingStocksResult,
+    TopTrendingStockResult
+)
+from services.executor import run_blocking, UpstreamTimeoutError
+from services.upstream import UpstreamUnavailableError
+from services.stock_service import StockService
+from services.trending_service import TrendingStocksFetcher
+
+
+class TrendingSnapshot:
+    """
+    미리 계산된 화제 종목 결과 (생성 후 변경하지 않음)
+
+    갱신 시에는 새 스냅샷을 만들어 참조만 교체하므로,
+    요청 처리 중에 읽는 스냅샷이 중간에 바뀌거나 일부만 갱신된 상태로 보이지 않습니다.
+    """
+
+    __slots__ = ('generated_at', 'top_stocks', 'trending_quotes', 'trending', 'top_trending')
+
+    def __init__(
+        self,
+        generated_at: float,
+        top_stocks: Dict[Tuple[str, int], Tuple[RankedStockQuote, ...]],
+        trending_quotes: Tuple[StockQuote, ...],
+        trending: Optional[TrendingStocksResult],
+        top_trending: Optional[TopTrendingStockResult]
+    ):
+        self.generated_at = generated_at
+        # (스크리너 타입, 개수)별 TOP N 목록
+        self.top_stocks: Mapping[Tuple[str, int], Tuple[RankedStockQuote, ...]] = MappingProxyType(top_stocks)
+        # /api/stocks/trending 응답
+        self.trending_quotes = trending_quotes
+        # /stocks/trending 기본 조건 결과 (최대 개수로 계산해 두고 limit만큼 잘라서 응답)
+        self.trending = trending
+        # /stocks/trending/top 기본 조건 결과
+        self.top_trending = top_trending
+
+    @property
+    def age(self) -> float:
+        """스냅샷 생성 후 경과 시간 (초)"""
+        return time.time() - self.generated_at
+
+
+class TrendingSnapshotRefresher:
+    """
+    화제 종목 스냅샷 백그라운드 갱신기
+
+    앱 시작 시(lifespan) 시작되어 interval 초마다 모든 스크리너 타입과 개수별 TOP N,
+    화제 종목 목록을 다시 계산한 뒤 스냅샷을 통째로 교체합니다.
+    요청은 현재 스냅샷을 그대로 읽으며, 스냅샷이 오래되었으면 일단 기존 값을 응답하고
+    갱신을 앞당깁니다 (stale-while-revalidate).
+    """
+
+    TOP_STOCK_TYPES = TrendingStocksFetcher.SCREENER_TYPES
+    TOP_STOCK_MAX_COUNT = 10
+    TRENDING_QUOTES_COUNT = 6
+    TRENDING_MAX_LIMIT = 50
+
+    def __init__(self, interval: float = 60.0, max_stale: float = 15 * 60.0, build_timeout: float = 60.0):
+        self.interval = interval
+        self.max_stale = max_stale
+        self.build_timeout = build_timeout
+        self._snapshot: Optional[TrendingSnapshot] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    @staticmethod
+    def build_snapshot() -> TrendingSnapshot:
+        """
+        스냅샷 생성 (블로킹, 실행기 스레드에서 호출)
+
+        스크리너와 섹터 정보는 서비스 캐시를 거치므로 목록별로 중복 조회하지 않습니다.
+        """
+        top_stocks: Dict[Tuple[str, int], Tuple[RankedStockQuote, ...]] = {}
+        for screener_type in TrendingSnapshotRefresher.TOP_STOCK_TYPES:
+            # TOP N은 스크리너 정렬 순서의 앞부분이므로 최대 개수로 한 번만 조회해 순위로 걸러서 사용
+            # (정보를 만들지 못한 종목은 빠지고 순위는 건너뛰므로 위치가 아닌 순위 기준)
+            results = StockService.get_top_stocks(
+                screener_type, TrendingSnapshotRefresher.TOP_STOCK_MAX_COUNT, True
+            )
+            ranked = tuple(RankedStockQuote(rank=item['rank'], quote=item['quote']) for item in results)
+            if not ranked:
+                continue
+            for count in range(1, TrendingSnapshotRefresher.TOP_STOCK_MAX_COUNT + 1):
+                top_stocks[(screener_type, count)] = tuple(r for r in ranked if r.rank <= count)
+
+        return TrendingSnapshot(
+            generated_at=time.time(),
+            top_stocks=top_stocks,
+            trending_quotes=tuple(
+                TrendingStocksFetcher.get_trending_quotes(TrendingSnapshotRefresher.TRENDING_QUOTES_COUNT)
+            ),
+            trending=TrendingStocksFetcher.get_trending_stocks(limit=TrendingSnapshotRefresher.TRENDING_MAX_LIMIT),
+            top_trending=TrendingStocksFetcher.get_top_stock()
+        )
+
+    def snapshot(self) -> Optional[TrendingSnapshot]:
+        """
+        현재 스냅샷 조회
+
+        갱신 주기가 지난 스냅샷이면 백그라운드 갱신을 앞당기고,
+        max_stale 초보다 오래된 스냅샷은 반환하지 않습니다 (호출자가 직접 계산).
+
+        Returns:
+            TrendingSnapshot: 사용할 수 있는 스냅샷 또는 None
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+
+        age = snapshot.age
+        if age > self.interval and self._wakeup is not None:
+            self._wakeup.set()
+        if age > self.max_stale:
+            return None
+        return snapshot
+
+    def last_snapshot(self) -> Optional[TrendingSnapshot]:
+        """경과 시간과 관계없이 마지막 스냅샷 (직접 계산도 실패했을 때의 최후 폴백)"""
+        return self._snapshot
+
+    async def refresh(self) -> Optional[TrendingSnapshot]:
+        """스냅샷을 한 번 생성하여 교체 (실패 시 기존 스냅샷 유지)"""
+        snapshot = await run_blocking(
+            TrendingSnapshotRefresher.build_snapshot,
+            timeout=self.build_timeout
+        )
+        # 비어 있는 결과(업스트림 장애)로 정상 스냅샷을 덮어쓰지 않음
+        if snapshot.top_stocks or snapshot.trending_quotes or self._snapshot is None:
+            self._snapshot = snapshot
+        return self._snapshot
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error refreshing trending snapshot: {str(e)}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """백그라운드 갱신 시작 (앱 시작 시 호출, 첫 스냅샷은 백그라운드에서 생성)"""
+        if not self.enabled or (self._task is not None and not self._task.done()):
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 종료 (앱 종료 시 호출)"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._wakeup = None
+
+
+async def read_through(
+    read: Callable[[TrendingSnapshot], Any],
+    compute: Callable[[], Any],
+    request: Any = None
+) -> Tuple[Any, Optional[TrendingSnapshot]]:
+    """
+    스냅샷에서 값을 읽고, 없으면 직접 계산
+
+    Args:
+        read: 스냅샷에서 응답 값을 꺼내는 함수 (값이 없으면 None 반환)
+        compute: 직접 계산하는 블로킹 함수
+        request: 연결 종료를 감지할 요청
+
+    Returns:
+        Tuple: (응답 값, 사용한 스냅샷 또는 직접 계산했으면 None)
+    """
+    snapshot = trending_refresher.snapshot()
+    if snapshot is not None:
+        value = read(snapshot)
+        if value:
+            return value, snapshot
+
+    timeout_error = None
+    try:
+        value = await run_blocking(compute, request=request)
+    except (UpstreamTimeoutError, UpstreamUnavailableError) as e:
+        value, timeout_error = None, e
+    if value:
+        return value, None
+
+    # 직접 계산도 실패하면 오래된 스냅샷이라도 응답
+    stale = trending_refresher.last_snapshot()
+    if stale is not None:
+        stale_value = read(stale)
+        if stale_value:
+            return stale_value, stale
+
+    if timeout_error is not None:
+        raise timeout_error
+    return value, None
+
+
+def snapshot_headers(snapshot: Optional[TrendingSnapshot]) -> Dict[str, str]:
+    """스냅샷 경과 시간 응답 헤더 (직접 계산한 응답은 0)"""
+    if snapshot is None:
+        return {"X-Snapshot-Age": "0"}
+    return {
+        "X-Snapshot-Age": str(int(snapshot.age)),
+        "X-Snapshot-Generated-At": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(snapshot.generated_at)),
+        "X-Snapshot-Stale": "true" if snapshot.age > trending_refresher.interval else "false"
+    }
+
+
+# 앱 전역 스냅샷 갱신기 (TRENDING_SNAPSHOT_INTERVAL=0 이면 비활성화되어 요청마다 직접 계산)
+trending_refresher = TrendingSnapshotRefresher(
+    interval=float(os.getenv("TRENDING_SNAPSHOT_INTERVAL", str(StockService.SCREENER_CACHE_TTL))),
+    max_stale=float(os.getenv("TRENDING_SNAPSHOT_MAX_STALE", str(15 * 60)))
+)
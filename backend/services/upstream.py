@@ -0,0 +1,400 @@
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+
+from services.metrics import metrics
+from services.yahoo_client import CrumbExpiredError
+
+
+class UpstreamUnavailableError(Exception):
+    """업스트림을 호출할 수 없음 (차단기 열림, 호출 한도 대기 초과, 재시도 소진)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class UpstreamRejectedError(Exception):
+    """업스트림 응답이 accept 검사를 통과하지 못함 (일시적 실패로 보고 재시도)"""
+
+
+# 재시도하고 차단기에 실패로 기록하는 일시적 에러
+# (그 밖의 에러는 잘못된 호출 인자처럼 다시 시도해도 같은 결과이므로 바로 전달)
+TRANSIENT_ERRORS = (requests.RequestException, CrumbExpiredError, UpstreamRejectedError)
+
+# 차단기 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class TokenBucket:
+    """
+    토큰 버킷 호출 한도 (스레드 안전)
+
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓입니다.
+    토큰이 없으면 먼저 예약한 순서대로 부족분이 채워질 때까지 기다립니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> Optional[float]:
+        """
+        토큰 한 개 획득
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            float: 대기한 시간 (초) 또는 None (timeout 안에 토큰을 얻을 수 없는 경우)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # 토큰을 먼저 예약하고 부족분이 채워질 시간만큼 대기 (음수 잔량 = 대기 중인 예약)
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if wait > timeout:
+                return None
+            self._tokens -= 1
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 차단기 (스레드 안전)
+
+    - closed: 정상 호출, 연속으로 실패한 호출(재시도 소진 기준)이 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 호출하지 않고 즉시 실패
+    - half_open: reset_timeout이 지나면 시험 호출 한 건만 허용하여 성공 시 closed, 실패 시 다시 open
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open에서는 시험 호출 한 건만 허용)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def retry_after(self) -> float:
+        """다시 호출할 수 있을 때까지 남은 시간 (초)"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def release(self) -> None:
+        """호출하지 않은 시험 호출 권한 반환"""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+class _OperationStats:
+    """작업(yahooquery 호출 종류)별 호출 통계"""
+
+    __slots__ = (
+        'calls', 'successes', 'failures', 'retries', 'rejected',
+        'rate_limited', 'throttled', 'throttle_wait', 'stale_served',
+        'latency_total', 'latency_max'
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values['throttle_wait'] = round(values['throttle_wait'], 3)
+        values['latency_max'] = round(values['latency_max'], 3)
+        values['latency_avg'] = round(values.pop('latency_total') / self.calls, 3) if self.calls else 0.0
+        return values
+
+
+class UpstreamGateway:
+    """
+    업스트림(yahooquery) 호출 관문
+
+    StockService의 모든 업스트림 호출은 이 관문을 거칩니다.
+    - 토큰 버킷으로 초당 호출 수를 제한 (요청이 몰려도 업스트림 호출량은 일정)
+    - 일시적 실패(TRANSIENT_ERRORS)만 지터를 준 지수 백오프로 제한된 횟수만큼 재시도하고 차단기에 기록
+    - 연속 실패 시 차단기를 열어 업스트림을 호출하지 않고 즉시 실패하거나,
+      마지막으로 성공한 결과(stale_key)가 있으면 그 결과를 반환
+    - 작업별 호출/재시도/차단/대기 통계 집계
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: float = 10.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 4.0,
+        acquire_timeout: float = 5.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        stale_entries: int = 4096,
+        stale_max_age: float = 24 * 60 * 60
+    ):
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.acquire_timeout = acquire_timeout
+        self.stale_entries = stale_entries
+        self.stale_max_age = stale_max_age
+        self._stale: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._stats: Dict[str, _OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, operation: str, **counts: float) -> None:
+        with self._lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                stats = self._stats[operation] = _OperationStats()
+            for name, value in counts.items():
+                if name == 'latency':
+                    stats.latency_total += value
+                    stats.latency_max = max(stats.latency_max, value)
+                else:
+                    setattr(stats, name, getattr(stats, name) + value)
+
+    def backoff(self, attempt: int) -> float:
+        """재시도 대기 시간 (전체 지터: 0 ~ base * 2^attempt, 최대 backoff_max)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def remember(self, key: str, value: Any) -> None:
+        """마지막으로 성공한 결과 보관 (차단기가 열렸을 때 대신 반환)"""
+        with self._lock:
+            self._stale[key] = (time.monotonic(), value)
+            self._stale.move_to_end(key)
+            while len(self._stale) > self.stale_entries:
+                self._stale.popitem(last=False)
+
+    def recall(self, key: str, operation: Optional[str] = None) -> Tuple[bool, Any]:
+        """
+        보관된 마지막 성공 결과 조회
+
+        Args:
+            key: 결과 키
+            operation: 통계에 기록할 작업 이름 (지정 시 stale_served 증가)
+
+        Returns:
+            Tuple[bool, Any]: (보관 여부, 값)
+        """
+        with self._lock:
+            entry = self._stale.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.stale_max_age:
+                return False, None
+        if operation is not None:
+            self.served_stale(operation)
+        return True, entry[1]
+
+    def served_stale(self, operation: str) -> None:
+        """보관된 결과(또는 로컬 저장소의 이전 데이터)로 응답한 횟수 기록"""
+        self._record(operation, stale_served=1)
+
+    def call(
+        self,
+        operation: str,
+        func: Callable[[], Any],
+        accept: Optional[Callable[[Any], bool]] = None,
+        stale_key: Optional[str] = None,
+        module: Optional[str] = None
+    ) -> Any:
+        """
+        업스트림 호출
+
+        Args:
+            operation: 작업 이름 (통계 구분용, 예: modules, history, screener)
+            func: 업스트림 호출 함수
+            accept: 결과 검사 함수 (False이면 일시적 실패로 보고 재시도)
+            stale_key: 마지막 성공 결과 보관 키 (호출할 수 없으면 보관된 결과 반환)
+            module: 호출 시간 지표의 모듈 레이블 (기본값: operation)
+
+        Returns:
+            Any: func 결과 (또는 보관된 마지막 성공 결과)
+
+        Raises:
+            UpstreamUnavailableError: 차단기가 열렸거나 호출 한도 대기가 길거나 재시도를 모두 실패했고,
+                                      보관된 결과도 없는 경우
+            Exception: TRANSIENT_ERRORS에 속하지 않는 func 에러 (재시도 없이 그대로 전달)
+        """
+        try:
+            return self._call(operation, func, accept, stale_key, module or operation)
+        except UpstreamUnavailableError:
+            if stale_key is not None:
+                found, value = self.recall(stale_key, operation)
+                if found:
+                    return value
+            raise
+
+    def _call(
+        self,
+        operation: str,
+        func: Callable[[], Any],
+        accept: Optional[Callable[[Any], bool]],
+        stale_key: Optional[str],
+        module: str
+    ) -> Any:
+        last_error: Optional[BaseException] = None
+        attempts = 0
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                self._record(operation, rejected=1)
+                retry_after = self.breaker.retry_after()
+                raise UpstreamUnavailableError(
+                    f"업스트림 호출이 일시 중단되었습니다. ({operation}, 연속 실패 {self.breaker.failures}회)",
+                    retry_after=retry_after or None
+                ) from last_error
+
+            waited = self.bucket.acquire(self.acquire_timeout)
+            if waited is None:
+                # 호출하지 않았으므로 차단기 시험 호출 권한 반환
+                self.breaker.release()
+                self._record(operation, rate_limited=1)
+                raise UpstreamUnavailableError(
+                    f"업스트림 호출 한도를 초과했습니다. ({operation})",
+                    retry_after=self.acquire_timeout
+                ) from last_error
+            if waited > 0:
+                self._record(operation, throttled=1, throttle_wait=waited)
+
+            attempts += 1
+            started = time.perf_counter()
+            try:
+                result = func()
+                if accept is not None and not accept(result):
+                    raise UpstreamRejectedError(str(result)[:200] or "업스트림 응답이 올바르지 않습니다.")
+            except TRANSIENT_ERRORS as e:
+                last_error = e
+                latency = time.perf_counter() - started
+                self._record(operation, calls=1, latency=latency)
+                metrics.observe('upstream_call_duration_seconds', (('module', module), ('outcome', 'error')), latency)
+                if self.breaker.state == HALF_OPEN:
+                    # 시험 호출이 실패하면 재시도하지 않고 바로 다시 차단
+                    break
+                if attempt < self.max_retries:
+                    self._record(operation, retries=1)
+                    time.sleep(self.backoff(attempt))
+                continue
+            except Exception:
+                # 업스트림 장애가 아니므로 재시도, 차단기 기록 없이 호출자에게 전달 (시험 호출 권한은 반환)
+                self.breaker.release()
+                latency = time.perf_counter() - started
+                self._record(operation, calls=1, latency=latency)
+                metrics.observe('upstream_call_duration_seconds', (('module', module), ('outcome', 'error')), latency)
+                raise
+
+            self.breaker.record_success()
+            latency = time.perf_counter() - started
+            self._record(operation, calls=1, successes=1, latency=latency)
+            metrics.observe('upstream_call_duration_seconds', (('module', module), ('outcome', 'success')), latency)
+            if stale_key is not None:
+                self.remember(stale_key, result)
+            return result
+
+        # 차단기에는 시도마다가 아니라 재시도를 모두 실패한 호출 단위로 실패 기록
+        self.breaker.record_failure()
+        self._record(operation, failures=1)
+        raise UpstreamUnavailableError(
+            f"업스트림 호출에 실패했습니다. ({operation}, {attempts}회 시도): {str(last_error)}"
+        ) from last_error
+
+    def reset(self) -> None:
+        """차단기, 호출 한도, 보관된 결과, 통계 초기화 (벤치마크 실행 간 상태 분리용)"""
+        with self._lock:
+            self._stale.clear()
+            self._stats.clear()
+        self.bucket = TokenBucket(self.bucket.rate, self.bucket.capacity)
+        self.breaker = CircuitBreaker(self.breaker.failure_threshold, self.breaker.reset_timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        호출 통계 조회
+
+        Returns:
+            Dict: 차단기 상태, 호출 한도 설정, 작업별 호출/재시도/차단/대기 통계
+        """
+        with self._lock:
+            operations = {operation: stats.to_dict() for operation, stats in self._stats.items()}
+            stale_size = len(self._stale)
+
+        return {
+            "circuit": {
+                "state": self.breaker.state,
+                "consecutive_failures": self.breaker.failures,
+                "opened": self.breaker.opened,
+                "retry_after": round(self.breaker.retry_after(), 1),
+            },
+            "rate_limit": {"rate": self.bucket.rate, "burst": self.bucket.capacity},
+            "stale_entries": stale_size,
+            "operations": operations,
+        }
+
+
+metrics.describe('upstream_call_duration_seconds', 'histogram', '업스트림 호출 시간 (초, 시도 단위, module: quoteSummary 모듈/history/screener)')
+
+
+# 앱 전역 업스트림 관문 (워커 프로세스마다 따로 호출 한도를 적용)
+upstream = UpstreamGateway(
+    rate=float(os.getenv("UPSTREAM_RATE", "5")),
+    burst=float(os.getenv("UPSTREAM_BURST", "10")),
+    max_retries=int(os.getenv("UPSTREAM_MAX_RETRIES", "3")),
+    backoff_base=float(os.getenv("UPSTREAM_BACKOFF_BASE", "0.5")),
+    backoff_max=float(os.getenv("UPSTREAM_BACKOFF_MAX", "4")),
+    acquire_timeout=float(os.getenv("UPSTREAM_ACQUIRE_TIMEOUT", "5")),
+    failure_threshold=int(os.getenv("UPSTREAM_FAILURE_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("UPSTREAM_RESET_TIMEOUT", "30"))
+)
@@ -0,0 +1,292 @@
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from docx import Document
+from docx.document import Document as DocumentObject
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.oxml.ns import qn
+from docx.shared import Pt, RGBColor
+
+from services import briefing_templates
+from services.briefing_service import BriefingService
+from services.stock_service import StockService
+
+
+REPORT_TITLE = '당신이 잠든 사이'
+FONT_NAME = 'Calibri'
+EAST_ASIA_FONT_NAME = '맑은 고딕'
+HEADING_COLOR = RGBColor(0, 51, 102)
+UP_COLOR = RGBColor(0, 176, 80)
+DOWN_COLOR = RGBColor(192, 0, 0)
+FOOTER_COLOR = RGBColor(128, 128, 128)
+
+# 스트리밍 응답 조각 크기
+CHUNK_SIZE = 64 * 1024
+
+
+def _set_east_asia_font(style, name: str) -> None:
+    """한글 글꼴 지정 (font.name은 라틴 글꼴만 바꾸므로 eastAsia 속성을 직접 설정)"""
+    style.element.get_or_add_rPr().get_or_add_rFonts().set(qn('w:eastAsia'), name)
+
+
+def _paragraph_style(document: DocumentObject, name: str, base: str, size: int, **font):
+    style = document.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = document.styles[base]
+    style.font.size = Pt(size)
+    for key, value in font.items():
+        setattr(style.font, key, value)
+    return style
+
+
+def _character_style(document: DocumentObject, name: str, color: RGBColor):
+    style = document.styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
+    style.font.bold = True
+    style.font.color.rgb = color
+    return style
+
+
+@lru_cache(maxsize=1)
+def base_template() -> bytes:
+    """
+    기본 보고서 템플릿 (.docx 바이트, 최초 사용 시 한 번만 생성)
+
+    글꼴과 제목/소제목/등락률/꼬리말 스타일을 한 번 정의해 두고,
+    보고서마다 서식을 다시 지정하지 않고 스타일 이름으로만 참조합니다.
+    """
+    document = Document()
+
+    normal = document.styles['Normal']
+    normal.font.name = FONT_NAME
+    normal.font.size = Pt(11)
+    _set_east_asia_font(normal, EAST_ASIA_FONT_NAME)
+
+    title = _paragraph_style(document, 'Report Title', 'Heading 1', 20, bold=True)
+    title.font.color.rgb = HEADING_COLOR
+    title.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+    heading = _paragraph_style(document, 'Report Heading', 'Heading 2', 16)
+    heading.font.color.rgb = HEADING_COLOR
+    subheading = _paragraph_style(document, 'Report Subheading', 'Heading 3', 12)
+    subheading.font.color.rgb = HEADING_COLOR
+    footer = _paragraph_style(document, 'Report Footer', 'Normal', 9, italic=True)
+    footer.font.color.rgb = FOOTER_COLOR
+    footer.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+    for style in (title, heading, subheading):
+        _set_east_asia_font(style, EAST_ASIA_FONT_NAME)
+
+    _character_style(document, 'Change Up', UP_COLOR)
+    _character_style(document, 'Change Down', DOWN_COLOR)
+
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def style_ids() -> Dict[str, str]:
+    """
+    보고서에서 사용하는 스타일 이름별 스타일 ID
+
+    python-docx는 스타일을 이름으로 지정할 때마다 문서의 전체 스타일 목록을 검색하므로,
+    ID를 한 번 찾아 두고 문단/런에 직접 지정합니다.
+    """
+    document = Document(BytesIO(base_template()))
+    return {
+        name: document.styles[name].style_id
+        for name in (
+            'Normal', 'List Bullet', 'Report Title', 'Report Heading',
+            'Report Subheading', 'Report Footer', 'Change Up', 'Change Down'
+        )
+    }
+
+
+class WordReportService:
+    """
+    Word 브리핑 보고서 생성 서비스
+
+    스타일이 정의된 기본 템플릿을 한 번 만들어 두고 보고서마다 복제하여 내용만 채웁니다.
+    종목 데이터는 한 번에 일괄 조회하여 브리핑 템플릿과 같은 값(briefing_values)으로 변환하므로,
+    같은 데이터로 종합 보고서와 구독자별 보고서를 여러 개 만들어도 업스트림 호출은 늘지 않습니다.
+    """
+
+    # 구독자별 보고서 동시 작성 수
+    MAX_WORKERS = 4
+
+    @staticmethod
+    def new_document() -> DocumentObject:
+        """기본 템플릿 복제 (스타일 정의 없이 저장된 템플릿을 메모리에서 다시 읽음)"""
+        return Document(BytesIO(base_template()))
+
+    @staticmethod
+    def _paragraph(document: DocumentObject, text: str = '', style: str = 'Normal'):
+        """스타일 ID를 직접 지정하여 문단 추가"""
+        paragraph = document.add_paragraph(text)
+        paragraph._p.style = style_ids()[style]
+        return paragraph
+
+    @staticmethod
+    def collect_sections(
+        items: Sequence[Tuple[str, str]],
+        now: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+        """
+        보고서 종목 데이터 일괄 조회
+
+        Args:
+            items: (티커, 브리핑 타입) 목록
+            now: 생성 시각 (기본값: 현재 시각)
+
+        Returns:
+            Tuple: (종목별 브리핑 값 목록(요청 순서), 티커별 실패 사유)
+        """
+        now = now or datetime.now()
+        items = [(ticker.upper(), briefing_type) for ticker, briefing_type in items]
+        tickers = list(dict.fromkeys(ticker for ticker, _ in items))
+
+        batch = BriefingService.prefetch(tickers)
+
+        sections = []
+        errors = {}
+        for ticker, briefing_type in items:
+            quote = batch.quotes.get(ticker)
+            if quote is None:
+                errors[ticker] = batch.errors.get(ticker, "종목 정보를 찾을 수 없습니다.")
+                continue
+            historical = StockService.get_historical_data(ticker, "5d")
+            sections.append(briefing_templates.briefing_values(ticker, briefing_type, quote, historical, now))
+        return sections, errors
+
+    @staticmethod
+    def _write_section(document: DocumentObject, values: Dict[str, str]) -> None:
+        """종목 한 개의 보고서 구간 작성"""
+        add = WordReportService._paragraph
+        add(
+            document,
+            f"{values['type_title']}: {values['name']} ({values['ticker']})",
+            'Report Heading'
+        )
+
+        price = add(document, f"주가: ${values['current_price']} ", 'List Bullet')
+        if values['change_direction'] == '보합':
+            price.add_run(f"{values['change_percent']}%")
+        else:
+            style = 'Change Up' if values['change_direction'] == '상승' else 'Change Down'
+            price.add_run(f"{values['change_percent']}%")._r.style = style_ids()[style]
+
+        for line in (
+            f"선정 기준: {values['type_title']}",
+            f"전일 종가: {values['previous_close']} | 당일 범위: {values['day_low']} ~ {values['day_high']}",
+            f"거래량: {values['volume']} | 시가총액: ${values['market_cap_b']}B",
+            f"섹터: {values['sector']} / {values['industry']}",
+        ):
+            add(document, line, 'List Bullet')
+
+        add(document, '주요 포인트', 'Report Subheading')
+        add(
+            document,
+            f"현재 주가는 ${values['current_price']}로, "
+            f"전일 대비 {values['change_percent']}% {values['change_direction']}했습니다.",
+            'List Bullet'
+        )
+        analysis = briefing_templates.TYPE_ANALYSIS.get(values['briefing_type'])
+        if analysis:
+            add(document, analysis, 'List Bullet')
+        if 'week_change' in values:
+            add(
+                document,
+                f"최근 5일: {values['week_change']}% ({values['week_direction']} 추세)",
+                'List Bullet'
+            )
+
+    @staticmethod
+    def build_report(
+        sections: Sequence[Dict[str, str]],
+        subscriber: Optional[str] = None,
+        now: Optional[datetime] = None
+    ) -> DocumentObject:
+        """
+        보고서 작성
+
+        Args:
+            sections: collect_sections로 조회한 종목별 브리핑 값
+            subscriber: 구독자 이름 (지정 시 인사말 추가)
+            now: 보고서 날짜 (기본값: 현재 시각)
+
+        Returns:
+            Document: 작성된 문서
+        """
+        now = now or datetime.now()
+        add = WordReportService._paragraph
+        document = WordReportService.new_document()
+        add(document, f"{REPORT_TITLE} | {now.strftime('%Y.%m.%d')}", 'Report Title')
+        if subscriber:
+            add(document, f"{subscriber}님을 위한 오늘의 브리핑입니다.")
+
+        for values in sections:
+            WordReportService._write_section(document, values)
+
+        add(document, '투자 유의사항', 'Report Heading')
+        for line in briefing_templates.CAUTION_INTRO:
+            add(document, line)
+        for item in briefing_templates.CAUTION_ITEMS:
+            add(document, item, 'List Bullet')
+        add(document, f"면책조항: {briefing_templates.DISCLAIMER}", 'Report Footer')
+        add(document, 'Stock Market Briefing Report', 'Report Footer')
+        return document
+
+    @staticmethod
+    def build_variants(
+        sections: Sequence[Dict[str, str]],
+        subscribers: Dict[str, Sequence[str]],
+        now: Optional[datetime] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, bytes]:
+        """
+        구독자별 보고서 일괄 작성 (한 번 조회한 종목 데이터를 공유)
+
+        Args:
+            sections: collect_sections로 조회한 종목별 브리핑 값
+            subscribers: 구독자 이름별 관심 티커 목록 (비어 있으면 전체 종목)
+            now: 보고서 날짜 (기본값: 현재 시각)
+            max_workers: 동시 작성 수 (기본값: MAX_WORKERS)
+
+        Returns:
+            Dict: 구독자 이름별 .docx 바이트
+        """
+        now = now or datetime.now()
+        by_ticker = {values['ticker']: values for values in sections}
+
+        def build(item: Tuple[str, Sequence[str]]) -> bytes:
+            subscriber, tickers = item
+            selected = [by_ticker[t.upper()] for t in tickers if t.upper() in by_ticker] if tickers else sections
+            buffer = BytesIO()
+            WordReportService.build_report(selected, subscriber, now).save(buffer)
+            return buffer.getvalue()
+
+        workers = max(1, min(max_workers or WordReportService.MAX_WORKERS, len(subscribers)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report") as pool:
+            return dict(zip(subscribers, pool.map(build, subscribers.items())))
+
+    @staticmethod
+    def iter_report(document: DocumentObject) -> Iterator[bytes]:
+        """
+        문서를 저장하여 조각 단위로 반환 (스트리밍 응답용)
+
+        Args:
+            document: build_report로 작성한 문서
+
+        Yields:
+            bytes: .docx 파일 조각
+        """
+        with tempfile.TemporaryFile() as f:
+            document.save(f)
+            f.seek(0)
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
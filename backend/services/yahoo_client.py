@@ -0,0 +1,180 @@
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import requests
+from requests.packages.urllib3.util.retry import Retry
+from yahooquery import Screener, Ticker
+from yahooquery.utils import HEADERS, TimeoutHTTPAdapter, get_crumb, setup_session
+
+
+class CrumbExpiredError(Exception):
+    """업스트림이 인증 토큰(crumb/쿠키)을 거부함 (토큰을 다시 받은 뒤 재시도)"""
+
+
+# 인증 토큰이 만료되었을 때의 업스트림 에러 설명
+CRUMB_ERRORS = ("Invalid Crumb", "Invalid Cookie", "Unauthorized")
+
+
+class YahooClient:
+    """
+    프로세스 공용 업스트림 HTTP 클라이언트
+
+    yahooquery의 Ticker/Screener는 생성할 때마다 새 세션을 만들고 쿠키와 crumb을 다시 받습니다.
+    (요청 2회 + TCP/TLS 연결 수립)
+    이 클라이언트는 keep-alive 연결 풀을 가진 세션 하나와 crumb을 공유하여,
+    호출마다 연결 수립과 인증 과정 없이 바로 데이터를 요청합니다.
+    - crumb은 crumb_ttl이 지나거나 업스트림이 거부할 때만 다시 받음
+    - 연결 풀 크기는 업스트림 실행기의 동시 실행 수에 맞춰 설정 (기본값: STOCK_SERVICE_MAX_WORKERS)
+    - 재시도는 업스트림 관문(UpstreamGateway)이 담당하므로, 세션은 끊어진 유휴 연결만 한 번 다시 연결
+    """
+
+    # crumb 조회에 실패했을 때 다시 시도하기까지의 시간 (초)
+    CRUMB_FAILURE_TTL = 60.0
+
+    def __init__(
+        self,
+        pool_size: int = 16,
+        timeout: float = 5.0,
+        crumb_ttl: float = 60 * 60,
+        setup_url: Optional[str] = None
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.crumb_ttl = crumb_ttl
+        self.setup_url = setup_url
+        self.sessions_created = 0
+        self.crumb_refreshes = 0
+        self._session: Optional[requests.Session] = None
+        self._crumb: Optional[str] = None
+        self._crumb_expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers = random.choice(HEADERS)
+        adapter = TimeoutHTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.pool_size,
+            max_retries=Retry(total=1, status=0, backoff_factor=0),
+            timeout=self.timeout
+        )
+        session.mount("https://", adapter)
+        self.sessions_created += 1
+        return session
+
+    def session(self) -> requests.Session:
+        """공용 세션 (최초 사용 시 생성)"""
+        with self._lock:
+            if self._session is None:
+                self._session = self._new_session()
+            return self._session
+
+    def crumb(self) -> Optional[str]:
+        """
+        공용 crumb (만료되었으면 쿠키와 함께 다시 받음)
+
+        동시에 만료를 확인한 요청은 한 번의 갱신 결과를 함께 사용합니다.
+        """
+        session = self.session()
+        with self._lock:
+            if time.monotonic() < self._crumb_expires_at:
+                return self._crumb
+
+            setup_session(session, self.setup_url)
+            self._crumb = get_crumb(session)
+            self.crumb_refreshes += 1
+            ttl = self.crumb_ttl if self._crumb else self.CRUMB_FAILURE_TTL
+            self._crumb_expires_at = time.monotonic() + ttl
+            return self._crumb
+
+    def invalidate_crumb(self) -> None:
+        """crumb 만료 처리 (다음 호출에서 다시 받음)"""
+        with self._lock:
+            self._crumb_expires_at = 0.0
+
+    def ticker(self, symbols: Union[str, List[str]]) -> "PooledTicker":
+        """공용 세션을 사용하는 Ticker"""
+        return PooledTicker(symbols, self)
+
+    def screener(self) -> "PooledScreener":
+        """공용 세션을 사용하는 Screener"""
+        return PooledScreener(self)
+
+    def close(self) -> None:
+        """연결 풀 종료 (앱 종료 시 호출, 이후 호출 시 새 세션 생성)"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            self._crumb_expires_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        클라이언트 상태 조회
+
+        Returns:
+            Dict: 연결 풀 크기, 생성한 세션 수, crumb 갱신 횟수, crumb 보유 여부
+        """
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "sessions_created": self.sessions_created,
+                "crumb_refreshes": self.crumb_refreshes,
+                "has_crumb": self._crumb is not None and time.monotonic() < self._crumb_expires_at,
+            }
+
+
+class _PooledMixin:
+    """
+    yahooquery 기본 생성자(세션 생성, 쿠키/crumb 조회)를 건너뛰고 공용 세션과 crumb을 사용
+
+    기본 생성자와 같은 속성을 네트워크 요청 없이 설정합니다.
+    """
+
+    def _use_client(self, client: YahooClient) -> None:
+        self._client = client
+        self.country = "united states"
+        self.formatted = False
+        self.progress = False
+        self.username = None
+        self.password = None
+        self._setup_url = client.setup_url
+        self.session = client.session()
+        self.crumb = client.crumb()
+
+    def _get_data(self, key, params={}, **kwargs):
+        data = super()._get_data(key, params, **kwargs)
+        # 만료된 crumb은 심볼별 에러 설명 또는 전체 에러 설명으로 반환됨
+        values = data.values() if isinstance(data, dict) else [data]
+        if any(isinstance(value, str) and value in CRUMB_ERRORS for value in values):
+            self._client.invalidate_crumb()
+            raise CrumbExpiredError(f"업스트림 인증이 만료되었습니다. ({key})")
+        return data
+
+
+class PooledTicker(_PooledMixin, Ticker):
+    """공용 세션을 사용하는 yahooquery Ticker"""
+
+    def __init__(self, symbols: Union[str, List[str]], client: YahooClient):
+        self._use_client(client)
+        self.symbols = symbols
+        self.invalid_symbols = None
+
+
+class PooledScreener(_PooledMixin, Screener):
+    """공용 세션을 사용하는 yahooquery Screener"""
+
+    def __init__(self, client: YahooClient):
+        self._use_client(client)
+
+
+# 앱 전역 업스트림 클라이언트
+yahoo_client = YahooClient(
+    pool_size=int(os.getenv("UPSTREAM_POOL_SIZE", os.getenv("STOCK_SERVICE_MAX_WORKERS", "16"))),
+    timeout=float(os.getenv("UPSTREAM_HTTP_TIMEOUT", "5")),
+    crumb_ttl=float(os.getenv("UPSTREAM_CRUMB_TTL", str(60 * 60))),
+    setup_url=os.getenv("YF_SETUP_URL")
+)
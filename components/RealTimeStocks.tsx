@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState } from 'react';
-import { getStockQuote, convertQuoteToStock, StockQuoteResponse } from '@/lib/api';
+import { getMultipleStockQuotes, convertQuoteToStock, subscribeQuotes } from '@/lib/api';
 import StockCard from './StockCard';
 import { AlertCircle, Activity } from 'lucide-react';
 
@@ -21,14 +21,12 @@ export default function RealTimeStocks({ symbols, title = 'Real-Time Quotes' }:
         setLoading(true);
         setError(null);
 
-        const promises = symbols.map((symbol) => getStockQuote(symbol));
-        const results = await Promise.allSettled(promises);
+        // 모든 심볼을 한 번의 일괄 조회 요청으로 가져옴
+        const quotes = await getMultipleStockQuotes(symbols);
 
-        const successfulStocks = results
-          .filter((result): result is PromiseFulfilledResult<StockQuoteResponse> =>
-            result.status === 'fulfilled'
-          )
-          .map((result, index) => convertQuoteToStock(result.value, index + 1));
+        const successfulStocks = quotes.map((quote, index) =>
+          convertQuoteToStock(quote, index + 1)
+        );
 
         setStocks(successfulStocks);
       } catch (err) {
@@ -44,6 +42,29 @@ export default function RealTimeStocks({ symbols, title = 'Real-Time Quotes' }:
     }
   }, [symbols]);
 
+  // 실시간 시세 반영 (서버의 공유 폴러가 변경된 필드만 전송)
+  useEffect(() => {
+    if (symbols.length === 0) return;
+
+    const unsubscribe = subscribeQuotes(symbols, (changes) => {
+      setStocks((prev) =>
+        prev.map((stock) => {
+          const change = changes[stock.symbol];
+          if (!change) return stock;
+          return {
+            ...stock,
+            price: change.current_price ?? stock.price,
+            change_percent: change.change_percent ?? stock.change_percent,
+            change_amount: change.change ?? stock.change_amount,
+            volume: change.volume ?? stock.volume,
+          };
+        })
+      );
+    });
+
+    return unsubscribe;
+  }, [symbols]);
+
   // Loading State
   if (loading) {
     return (
@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState } from 'react';
-import { getTrendingStocks, convertQuoteToStock } from '@/lib/api';
+import { getTrendingStocks, convertQuoteToStock, subscribeQuotes } from '@/lib/api';
 import StockCard from './StockCard';
 import { RefreshCw, TrendingUp, AlertCircle } from 'lucide-react';
 
@@ -32,6 +32,32 @@ export default function TrendingStocks() {
     fetchStocks();
   }, []);
 
+  // 목록의 종목이 바뀔 때만 다시 구독 (시세 반영으로 stocks가 바뀔 때는 유지)
+  const symbolKey = stocks.map((stock) => stock.symbol).join(',');
+
+  // 실시간 시세 반영 (서버의 공유 폴러가 변경된 필드만 전송)
+  useEffect(() => {
+    if (!symbolKey) return;
+
+    const unsubscribe = subscribeQuotes(symbolKey.split(','), (changes) => {
+      setStocks((prev) =>
+        prev.map((stock) => {
+          const change = changes[stock.symbol];
+          if (!change) return stock;
+          return {
+            ...stock,
+            price: change.current_price ?? stock.price,
+            change_percent: change.change_percent ?? stock.change_percent,
+            change_amount: change.change ?? stock.change_amount,
+            volume: change.volume ?? stock.volume,
+          };
+        })
+      );
+    });
+
+    return unsubscribe;
+  }, [symbolKey]);
+
   const handleRefresh = () => {
     setRefreshing(true);
     fetchStocks();
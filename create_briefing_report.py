@@ -1,129 +1,88 @@
 """
 Stock Market Briefing Report Generator
 Creates a professional Word document with formatted financial briefing content
+
+화제 종목(또는 지정한 종목)의 브리핑을 Word 보고서로 저장합니다.
+종목 데이터는 한 번만 조회하고, 구독자 파일을 주면 같은 데이터로 구독자별 보고서도 함께 만듭니다.
+문서 작성은 backend의 WordReportService(스타일이 정의된 기본 템플릿 복제)를 사용합니다.
+
+실행:
+    python create_briefing_report.py                              # 화제 종목 TOP 5 종합 보고서
+    python create_briefing_report.py NVDA TSLA AAPL --type day_gainers
+    python create_briefing_report.py --top-n 10 --subscribers subscribers.json
+
+구독자 파일 형식 (종목 목록이 비어 있으면 전체 종목):
+    {"홍길동": ["NVDA", "TSLA"], "김철수": []}
 """
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
 
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
 
-def create_briefing_report():
-    """Create a professional stock market briefing report in Word format"""
+from services.briefing_service import BriefingService  # noqa: E402
+from services.word_report import WordReportService  # noqa: E402
 
-    # Create a new Document
-    doc = Document()
-
-    # Set default font for the document
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = 'Calibri'
-    font.size = Pt(11)
-
-    # Title
-    title = doc.add_heading('당신이 잠든 사이 | 2025.12.05', level=1)
-    title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    title_run = title.runs[0]
-    title_run.font.size = Pt(20)
-    title_run.font.color.rgb = RGBColor(0, 51, 102)  # Dark blue
-    title_run.font.bold = True
-
-    # Add spacing
-    doc.add_paragraph()
-
-    # Section 1: Today's Hot Stock
-    heading1 = doc.add_heading('오늘의 화제 종목: TESLA (TSLA)', level=2)
-    heading1_run = heading1.runs[0]
-    heading1_run.font.size = Pt(16)
-    heading1_run.font.color.rgb = RGBColor(0, 51, 102)
-
-    # Stock details with bullet points
-    stock_info = [
-        ('주가: $385.20 ', '+8.7%', True),  # True indicates green color for percentage
-        ('선정 기준: 거래량 1위', '', False)
-    ]
-
-    for item, highlight, is_positive in stock_info:
-        p = doc.add_paragraph(style='List Bullet')
-        run1 = p.add_run(item)
-        run1.font.size = Pt(11)
-
-        if highlight:
-            run2 = p.add_run(highlight)
-            run2.font.size = Pt(11)
-            run2.font.bold = True
-            if is_positive:
-                run2.font.color.rgb = RGBColor(0, 176, 80)  # Green for positive percentage
-
-    # Add spacing
-    doc.add_paragraph()
-
-    # Section 2: Why is it trending?
-    heading2 = doc.add_heading('왜 화제인가?', level=2)
-    heading2_run = heading2.runs[0]
-    heading2_run.font.size = Pt(16)
-    heading2_run.font.color.rgb = RGBColor(0, 51, 102)
-
-    # Reasons with bullet points
-    reasons = [
-        '사이버트럭 판매량 급증',
-        'FSD v13 출시 예고'
-    ]
-
-    for reason in reasons:
-        p = doc.add_paragraph(reason, style='List Bullet')
-        p.runs[0].font.size = Pt(11)
-
-    # Add spacing
-    doc.add_paragraph()
-
-    # Section 3: Related News TOP 3
-    heading3 = doc.add_heading('관련 뉴스 TOP 3', level=2)
-    heading3_run = heading3.runs[0]
-    heading3_run.font.size = Pt(16)
-    heading3_run.font.color.rgb = RGBColor(0, 51, 102)
-
-    # News items with numbered list
-    news_items = [
-        '테슬라 사이버트럭 미국 판매 3위 - Reuters',
-        'FSD v13 무감독 자율주행 - Bloomberg',
-        '중국 시장 반등 - CNBC'
-    ]
-
-    for i, news in enumerate(news_items, 1):
-        p = doc.add_paragraph(style='List Number')
-        p.text = news
-        p.runs[0].font.size = Pt(11)
-
-    # Add footer space
-    doc.add_paragraph()
-
-    # Add a subtle footer
-    footer_para = doc.add_paragraph()
-    footer_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    footer_run = footer_para.add_run('Stock Market Briefing Report')
-    footer_run.font.size = Pt(9)
-    footer_run.font.italic = True
-    footer_run.font.color.rgb = RGBColor(128, 128, 128)  # Gray
-
-    # Save the document
-    output_path = r'C:\myproject\output\reports\briefing_2025-12-27.docx'
-    doc.save(output_path)
 
+def create_briefing_report(tickers=(), briefing_type="most_actives", top_n=5, subscribers=None, output_dir=None):
+    """Create a professional stock market briefing report in Word format"""
+    if tickers:
+        items = [(ticker, briefing_type) for ticker in tickers]
+    else:
+        items = BriefingService.select_daily_tickers(top_n)
+        if not items:
+            raise RuntimeError("화제 종목을 선정할 수 없습니다. 종목을 직접 지정해주세요.")
+
+    now = datetime.now()
+    started = time.perf_counter()
+    sections, errors = WordReportService.collect_sections(items, now)
+    for ticker, error in errors.items():
+        print(f"종목 제외: {ticker} ({error})")
+    if not sections:
+        raise RuntimeError("보고서에 포함할 종목 정보가 없습니다.")
+    collected = time.perf_counter()
+
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output", "reports")
+    os.makedirs(output_dir, exist_ok=True)
+
+    date = now.strftime('%Y-%m-%d')
+    output_path = os.path.join(output_dir, f"briefing_{date}.docx")
+    WordReportService.build_report(sections, now=now).save(output_path)
+    paths = [output_path]
+
+    if subscribers:
+        for index, (subscriber, content) in enumerate(
+            WordReportService.build_variants(sections, subscribers, now).items(), 1
+        ):
+            path = os.path.join(output_dir, f"briefing_{date}_{index:03d}.docx")
+            with open(path, "wb") as f:
+                f.write(content)
+            print(f"  {subscriber}: {path}")
+            paths.append(path)
+
+    finished = time.perf_counter()
     print(f"Document successfully created: {output_path}")
-    return output_path
+    print(f"종목 {len(sections)}개, 보고서 {len(paths)}개 "
+          f"(조회 {(collected - started) * 1000:.0f} ms, 작성 {(finished - collected) * 1000:.0f} ms)")
+    return paths
+
 
 if __name__ == "__main__":
-    try:
-        file_path = create_briefing_report()
-        print(f"\n✓ Professional briefing report created successfully!")
-        print(f"✓ Location: {file_path}")
-        print(f"✓ Format: Microsoft Word (.docx)")
-        print(f"✓ Formatting applied:")
-        print(f"  - Professional heading styles")
-        print(f"  - Green color for positive stock movement (+8.7%)")
-        print(f"  - Bullet points for key information")
-        print(f"  - Numbered list for news items")
-        print(f"  - Corporate color scheme (dark blue headings)")
-    except Exception as e:
-        print(f"Error creating document: {e}")
-        raise
+    parser = argparse.ArgumentParser(description="Word 브리핑 보고서 생성")
+    parser.add_argument("tickers", nargs="*", help="보고서에 포함할 종목 (생략 시 화제 종목 자동 선정)")
+    parser.add_argument("--type", default="most_actives", help="브리핑 타입 (종목 지정 시 사용)")
+    parser.add_argument("--top-n", type=int, default=5, help="자동 선정 종목 수")
+    parser.add_argument("--subscribers", default=None, help="구독자별 관심 종목 JSON 파일")
+    parser.add_argument("--out", default=None, help="출력 디렉토리 (기본값: output/reports)")
+    args = parser.parse_args()
+
+    subscribers = None
+    if args.subscribers:
+        with open(args.subscribers, "r", encoding="utf-8") as f:
+            subscribers = json.load(f)
+
+    create_briefing_report(args.tickers, args.type, args.top_n, subscribers, args.out)
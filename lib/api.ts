@@ -43,6 +43,18 @@ export interface HistoricalDataResponse {
   data: HistoricalDataPoint[];
 }
 
+// 열 단위 과거 데이터 (format=columnar)
+export interface HistoricalColumnsResponse {
+  symbol: string;
+  period: string;
+  date: string[];
+  open: (number | null)[];
+  high: (number | null)[];
+  low: (number | null)[];
+  close: (number | null)[];
+  volume: (number | null)[];
+}
+
 /**
  * 주식 기본 정보 조회
  */
@@ -76,6 +88,28 @@ export async function getStockQuote(symbol: string): Promise<StockQuoteResponse>
   return response.json();
 }
 
+/**
+ * 실시간 시세 구독 (SSE, /stream/quotes)
+ * 처음에는 전체 값(snapshot), 이후에는 변경된 필드만(update) 전달됩니다.
+ * @param symbols 구독할 종목 심볼 목록
+ * @param onChange 심볼별 변경된 가격 필드를 받는 콜백
+ * @returns 구독 해제 함수
+ */
+export function subscribeQuotes(
+  symbols: string[],
+  onChange: (changes: Record<string, Partial<StockPriceResponse>>) => void
+): () => void {
+  const source = new EventSource(
+    `${API_BASE_URL}/stream/quotes?symbols=${encodeURIComponent(symbols.join(','))}`
+  );
+  const handler = (event: MessageEvent) => onChange(JSON.parse(event.data));
+
+  source.addEventListener('snapshot', handler as EventListener);
+  source.addEventListener('update', handler as EventListener);
+
+  return () => source.close();
+}
+
 /**
  * 주식 과거 데이터 조회
  * @param symbol 주식 심볼
@@ -95,19 +129,76 @@ export async function getHistoricalData(
 }
 
 /**
- * 여러 주식의 종합 정보 조회 (병렬 처리)
+ * 주식 과거 데이터 조회 (열 단위, 장기간 차트용)
+ * @param symbol 주식 심볼
+ * @param period 조회 기간 (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+ */
+export async function getHistoricalColumns(
+  symbol: string,
+  period: string = '1mo'
+): Promise<HistoricalColumnsResponse> {
+  const response = await fetch(
+    `${API_BASE_URL}/stocks/history/${symbol}?period=${period}&format=columnar`
+  );
+  if (!response.ok) {
+    throw new Error(`Failed to fetch historical data for ${symbol}`);
+  }
+  return response.json();
+}
+
+/**
+ * 복수 종목 일괄 조회 응답
+ */
+export interface StockQuoteBatchResponse {
+  quotes: Record<string, StockQuoteResponse>;
+  errors: Record<string, string>;
+}
+
+// 일괄 조회 1회당 최대 종목 수 (백엔드 제한)
+const MAX_BATCH_SYMBOLS = 50;
+
+/**
+ * 복수 종목 종합 정보 일괄 조회 (POST /api/stocks/batch)
+ */
+export async function getStockQuotesBatch(
+  symbols: string[]
+): Promise<StockQuoteBatchResponse> {
+  const response = await fetch(`${API_BASE_URL}/api/stocks/batch`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ symbols }),
+  });
+  if (!response.ok) {
+    throw new Error(`Failed to fetch stock quotes for ${symbols.join(', ')}`);
+  }
+  return response.json();
+}
+
+/**
+ * 여러 주식의 종합 정보 조회 (일괄 조회, 요청 순서 유지)
  */
 export async function getMultipleStockQuotes(
   symbols: string[]
 ): Promise<StockQuoteResponse[]> {
-  const promises = symbols.map((symbol) => getStockQuote(symbol));
-  const results = await Promise.allSettled(promises);
-
-  return results
-    .filter((result): result is PromiseFulfilledResult<StockQuoteResponse> =>
-      result.status === 'fulfilled'
-    )
-    .map((result) => result.value);
+  const chunks: string[][] = [];
+  for (let i = 0; i < symbols.length; i += MAX_BATCH_SYMBOLS) {
+    chunks.push(symbols.slice(i, i + MAX_BATCH_SYMBOLS));
+  }
+
+  const results = await Promise.allSettled(chunks.map((chunk) => getStockQuotesBatch(chunk)));
+
+  const quotes: Record<string, StockQuoteResponse> = {};
+  results.forEach((result) => {
+    if (result.status === 'fulfilled') {
+      Object.assign(quotes, result.value.quotes);
+    }
+  });
+
+  return symbols
+    .map((symbol) => quotes[symbol.toUpperCase()])
+    .filter((quote): quote is StockQuoteResponse => quote !== undefined);
 }
 
 /**
@@ -2,12 +2,14 @@
 Verify the created Word document content
 """
 
+import os
+import sys
+
 from docx import Document
 
-def verify_document():
+def verify_document(doc_path):
     """Read and display the contents of the created Word document"""
 
-    doc_path = r'C:\myproject\output\reports\briefing_2025-12-27.docx'
     doc = Document(doc_path)
 
     print("Document Verification")
@@ -43,4 +45,8 @@ def verify_document():
     print("\nDocument created successfully with professional formatting!")
 
 if __name__ == "__main__":
-    verify_document()
+    if len(sys.argv) < 2:
+        print("사용법: python verify_document.py <보고서 경로>")
+        print(f"예: python verify_document.py {os.path.join('output', 'reports', 'briefing_2025-12-27.docx')}")
+        sys.exit(1)
+    verify_document(sys.argv[1])